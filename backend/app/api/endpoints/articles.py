@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import Any, Dict, Optional
+import logging
+
+from app.models.schemas import ArticleListResponse
+from app.services.article_store import get_article_store
+from app.core.config import settings
+from app.core.executors import run_blocking
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/articles",
+    tags=["articles"],
+    responses={404: {"description": "Not found"}},
+)
+
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+
+def _filters(
+    query: Optional[str],
+    keyword: Optional[str],
+    category: Optional[str],
+    source: Optional[str],
+    is_relevant: Optional[bool],
+    date_from: Optional[str],
+    date_to: Optional[str]
+) -> Dict[str, Any]:
+    return {
+        "query": query, "keyword": keyword, "category": category, "source": source,
+        "is_relevant": is_relevant, "date_from": date_from, "date_to": date_to
+    }
+
+
+@router.get("", response_model=ArticleListResponse)
+async def search_articles(
+    query: Optional[str] = Query(None, description="제목/본문 검색어 (공백으로 구분한 단어를 모두 포함)"),
+    keyword: Optional[str] = Query(None, description="검색 키워드"),
+    category: Optional[str] = Query(None, description="카테고리"),
+    source: Optional[str] = Query(None, description="언론사"),
+    is_relevant: Optional[bool] = Query(None, description="관련성 평가 결과"),
+    date_from: Optional[str] = Query(None, pattern=DATE_PATTERN, description="게시 날짜 시작 (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, pattern=DATE_PATTERN, description="게시 날짜 끝 (YYYY-MM-DD)"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0)
+):
+    """
+    저장된 기사 조회 (모든 크롤링/평가 결과에서 색인으로 조회)
+    """
+    filters = _filters(query, keyword, category, source, is_relevant, date_from, date_to)
+    result = await run_blocking(get_article_store().search, limit=limit, offset=offset, **filters)
+    return ArticleListResponse(**result)
+
+
+@router.get("/summary")
+async def get_article_summary(
+    query: Optional[str] = None,
+    keyword: Optional[str] = None,
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    is_relevant: Optional[bool] = None,
+    date_from: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    date_to: Optional[str] = Query(None, pattern=DATE_PATTERN)
+):
+    """
+    조건에 맞는 기사의 키워드/카테고리/날짜별 건수
+    """
+    filters = _filters(query, keyword, category, source, is_relevant, date_from, date_to)
+    return await run_blocking(get_article_store().summary, **filters)
+
+
+@router.post("/import")
+async def import_result_files():
+    """
+    결과 폴더의 기존 CSV 파일을 기사 저장소에 가져오기
+    """
+    return await run_blocking(get_article_store().import_directory, settings.RESULTS_PATH)
+
+
+@router.get("/{article_id}")
+async def get_article(article_id: int):
+    """
+    기사 한 건 조회
+    """
+    article = await run_blocking(get_article_store().get, article_id)
+    if article is None:
+        raise HTTPException(status_code=404, detail=f"Article '{article_id}' not found")
+    return article
@@ -1,15 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response, Query
 from typing import List, Dict, Any, Optional
 import logging
 import os
 
 from app.models.schemas import CrawlerRequest, CrawlerResponse, FileListResponse, DownloadLinkResponse
-from app.services.crawler_service import CrawlerService
-from app.utils.csv_utils import get_csv_files, get_csv_preview, get_csv_statistics
+from app.services.crawler_service import CrawlerService, get_crawler_service
+from app.services.file_catalog import SORT_COLUMNS, get_file_catalog
+from app.utils.columnar_utils import filter_result_rows, get_result_preview, get_result_statistics
+from app.utils.csv_utils import read_csv_page
+from app.utils.naver_news_helper import selector_memo
 from app.core.config import settings
+from app.core.executors import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +23,6 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# CrawlerService 인스턴스 생성 함수
-def get_crawler_service() -> CrawlerService:
-    return CrawlerService()
-
 @router.post("/crawl", response_model=CrawlerResponse)
 async def crawl_news(
     request: CrawlerRequest,
@@ -35,27 +35,32 @@ async def crawl_news(
     logger.info(f"Crawling news for keywords: {request.keywords}")
     
     try:
-        # 크롤링 실행
-        news_items, errors = crawler_service.crawl_keywords(
+        # 크롤링 실행 (이벤트 루프를 막지 않도록 I/O 스레드 풀에서 실행)
+        news_items, errors, stats = await run_blocking(
+            crawler_service.crawl_keywords_with_stats,
             request.keywords, 
-            request.max_news_per_keyword
+            request.max_news_per_keyword,
+            seen_mode=request.seen_mode,
+            incremental=request.incremental
         )
         
         if not news_items:
             return CrawlerResponse(
                 success=False,
                 message="No news items found for the given keywords",
-                errors=errors
+                errors=errors,
+                stats=stats
             )
         
         # 결과 저장
-        file_path, download_path = crawler_service.save_results(news_items)
+        file_path, download_path = await run_blocking(crawler_service.save_results, news_items)
         
         if not file_path:
             return CrawlerResponse(
                 success=False,
                 message="Failed to save crawler results",
-                errors={"save_error": "Could not save results to file"}
+                errors={"save_error": "Could not save results to file"},
+                stats=stats
             )
         
         # 상대 경로로 변환
@@ -73,7 +78,8 @@ async def crawl_news(
             item_count=len(news_items),
             keywords=request.keywords,
             download_path=download_path if download_path else None,
-            errors=errors if errors else None
+            errors=errors if errors else None,
+            stats=stats
         )
     
     except Exception as e:
@@ -84,13 +90,43 @@ async def crawl_news(
             errors={"crawling_error": str(e)}
         )
 
+@router.get("/stats")
+async def get_crawler_stats(crawler_service: CrawlerService = Depends(get_crawler_service)):
+    """
+    크롤러 통계 (HTTP 연결 재사용, 선택자 캐시 적중률 등)
+    """
+    return {
+        "http_session": crawler_service.session.stats(),
+        # 파싱 프로세스 풀을 쓰면 API 프로세스의 선택자 캐시는 사용되지 않음
+        "selector_memo": selector_memo.stats() if crawler_service.engine.parse_executor is None else None,
+        "parse_processes": settings.CRAWLER_PARSE_PROCESSES
+    }
+
 @router.get("/files", response_model=FileListResponse)
-async def get_files():
+async def get_files(
+    page: Optional[int] = Query(None, ge=1, description="페이지 번호 (지정하지 않으면 전체 목록)"),
+    page_size: int = Query(100, ge=1, le=1000),
+    sort: str = Query("modified_time", description=f"정렬 기준 ({', '.join(SORT_COLUMNS)})"),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    evaluated: Optional[bool] = Query(None, description="평가 결과 파일만(true)/제외(false)"),
+    keyword: Optional[str] = Query(None, description="이 키워드를 포함한 파일만"),
+    name: Optional[str] = Query(None, description="파일명에 포함된 문자열"),
+    refresh: bool = Query(False, description="폴더를 바로 다시 훑어 색인 갱신")
+):
     """
-    크롤링 결과 파일 목록 조회
+    크롤링 결과 파일 목록 조회 (파일 목록 색인에서 읽음, page를 지정하면 한 페이지만 읽음)
     """
-    files = get_csv_files(settings.RESULTS_PATH)
-    return FileListResponse(files=files)
+    if sort not in SORT_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"Unknown sort '{sort}'")
+    
+    catalog = get_file_catalog()
+    if refresh:
+        await run_blocking(catalog.refresh, settings.RESULTS_PATH, True)
+    result = await run_blocking(
+        catalog.list, settings.RESULTS_PATH, page or 1, page_size if page else None, sort, order == "desc",
+        evaluated, keyword, name
+    )
+    return FileListResponse(**result)
 
 @router.get("/files/{file_name}/preview")
 async def get_file_preview(file_name: str, max_rows: int = 5):
@@ -102,7 +138,7 @@ async def get_file_preview(file_name: str, max_rows: int = 5):
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail=f"File '{file_name}' not found")
     
-    preview = get_csv_preview(file_path, max_rows)
+    preview = await run_blocking(get_result_preview, file_path, max_rows)
     
     if "error" in preview:
         raise HTTPException(status_code=500, detail=preview["error"])
@@ -119,13 +155,68 @@ async def get_file_stats(file_name: str):
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail=f"File '{file_name}' not found")
     
-    stats = get_csv_statistics(file_path)
+    stats = await run_blocking(get_result_statistics, file_path)
     
     if "error" in stats:
         raise HTTPException(status_code=500, detail=stats["error"])
     
     return stats
 
+@router.get("/files/{file_name}/rows")
+async def get_file_rows(
+    file_name: str,
+    keyword: Optional[str] = None,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    is_relevant: Optional[bool] = None,
+    columns: Optional[str] = Query(None, description="반환할 열 (쉼표로 구분, 기본값: 전체)"),
+    limit: int = Query(50, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
+    """
+    조건에 맞는 행 조회 (Parquet 파일이 있으면 필요한 열만 읽음)
+    """
+    file_path = os.path.join(settings.RESULTS_PATH, file_name)
+    
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail=f"File '{file_name}' not found")
+    
+    filters = {
+        name: value for name, value in (
+            ("keyword", keyword), ("source", source), ("category", category), ("is_relevant", is_relevant)
+        ) if value is not None
+    }
+    column_list = [name.strip() for name in columns.split(",") if name.strip()] if columns else None
+    result = await run_blocking(filter_result_rows, file_path, filters, column_list, limit, offset)
+    
+    if "error" in result:
+        raise HTTPException(status_code=500, detail=result["error"])
+    
+    return result
+
+
+@router.get("/files/{file_name}/browse")
+async def browse_file(
+    file_name: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=1000)
+):
+    """
+    파일 내용 페이지 단위 조회 (행 위치 색인으로 요청한 행만 읽음)
+    """
+    file_path = os.path.join(settings.RESULTS_PATH, file_name)
+    
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail=f"File '{file_name}' not found")
+    
+    page = await run_blocking(read_csv_page, file_path, offset, limit)
+    
+    if "error" in page:
+        raise HTTPException(status_code=500, detail=page["error"])
+    
+    page["limit"] = limit
+    return page
+
 
 @router.get("/files/{file_name}/download-link", response_model=DownloadLinkResponse)
 async def get_file_download_link(file_name: str):
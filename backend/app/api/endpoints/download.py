@@ -8,6 +8,7 @@ import logging
 from typing import List
 
 from app.core.config import settings
+from app.core.executors import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,17 @@ router = APIRouter(
 )
 
 
+def _write_zip(folder_path: str, zip_path: str) -> None:
+    import zipfile
+    
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for root, _, files in os.walk(folder_path):
+            for file in files:
+                file_path = os.path.join(root, file)
+                arcname = os.path.relpath(file_path, os.path.dirname(folder_path))
+                zipf.write(file_path, arcname)
+
+
 @router.get("/{file_name}")
 async def download_file(file_name: str):
     """
@@ -41,7 +53,6 @@ async def download_folder_as_zip(folder_name: str):
     """
     폴더 전체를 압축하여 다운로드
     """
-    import zipfile
     import tempfile
     from datetime import datetime
     
@@ -57,12 +68,8 @@ async def download_folder_as_zip(folder_name: str):
     temp_zip_path = os.path.join(tempfile.gettempdir(), zip_filename)
     
     try:
-        with zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, _, files in os.walk(folder_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, os.path.dirname(folder_path))
-                    zipf.write(file_path, arcname)
+        # 압축은 I/O 스레드 풀에서 실행 (큰 폴더 압축 중에도 다른 요청 처리)
+        await run_blocking(_write_zip, folder_path, temp_zip_path)
         
         return FileResponse(
             path=temp_zip_path,
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, Optional
+import asyncio
+import json
+import logging
+import time
+
+from app.models.schemas import (
+    CrawlerRequest, RelevanceRequest, JobSubmitResponse, JobStatusResponse, JobListResponse
+)
+from app.services.job_service import (
+    JOB_TYPE_CRAWL, JOB_TYPE_EVALUATE, TERMINAL_STATUSES, get_job_manager
+)
+from app.core.config import settings
+from app.core.executors import run_blocking
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/jobs",
+    tags=["jobs"],
+    responses={404: {"description": "Not found"}},
+)
+
+# 이벤트가 없을 때 연결 유지용 주석을 보내는 간격 (초)
+KEEPALIVE_INTERVAL = 15.0
+
+
+def _submitted(job_id: str) -> JobSubmitResponse:
+    return JobSubmitResponse(job_id=job_id, status="queued", events_url=f"{router.prefix}/{job_id}/events")
+
+
+@router.post("/crawl", response_model=JobSubmitResponse)
+async def submit_crawl_job(request: CrawlerRequest):
+    """
+    크롤링 작업 등록 (진행 상황은 /api/jobs/{job_id}/events에서 페이지별로 전달)
+    """
+    logger.info(f"Submitting crawl job for keywords: {request.keywords}")
+    job_id = await run_blocking(get_job_manager().submit, JOB_TYPE_CRAWL, request.model_dump())
+    return _submitted(job_id)
+
+
+@router.post("/evaluate", response_model=JobSubmitResponse)
+async def submit_evaluate_job(request: RelevanceRequest):
+    """
+    관련성 평가 작업 등록 (진행 상황은 /api/jobs/{job_id}/events에서 기사별로 전달)
+    """
+    logger.info(f"Submitting evaluate job for file: {request.file_path}")
+    # 작업 파라미터에는 API 키를 넣지 않음. 서버 설정 키(OPENAI_API_KEY)를 쓰는 요청은 작업자가 설정 키를 쓰도록 표시만 하고,
+    # 다른 키는 JOB_STORE_API_KEYS가 켜져 있을 때만 작업이 끝날 때까지 작업 저장소(job_secrets)에 평문으로 저장
+    params = request.model_dump(exclude={"api_key"})
+    secrets = None
+    if not request.api_key:
+        # 키가 없는 요청이 서버 설정 키로 과금되지 않도록 명시적으로 허용한 경우에만 설정 키 사용
+        if not (settings.JOB_ALLOW_SERVER_API_KEY and settings.OPENAI_API_KEY):
+            raise HTTPException(status_code=400, detail="API key is required")
+        params["use_server_api_key"] = True
+    elif request.api_key == settings.OPENAI_API_KEY:
+        params["use_server_api_key"] = True
+    elif settings.JOB_STORE_API_KEYS:
+        secrets = {"api_key": request.api_key}
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="Job workers only use the server API key (OPENAI_API_KEY); storing request API keys is disabled"
+        )
+    job_id = await run_blocking(get_job_manager().submit, JOB_TYPE_EVALUATE, params, secrets=secrets)
+    return _submitted(job_id)
+
+
+def _job_response(job: Dict[str, Any]) -> JobStatusResponse:
+    return JobStatusResponse(job_id=job.pop("id"), **job)
+
+
+@router.get("", response_model=JobListResponse)
+async def list_jobs(status: Optional[str] = None, type: Optional[str] = None, limit: int = 50):
+    """
+    최근 작업 목록 조회 (상태, 종류로 필터링)
+    """
+    jobs = await run_blocking(get_job_manager().store.list, status=status, job_type=type, limit=min(max(limit, 1), 500))
+    return JobListResponse(jobs=[_job_response(job) for job in jobs])
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    """
+    작업 상태 및 결과 조회
+    """
+    job = await run_blocking(get_job_manager().store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return _job_response(job)
+
+
+@router.post("/{job_id}/cancel", response_model=JobStatusResponse)
+async def cancel_job(job_id: str):
+    """
+    작업 취소 (대기 중이면 바로 취소, 실행 중이면 다음 진행 단계에서 중단)
+    취소된 평가 작업은 체크포인트가 남아 같은 파일로 다시 실행하면 이어서 평가함
+    """
+    manager = get_job_manager()
+    if await run_blocking(manager.cancel, job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return _job_response(await run_blocking(manager.store.get, job_id))
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    request: Request,
+    after: int = 0,
+    last_event_id: Optional[str] = Header(None)
+):
+    """
+    작업 진행 이벤트 스트림 (Server-Sent Events)
+
+    이벤트 종류: status(상태 변경), page(크롤링 페이지 결과), verdicts(기사별 평가 결과), result(최종 결과)
+    작업은 다른 작업 프로세스에서 실행될 수 있으므로 저장소에 기록된 이벤트를 주기적으로 확인하여 전달
+    재연결 시 Last-Event-ID 헤더(또는 after 파라미터) 이후의 이벤트부터 전달하며, 작업이 끝나면 스트림 종료
+    """
+    store = get_job_manager().store
+    if await run_blocking(store.get, job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    last_seq = after
+    if last_event_id and last_event_id.isdigit():
+        last_seq = max(last_seq, int(last_event_id))
+
+    async def event_stream() -> AsyncIterator[str]:
+        nonlocal last_seq
+        last_sent = time.monotonic()
+        while True:
+            if await request.is_disconnected():
+                return
+            # 상태와 이벤트를 한 번의 저장소 호출로 확인 (상태를 먼저 읽어 종료 직전 이벤트를 놓치지 않음)
+            status, events = await run_blocking(store.poll_events, job_id, last_seq)
+            for event in events:
+                last_seq = event["seq"]
+                yield f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event['data'], ensure_ascii=False)}\n\n"
+                last_sent = time.monotonic()
+            if events:
+                continue
+            if status is None or status in TERMINAL_STATUSES:
+                return
+            if time.monotonic() - last_sent >= KEEPALIVE_INTERVAL:
+                yield ": keepalive\n\n"
+                last_sent = time.monotonic()
+            await asyncio.sleep(settings.JOB_EVENT_POLL_INTERVAL)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
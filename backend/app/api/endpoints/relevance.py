@@ -9,6 +9,7 @@ import os
 from app.models.schemas import RelevanceRequest, RelevanceResponse
 from app.services.relevance_service import RelevanceService
 from app.core.config import settings
+from app.core.executors import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,19 @@ router = APIRouter(
 )
 
 # RelevanceService 인스턴스 생성 함수
-def get_relevance_service(api_key: str, model: str) -> RelevanceService:
-    return RelevanceService(api_key=api_key, model=model)
+def get_relevance_service(
+    api_key: str,
+    model: str,
+    max_workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    use_cache: Optional[bool] = None,
+    use_rules: Optional[bool] = None,
+    use_triage: Optional[bool] = None
+) -> RelevanceService:
+    return RelevanceService(
+        api_key=api_key, model=model, max_workers=max_workers, batch_size=batch_size,
+        use_cache=use_cache, use_rules=use_rules, use_triage=use_triage
+    )
 
 @router.post("/evaluate", response_model=RelevanceResponse)
 async def evaluate_news(
@@ -47,10 +59,13 @@ async def evaluate_news(
     
     try:
         # 관련성 평가 서비스 생성
-        relevance_service = get_relevance_service(request.api_key, request.model)
+        relevance_service = get_relevance_service(
+            request.api_key, request.model, request.max_workers, request.batch_size,
+            request.use_cache, request.use_rules, request.use_triage
+        )
         
-        # 파일 처리 및 관련성 평가 실행
-        output_file, stats = relevance_service.process_file(file_path)
+        # 파일 처리 및 관련성 평가 실행 (이벤트 루프를 막지 않도록 I/O 스레드 풀에서 실행)
+        output_file, stats = await run_blocking(relevance_service.process_file, file_path)
         
         if not output_file:
             return RelevanceResponse(
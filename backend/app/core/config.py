@@ -23,6 +23,7 @@ class Settings(BaseSettings):
     # OpenAI API 설정
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY", "")
     DEFAULT_MODEL: str = os.getenv("DEFAULT_MODEL", "gpt-3.5-turbo")
+    OPENAI_API_BASE: str = "https://api.openai.com/v1"  # OpenAI 호환 API 주소 (테스트용 모의 서버 등)
     
     # 스크래핑 설정
     DEFAULT_KEYWORD_LIST: List[str] = [
@@ -34,6 +35,15 @@ class Settings(BaseSettings):
     # 검색 결과 저장 경로
     RESULTS_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "results")
     
+    # 결과 CSV와 함께 Parquet 파일 저장 (pyarrow 설치 시, 통계/미리보기/필터 조회는 필요한 열만 읽음)
+    RESULTS_COLUMNAR: bool = True
+    
+    # 크롤링/평가 결과를 기사 저장소(SQLite)에도 기록 (/api/articles로 파일을 열지 않고 조회)
+    ARTICLE_STORE: bool = True
+    
+    # 결과 파일 목록 색인이 폴더 변경(다른 경로로 추가/삭제된 파일)을 확인하는 최소 간격 (초)
+    FILE_CATALOG_REFRESH_INTERVAL: float = 5.0
+    
     # 사용자 다운로드 폴더 경로
     @property
     def USER_DOWNLOAD_PATH(self) -> str:
@@ -50,6 +60,124 @@ class Settings(BaseSettings):
     # 기타 설정
     MAX_NEWS_PER_KEYWORD: int = 100
     
+    # 관련성 평가 설정
+    RELEVANCE_MAX_WORKERS: int = 8  # 동시에 평가할 기사 수 (LLM API 동시 요청 수)
+    RELEVANCE_REQUEST_TIMEOUT: float = 60.0  # LLM API 요청 타임아웃 (초)
+    RELEVANCE_RPM_LIMIT: float = 500  # 분당 최대 요청 수 (프로세스별, 0이면 제한 없음)
+    RELEVANCE_TPM_LIMIT: float = 200000  # 분당 최대 토큰 수 (프롬프트 추정 + 최대 응답 토큰, 프로세스별, 0이면 제한 없음)
+    RELEVANCE_MAX_RETRIES: int = 4  # 429/5xx 및 네트워크 오류 시 최대 재시도 횟수
+    RELEVANCE_BACKOFF_BASE: float = 1.0  # 재시도 기본 대기 시간 (초, Retry-After 헤더가 있으면 그 값 사용)
+    RELEVANCE_BACKOFF_MAX: float = 60.0  # 재시도 최대 대기 시간 (초)
+    RELEVANCE_BATCH_SIZE: int = 10  # 한 요청에 담을 최대 기사 수 (1이면 기사별 요청)
+    RELEVANCE_BATCH_MAX_PROMPT_TOKENS: int = 6000  # 배치 프롬프트 최대 토큰 수 (넘으면 배치를 나눔)
+    RELEVANCE_BATCH_OUTPUT_TOKENS_PER_ARTICLE: int = 120  # 배치 응답에서 기사당 확보할 토큰 수
+    RELEVANCE_CHECKPOINT_ROWS: int = 100  # 이 건수만큼 평가할 때마다 체크포인트 저널에 기록 (중단 시 이어서 평가)
+    RELEVANCE_RULE_FILTER: bool = True  # 규칙(회사명/무관 키워드 사전)으로 확실한 기사는 LLM 없이 판정
+    RELEVANCE_RULES_PATH: Optional[str] = None  # 규칙 사전 JSON 파일 (self, industry, off_topic 키로 기본 사전 대체)
+    RELEVANCE_TRIAGE: bool = False  # 로컬 분류기(scikit-learn)로 확신도가 높은 기사는 LLM 없이 판정 (python triage.py train으로 학습)
+    TRIAGE_LOW: float = 0.1  # 관련성 확률이 이 값 이하이면 관련 없음으로 판정
+    TRIAGE_HIGH: float = 0.9  # 관련성 확률이 이 값 이상이면 관련 있음으로 판정
+    TRIAGE_CATEGORY_MIN_PROB: float = 0.8  # 카테고리 확률이 이 값 이상일 때만 로컬 판정
+    TRIAGE_MIN_TRAINING_ROWS: int = 200  # 학습에 필요한 최소 LLM 판정 행 수
+    RELEVANCE_CACHE: bool = True  # 평가 결과 캐시 사용 (같은 기사를 다시 평가하지 않음)
+    RELEVANCE_CACHE_TTL_DAYS: float = 30.0  # 캐시된 평가 결과 유효 기간 (일)
+    RELEVANCE_CACHE_MAX_ENTRIES: int = 100000  # 최대 캐시 항목 수 (넘으면 오래 사용하지 않은 항목부터 삭제)
+    
+    # 크롤링 동시성 설정
+    CRAWLER_MAX_CONCURRENCY: int = 8  # 전체 동시 요청 수
+    CRAWLER_PER_HOST_CONCURRENCY: int = 4  # 호스트별 동시 요청 수
+    CRAWLER_PAGE_WINDOW: int = 3  # 키워드당 한 번에 요청할 페이지 수
+    CRAWLER_MAX_PAGES: int = 20  # 키워드당 최대 페이지 수 (네이버 최대 페이지 제한)
+    
+    # 크롤러 HTTP 세션 (연결 풀) 설정
+    CRAWLER_HTTP_POOL_SIZE: int = 20  # 최대 동시 연결 수
+    CRAWLER_HTTP_KEEPALIVE_CONNECTIONS: int = 10  # 유지할 keep-alive 연결 수
+    CRAWLER_HTTP_KEEPALIVE_EXPIRY: float = 30.0  # keep-alive 유지 시간 (초)
+    CRAWLER_HTTP2: bool = True  # HTTP/2 사용 (h2 패키지 설치 시)
+    CRAWLER_CONNECT_TIMEOUT: float = 5.0  # 연결 타임아웃 (초)
+    CRAWLER_READ_TIMEOUT: float = 15.0  # 읽기 타임아웃 (초)
+    
+    # 크롤러 속도 제한 및 재시도 설정
+    CRAWLER_RATE_LIMIT_RPS: float = 5.0  # 호스트별 초당 요청 수 (0이면 제한 없음)
+    CRAWLER_RATE_LIMIT_BURST: int = 10  # 호스트별 순간 최대 요청 수
+    CRAWLER_RATE_LIMIT_MIN_RPS: float = 0.5  # 차단 응답 시 낮출 수 있는 최저 속도
+    CRAWLER_MAX_RETRIES: int = 3  # 403/429/5xx 응답 시 최대 재시도 횟수
+    CRAWLER_BACKOFF_BASE: float = 1.0  # 재시도 기본 대기 시간 (초)
+    CRAWLER_BACKOFF_MAX: float = 30.0  # 재시도 최대 대기 시간 (초)
+    
+    # 지난번에 일치한 선택자를 먼저 시도 (레이아웃 변경 시에만 전체 선택자 재탐색)
+    CRAWLER_ADAPTIVE_SELECTORS: bool = True
+    
+    # HTML 파서 설정
+    CRAWLER_HTML_PARSER: str = "auto"  # auto, lxml, html.parser, selectolax (auto: lxml 설치 시 lxml)
+    CRAWLER_PARSE_SCOPE: Optional[str] = "main_pack"  # 파싱할 영역의 요소 id (빈 값이면 전체 문서)
+    CRAWLER_PARSE_PROCESSES: int = 2  # HTML 파싱 프로세스 수 (0이면 크롤링 스레드에서 직접 파싱)
+    
+    # API 블로킹 작업 실행기
+    API_IO_THREADS: int = 16  # 파일/SQLite/동기 HTTP 작업을 실행할 스레드 수 (이벤트 루프를 막지 않도록 분리)
+    
+    # 디버깅용 원본 페이지 저장 (실패 페이지는 항상, 정상 페이지는 샘플링 비율만큼)
+    CRAWLER_DEBUG_DUMP: bool = False
+    CRAWLER_DEBUG_DUMP_SAMPLE_RATE: float = 0.0
+    CRAWLER_DEBUG_DUMP_MAX_FILES: int = 200
+    CRAWLER_DEBUG_DUMP_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "debug_pages")
+    
+    # 중복 기사 처리 설정
+    CRAWLER_DEDUP: bool = True  # 키워드 간 중복 기사 병합 (일치한 키워드는 matched_keywords로 보존)
+    CRAWLER_SEEN_MODE: str = "mark"  # 이전 실행에서 수집한 기사: mark(표시), skip(제외), off(사용 안 함)
+    NEAR_DUP_CLUSTERING: bool = True  # 제목/본문이 거의 같은 기사를 군집으로 묶어 관련성 평가를 군집당 1회만 실행
+    NEAR_DUP_THRESHOLD: float = 0.6  # 같은 군집으로 묶을 최소 유사도 (MinHash 추정 자카드 유사도)
+    
+    # 증분 크롤링 (키워드별로 지난번 저장한 최신 기사가 나타나면 페이지 요청 중단)
+    CRAWLER_INCREMENTAL: bool = False
+    CRAWLER_WATERMARK_SIZE: int = 50  # 키워드별로 기억할 최근 기사 수
+    
+    # 백그라운드 작업 큐 (크롤링, 관련성 평가)
+    JOB_LOCAL_WORKERS: int = 2  # API 프로세스 안에서 작업을 실행할 스레드 수 (worker.py 프로세스만 사용하려면 0)
+    JOB_WORKER_PROCESSES: int = 2  # worker.py가 실행할 작업 프로세스 수
+    JOB_WORKER_POLL_INTERVAL: float = 1.0  # 대기 중인 작업을 확인하는 간격 (초)
+    JOB_HEARTBEAT_INTERVAL: float = 10.0  # 실행 중인 작업의 하트비트 기록 간격 (초)
+    JOB_STALE_SECONDS: float = 120.0  # 하트비트가 이 시간 동안 없으면 작업자가 멈춘 것으로 보고 다시 대기열에 넣음
+    JOB_MAX_ATTEMPTS: int = 3  # 작업자가 멈춘 작업을 다시 실행할 최대 횟수
+    JOB_RETENTION_DAYS: float = 7.0  # 종료된 작업과 이벤트 보존 기간 (일)
+    JOB_EVENT_POLL_INTERVAL: float = 0.5  # 이벤트 스트림이 새 이벤트를 확인하는 간격 (초)
+    # 평가 작업 요청의 API 키가 OPENAI_API_KEY와 다를 때 작업 저장소(jobs.db)에 평문으로 임시 저장할지 여부
+    # (작업이 끝나면 삭제하지만 WAL 파일 등에 남을 수 있음, False이면 작업자는 OPENAI_API_KEY만 사용하고 다른 키는 거부)
+    JOB_STORE_API_KEYS: bool = False
+    # API 키 없이 등록된 평가 작업에 서버 설정 키(OPENAI_API_KEY)를 사용할지 여부 (False이면 키가 없는 요청은 거부)
+    JOB_ALLOW_SERVER_API_KEY: bool = False
+    
+    # 로컬 상태 저장 경로 (수집 기사 색인, 작업 큐 등, 같은 호스트의 프로세스끼리만 공유 가능)
+    STATE_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "state")
+    
+    @property
+    def SEEN_INDEX_PATH(self) -> str:
+        return os.path.join(self.STATE_PATH, "article_index.db")
+    
+    @property
+    def WATERMARK_DB_PATH(self) -> str:
+        return os.path.join(self.STATE_PATH, "watermarks.db")
+    
+    @property
+    def VERDICT_CACHE_PATH(self) -> str:
+        return os.path.join(self.STATE_PATH, "verdict_cache.db")
+    
+    @property
+    def ARTICLE_DB_PATH(self) -> str:
+        return os.path.join(self.STATE_PATH, "articles.db")
+    
+    @property
+    def FILE_CATALOG_PATH(self) -> str:
+        return os.path.join(self.STATE_PATH, "file_catalog.db")
+    
+    @property
+    def JOB_DB_PATH(self) -> str:
+        return os.path.join(self.STATE_PATH, "jobs.db")
+    
+    @property
+    def TRIAGE_MODEL_PATH(self) -> str:
+        return os.path.join(self.STATE_PATH, "triage_model.pkl")
+    
     model_config = SettingsConfigDict(case_sensitive=True)
 
 settings = Settings()
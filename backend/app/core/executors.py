@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+API 계층 실행기
+이벤트 루프를 막는 작업을 용도별 실행기로 보냄
+- 블로킹 I/O (파일 읽기/쓰기, SQLite, 동기 HTTP 요청): 크기가 제한된 스레드 풀
+- CPU 사용량이 큰 HTML 파싱: 프로세스 풀 (GIL 때문에 스레드로는 병렬 처리되지 않음)
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_io_executor: Optional[ThreadPoolExecutor] = None
+_parse_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """
+    블로킹 I/O용 스레드 풀 반환 (API_IO_THREADS 크기)
+    """
+    global _io_executor
+    with _executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(max_workers=max(1, settings.API_IO_THREADS), thread_name_prefix="api-io")
+        return _io_executor
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """
+    HTML 파싱용 프로세스 풀 반환 (CRAWLER_PARSE_PROCESSES가 0이면 None: 크롤링 스레드에서 직접 파싱)
+    """
+    global _parse_executor
+    if settings.CRAWLER_PARSE_PROCESSES <= 0:
+        return None
+    with _executor_lock:
+        if _parse_executor is None:
+            # 스레드가 있는 프로세스를 fork하지 않도록 spawn 방식 사용
+            _parse_executor = ProcessPoolExecutor(
+                max_workers=settings.CRAWLER_PARSE_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Started {settings.CRAWLER_PARSE_PROCESSES} HTML parsing processes")
+        return _parse_executor
+
+
+def replace_parse_executor(broken: Executor) -> Optional[Executor]:
+    """
+    파싱 프로세스가 비정상 종료되어 사용할 수 없게 된(BrokenProcessPool) 프로세스 풀을 새로 만듦
+    (여러 페이지가 동시에 실패해도 풀은 한 번만 다시 만듦)
+
+    Args:
+        broken: 사용할 수 없게 된 프로세스 풀
+
+    Returns:
+        새 프로세스 풀 (만들 수 없으면 None: 크롤링 스레드에서 직접 파싱)
+    """
+    global _parse_executor
+    with _executor_lock:
+        if _parse_executor is broken:
+            _parse_executor = None
+            logger.warning("HTML parsing process pool is broken, starting a new one")
+    broken.shutdown(wait=False, cancel_futures=True)
+    try:
+        return get_parse_executor()
+    except Exception as e:
+        logger.error(f"Could not start HTML parsing processes, parsing inline: {str(e)}")
+        return None
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    블로킹 함수를 I/O 스레드 풀에서 실행하고 결과를 기다림
+
+    Args:
+        func: 실행할 함수
+        *args, **kwargs: 함수 인자
+
+    Returns:
+        함수 반환값
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_executors() -> None:
+    """
+    실행기 종료 (서버 종료 시)
+    """
+    global _io_executor, _parse_executor
+    with _executor_lock:
+        if _io_executor is not None:
+            _io_executor.shutdown(wait=False, cancel_futures=True)
+            _io_executor = None
+        if _parse_executor is not None:
+            _parse_executor.shutdown(wait=False, cancel_futures=True)
+            _parse_executor = None
@@ -9,8 +9,12 @@ import sys
 import logging
 from typing import List
 
-from app.api.endpoints import crawler, relevance, download
+from app.api.endpoints import crawler, relevance, download, jobs, articles
 from app.core.config import settings
+from app.core.executors import shutdown_executors
+from app.services.http_session import close_http_session
+from app.services.job_service import get_job_manager, shutdown_job_manager
+from app.utils.columnar_utils import warn_if_columnar_unavailable
 
 # 로깅 설정
 logging.basicConfig(
@@ -43,10 +47,26 @@ app.add_middleware(
 app.include_router(crawler.router)
 app.include_router(relevance.router)
 app.include_router(download.router)
+app.include_router(jobs.router)
+app.include_router(articles.router)
 
 # 결과 파일 정적 호스팅
 app.mount("/results", StaticFiles(directory=results_dir), name="results")
 
+@app.on_event("startup")
+async def startup_event():
+    # RESULTS_COLUMNAR가 켜져 있지만 pyarrow가 없으면 한 번 경고
+    warn_if_columnar_unavailable(settings.RESULTS_COLUMNAR)
+    # 백그라운드 작업 스레드 시작 (JOB_LOCAL_WORKERS가 0이면 worker.py 프로세스가 작업 실행)
+    get_job_manager()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 백그라운드 작업 실행기, 크롤러 HTTP 세션 연결 및 API 실행기 정리
+    shutdown_job_manager()
+    close_http_session()
+    shutdown_executors()
+
 @app.get("/")
 async def root():
     return {"message": "네이버 뉴스 스크래퍼 API에 오신 것을 환영합니다!"}
@@ -16,6 +16,9 @@ class NewsItem(BaseModel):
     source: str
     url: str
     keyword: str
+    matched_keywords: Optional[List[str]] = None
+    seen_before: Optional[bool] = None
+    cluster_id: Optional[int] = None
     is_relevant: Optional[bool] = False
     relevance_reason: Optional[str] = ""
     category: Optional[str] = "기타"
@@ -28,6 +31,8 @@ class CrawlerRequest(BaseModel):
     """
     keywords: List[str] = Field(..., description="검색할 키워드 목록")
     max_news_per_keyword: Optional[int] = Field(50, description="키워드당 최대 뉴스 건수")
+    seen_mode: Optional[str] = Field(None, description="이전 실행에서 수집한 기사 처리 방식 (mark, skip, off / 기본값: 설정값)")
+    incremental: Optional[bool] = Field(None, description="지난번 수집한 최신 기사까지만 크롤링 (기본값: 설정값)")
 
 
 class CrawlerResponse(BaseModel):
@@ -41,6 +46,7 @@ class CrawlerResponse(BaseModel):
     item_count: Optional[int] = Field(None, description="총 뉴스 항목 수")
     keywords: Optional[List[str]] = Field(None, description="검색한 키워드 목록")
     errors: Optional[Dict[str, str]] = Field(None, description="오류 정보")
+    stats: Optional[Dict[str, Any]] = Field(None, description="크롤링 통계 (요청, 재시도, 속도 제한 등)")
 
 
 class RelevanceRequest(BaseModel):
@@ -50,6 +56,11 @@ class RelevanceRequest(BaseModel):
     file_path: str = Field(..., description="평가할 CSV 파일 경로")
     api_key: str = Field(..., description="OpenAI 또는 Claude API 키")
     model: Optional[str] = Field("gpt-3.5-turbo", description="사용할 LLM 모델")
+    max_workers: Optional[int] = Field(None, description="동시에 보낼 API 요청 수 (기본값: 설정값)")
+    batch_size: Optional[int] = Field(None, description="한 요청에 담을 최대 기사 수 (1이면 기사별 요청 / 기본값: 설정값)")
+    use_cache: Optional[bool] = Field(None, description="이전 평가 결과 재사용 여부 (기본값: 설정값)")
+    use_rules: Optional[bool] = Field(None, description="규칙 기반 1차 분류 사용 여부 (기본값: 설정값)")
+    use_triage: Optional[bool] = Field(None, description="로컬 분류기 선별 사용 여부 (기본값: 설정값)")
 
 
 class RelevanceResponse(BaseModel):
@@ -67,7 +78,10 @@ class FileListResponse(BaseModel):
     """
     파일 목록 응답 스키마
     """
-    files: List[Dict[str, Any]] = Field(..., description="파일 목록 (경로, 크기, 날짜 등)")
+    files: List[Dict[str, Any]] = Field(..., description="파일 목록 (경로, 크기, 날짜, 행 수, 키워드 등)")
+    total: Optional[int] = Field(None, description="조건에 맞는 전체 파일 수")
+    page: Optional[int] = Field(None, description="페이지 번호 (1부터)")
+    page_size: Optional[int] = Field(None, description="페이지당 파일 수")
 
 
 class EmailRequest(BaseModel):
@@ -87,3 +101,46 @@ class DownloadLinkResponse(BaseModel):
     success: bool = Field(..., description="성공 여부")
     download_link: str = Field(..., description="다운로드 링크")
     file_name: str = Field(..., description="파일명")
+
+
+class JobSubmitResponse(BaseModel):
+    """
+    백그라운드 작업 등록 응답 스키마
+    """
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태 (queued, running, succeeded, failed, cancelled)")
+    events_url: str = Field(..., description="진행 이벤트 스트림(SSE) 주소")
+
+
+class JobStatusResponse(BaseModel):
+    """
+    백그라운드 작업 상태 응답 스키마
+    """
+    job_id: str = Field(..., description="작업 ID")
+    type: str = Field(..., description="작업 종류 (crawl, evaluate)")
+    status: str = Field(..., description="작업 상태 (queued, running, succeeded, failed, cancelled)")
+    params: Dict[str, Any] = Field(..., description="작업 파라미터")
+    result: Optional[Dict[str, Any]] = Field(None, description="작업 결과 (크롤링/평가 응답과 같은 형식)")
+    error: Optional[str] = Field(None, description="오류 메시지")
+    created_at: float = Field(..., description="등록 시각 (UNIX 시간)")
+    started_at: Optional[float] = Field(None, description="시작 시각 (UNIX 시간)")
+    finished_at: Optional[float] = Field(None, description="종료 시각 (UNIX 시간)")
+    attempts: int = Field(0, description="실행 시도 횟수")
+    worker_id: Optional[str] = Field(None, description="작업을 실행한 작업자 ID")
+    heartbeat_at: Optional[float] = Field(None, description="마지막 하트비트 시각 (UNIX 시간)")
+    cancel_requested: bool = Field(False, description="취소 요청 여부")
+
+
+class JobListResponse(BaseModel):
+    """
+    백그라운드 작업 목록 응답 스키마
+    """
+    jobs: List[JobStatusResponse] = Field(..., description="작업 목록 (최근 등록 순)")
+
+
+class ArticleListResponse(BaseModel):
+    """
+    기사 저장소 조회 응답 스키마
+    """
+    total: int = Field(..., description="조건에 맞는 기사 수")
+    articles: List[Dict[str, Any]] = Field(..., description="기사 목록 (검색어가 있으면 관련도순, 없으면 최신순)")
@@ -0,0 +1,447 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+기사 저장소 (SQLite)
+크롤링/평가 결과를 실행별 CSV와 별도로 한 곳에 모아 URL, 키워드, 날짜, 카테고리, 관련성 색인과
+제목/본문 전문 검색(FTS5)으로 조회 (같은 기사는 정규화 URL 기준으로 한 행에 갱신)
+"""
+
+import datetime
+import glob
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.csv_utils import LIST_SEPARATOR, read_csv
+from app.utils.sqlite_utils import connect
+from app.utils.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# 조회 결과로 반환하는 열
+ARTICLE_COLUMNS = (
+    "id", "url", "title", "content", "source", "keyword", "matched_keywords", "date", "published_date",
+    "is_relevant", "relevance_reason", "category", "first_crawled_at", "last_crawled_at", "evaluated_at",
+    "last_file"
+)
+
+# 참으로 보는 is_relevant 값
+TRUE_VALUES = ("true", "1", "yes")
+
+# API/요청 오류로 얻은 평가 결과의 이유 접두어 (평가하지 않은 기사로 저장)
+ERROR_REASON_PREFIXES = ("API 오류", "요청 처리 중 오류")
+
+ABSOLUTE_DATE_PATTERN = re.compile(r'(\d{4})\.(\d{1,2})\.(\d{1,2})')
+RELATIVE_DATE_PATTERN = re.compile(r'(\d+)\s*(분|시간|일|주)\s*전')
+RELATIVE_UNITS = {
+    "분": datetime.timedelta(minutes=1),
+    "시간": datetime.timedelta(hours=1),
+    "일": datetime.timedelta(days=1),
+    "주": datetime.timedelta(weeks=1)
+}
+
+
+def published_date(text: str, reference: datetime.datetime) -> str:
+    """
+    검색 결과의 날짜 표기를 YYYY-MM-DD로 변환
+
+    Args:
+        text: 날짜 표기 ("2025.05.08.", "3시간 전", "어제" 등)
+        reference: 상대 날짜의 기준 시각 (수집 시각)
+
+    Returns:
+        게시 날짜 (알 수 없으면 수집 날짜)
+    """
+    text = str(text or "")
+    match = ABSOLUTE_DATE_PATTERN.search(text)
+    if match:
+        try:
+            return datetime.date(int(match.group(1)), int(match.group(2)), int(match.group(3))).isoformat()
+        except ValueError:
+            pass
+    match = RELATIVE_DATE_PATTERN.search(text)
+    if match:
+        return (reference - int(match.group(1)) * RELATIVE_UNITS[match.group(2)]).date().isoformat()
+    if "어제" in text:
+        return (reference - datetime.timedelta(days=1)).date().isoformat()
+    return reference.date().isoformat()
+
+
+def _relevance_flag(value: Any) -> Optional[int]:
+    # 평가하지 않은 기사(값 없음)는 NULL로 저장하여 기존 평가 결과를 덮어쓰지 않음
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return int(value)
+    return int(str(value).strip().lower() in TRUE_VALUES)
+
+
+def _verdict_flag(item: Dict[str, Any]) -> Optional[int]:
+    # 오류로 얻은 결과는 LLM 판정이 아니므로 기존 평가 결과를 덮어쓰지 않도록 평가하지 않은 것으로 처리
+    if str(item.get('relevance_reason') or '').startswith(ERROR_REASON_PREFIXES):
+        return None
+    return _relevance_flag(item.get('is_relevant'))
+
+
+def _keyword_list(item: Dict[str, Any]) -> List[str]:
+    matched = item.get('matched_keywords')
+    if isinstance(matched, str):
+        matched = [keyword for keyword in matched.split(LIST_SEPARATOR) if keyword]
+    keywords = list(matched or [])
+    if item.get('keyword') and item['keyword'] not in keywords:
+        keywords.insert(0, item['keyword'])
+    return keywords
+
+
+def _fts_query(text: str) -> str:
+    """
+    검색어를 FTS5 질의로 변환 (각 단어를 접두어 검색으로 AND 결합하여 조사가 붙은 단어도 찾음)
+    """
+    terms = [term.replace('"', '') for term in text.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+
+class ArticleStore:
+    """
+    기사 저장소 (SQLite, WAL 모드)
+    """
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY,
+                    url_key TEXT NOT NULL UNIQUE,
+                    url TEXT NOT NULL,
+                    title TEXT,
+                    content TEXT,
+                    source TEXT,
+                    keyword TEXT,
+                    matched_keywords TEXT,
+                    date TEXT,
+                    published_date TEXT,
+                    is_relevant INTEGER,
+                    relevance_reason TEXT,
+                    category TEXT,
+                    first_crawled_at TEXT NOT NULL,
+                    last_crawled_at TEXT NOT NULL,
+                    evaluated_at TEXT,
+                    last_file TEXT
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS article_keywords (
+                    keyword TEXT NOT NULL,
+                    article_id INTEGER NOT NULL,
+                    PRIMARY KEY (keyword, article_id)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_date)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category, published_date)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_articles_relevant ON articles(is_relevant, published_date)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_article_keywords_article ON article_keywords(article_id)")
+        self.fts_enabled = self._create_fts()
+
+    def _create_fts(self) -> bool:
+        """
+        제목/본문 전문 검색 색인 생성 (FTS5가 없는 SQLite에서는 LIKE 검색으로 대체)
+        """
+        try:
+            with self._conn:
+                self._conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                        title, content, content='articles', content_rowid='id', tokenize='unicode61'
+                    )
+                """)
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+                        INSERT INTO articles_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+                    END
+                """)
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+                        INSERT INTO articles_fts (articles_fts, rowid, title, content)
+                        VALUES ('delete', old.id, old.title, old.content);
+                    END
+                """)
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, content ON articles
+                    WHEN old.title IS NOT new.title OR old.content IS NOT new.content BEGIN
+                        INSERT INTO articles_fts (articles_fts, rowid, title, content)
+                        VALUES ('delete', old.id, old.title, old.content);
+                        INSERT INTO articles_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+                    END
+                """)
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 is not available, falling back to LIKE search: {str(e)}")
+            return False
+
+    def upsert(self, news_items: List[Dict[str, Any]], file_path: Optional[str] = None,
+               crawled_at: Optional[datetime.datetime] = None) -> int:
+        """
+        기사 저장 (같은 URL이 있으면 최신 내용으로 갱신, 평가 결과가 없거나 오류로 얻은 행은 기존 평가 결과 유지)
+
+        Args:
+            news_items: 뉴스 아이템 목록 (크롤링 결과 또는 평가 결과)
+            file_path: 기사가 저장된 결과 파일 경로
+            crawled_at: 수집 시각 (상대 날짜 변환 기준 / 기본값: 현재 시각)
+
+        Returns:
+            저장한 기사 수
+        """
+        reference = crawled_at or datetime.datetime.now()
+        now = reference.strftime("%Y-%m-%d %H:%M:%S")
+        file_name = os.path.basename(file_path) if file_path else None
+        rows: List[Tuple[Tuple[Any, ...], List[str]]] = []
+        for item in news_items:
+            url_key = canonicalize_url(item.get('url', ''))
+            if not url_key:
+                continue
+            keywords = _keyword_list(item)
+            is_relevant = _verdict_flag(item)
+            rows.append(((
+                url_key, item.get('url', ''), item.get('title', ''), item.get('content', ''), item.get('source', ''),
+                item.get('keyword', ''), LIST_SEPARATOR.join(keywords), item.get('date', ''),
+                published_date(item.get('date', ''), reference),
+                is_relevant, item.get('relevance_reason') if is_relevant is not None else None,
+                item.get('category') if is_relevant is not None else None,
+                now, now, now if is_relevant is not None else None, file_name
+            ), keywords))
+
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            for values, keywords in rows:
+                article_id = self._conn.execute("""
+                    INSERT INTO articles (
+                        url_key, url, title, content, source, keyword, matched_keywords, date, published_date,
+                        is_relevant, relevance_reason, category, first_crawled_at, last_crawled_at, evaluated_at,
+                        last_file
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url_key) DO UPDATE SET
+                        url = excluded.url,
+                        title = excluded.title,
+                        content = CASE WHEN excluded.content != '' THEN excluded.content ELSE articles.content END,
+                        source = excluded.source,
+                        date = excluded.date,
+                        published_date = COALESCE(articles.published_date, excluded.published_date),
+                        is_relevant = COALESCE(excluded.is_relevant, articles.is_relevant),
+                        relevance_reason = COALESCE(excluded.relevance_reason, articles.relevance_reason),
+                        category = COALESCE(excluded.category, articles.category),
+                        evaluated_at = COALESCE(excluded.evaluated_at, articles.evaluated_at),
+                        last_crawled_at = CASE WHEN excluded.evaluated_at IS NULL
+                            THEN excluded.last_crawled_at ELSE articles.last_crawled_at END,
+                        last_file = excluded.last_file
+                    RETURNING id
+                """, values).fetchone()[0]
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO article_keywords (keyword, article_id) VALUES (?, ?)",
+                    [(keyword, article_id) for keyword in keywords]
+                )
+        return len(rows)
+
+    def import_file(self, file_path: str) -> int:
+        """
+        결과 CSV 파일의 기사 저장 (파일 수정 시각을 수집 시각으로 사용)
+
+        Returns:
+            저장한 기사 수
+        """
+        crawled_at = datetime.datetime.fromtimestamp(os.path.getmtime(file_path))
+        return self.upsert(read_csv(file_path), file_path, crawled_at)
+
+    def import_directory(self, directory: str) -> Dict[str, int]:
+        """
+        디렉토리의 결과 CSV 파일을 모두 저장 (평가 결과가 크롤링 결과보다 나중에 반영되도록 정렬)
+
+        Returns:
+            {"files": 저장한 파일 수, "articles": 저장한 기사 행 수}
+        """
+        files = sorted(
+            glob.glob(os.path.join(directory, "*.csv")),
+            key=lambda path: ("_evaluated" in os.path.basename(path), os.path.getmtime(path))
+        )
+        articles = 0
+        for file_path in files:
+            try:
+                articles += self.import_file(file_path)
+            except Exception as e:
+                logger.error(f"Error importing '{file_path}' into article store: {str(e)}")
+        logger.info(f"Imported {articles} articles from {len(files)} files in {directory}")
+        return {"files": len(files), "articles": articles}
+
+    def _where(self, filters: Dict[str, Any]) -> Tuple[str, str, List[Any]]:
+        """
+        조회 조건을 SQL로 변환
+
+        Returns:
+            (JOIN 절, WHERE 절, 파라미터)
+        """
+        join = ""
+        clauses: List[str] = []
+        params: List[Any] = []
+        query = (filters.get("query") or "").strip()
+        if query:
+            if self.fts_enabled and _fts_query(query):
+                join = "JOIN articles_fts ON articles_fts.rowid = a.id"
+                clauses.append("articles_fts MATCH ?")
+                params.append(_fts_query(query))
+            else:
+                for term in query.split():
+                    clauses.append("(a.title LIKE ? OR a.content LIKE ?)")
+                    params.extend([f"%{term}%", f"%{term}%"])
+        if filters.get("keyword"):
+            clauses.append("a.id IN (SELECT article_id FROM article_keywords WHERE keyword = ?)")
+            params.append(filters["keyword"])
+        if filters.get("category"):
+            clauses.append("a.category = ?")
+            params.append(filters["category"])
+        if filters.get("source"):
+            clauses.append("a.source = ?")
+            params.append(filters["source"])
+        if filters.get("is_relevant") is not None:
+            clauses.append("a.is_relevant = ?")
+            params.append(int(bool(filters["is_relevant"])))
+        if filters.get("date_from"):
+            clauses.append("a.published_date >= ?")
+            params.append(filters["date_from"])
+        if filters.get("date_to"):
+            clauses.append("a.published_date <= ?")
+            params.append(filters["date_to"])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return join, where, params
+
+    def search(self, limit: int = 50, offset: int = 0, **filters: Any) -> Dict[str, Any]:
+        """
+        기사 조회 (검색어가 있으면 관련도순, 없으면 최신순)
+
+        Args:
+            limit: 최대 기사 수
+            offset: 건너뛸 기사 수
+            **filters: query(제목/본문 검색어), keyword, category, source, is_relevant,
+                date_from, date_to(YYYY-MM-DD)
+
+        Returns:
+            {"total": 조건에 맞는 기사 수, "articles": 기사 목록}
+        """
+        join, where, params = self._where(filters)
+        columns = ", ".join(f"a.{column}" for column in ARTICLE_COLUMNS)
+        if join:
+            columns += ", snippet(articles_fts, 1, '<b>', '</b>', '…', 24) AS snippet"
+            order = "ORDER BY bm25(articles_fts), a.published_date DESC"
+        else:
+            order = "ORDER BY a.published_date DESC, a.id DESC"
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM articles a {join} {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM articles a {join} {where} {order} LIMIT ? OFFSET ?",
+                params + [max(0, limit), max(0, offset)]
+            ).fetchall()
+        return {"total": total, "articles": [self._article(row) for row in rows]}
+
+    def summary(self, **filters: Any) -> Dict[str, Any]:
+        """
+        조건에 맞는 기사의 키워드/카테고리/관련성별 건수
+
+        Args:
+            **filters: search와 같은 조회 조건
+
+        Returns:
+            {"total", "relevant_count", "evaluated_count", "keyword_counts", "category_counts", "date_counts"}
+        """
+        join, where, params = self._where(filters)
+        base = f"SELECT a.id, a.is_relevant, a.category, a.published_date FROM articles a {join} {where}"
+        with self._lock:
+            totals = self._conn.execute(f"""
+                SELECT COUNT(*) AS total, SUM(is_relevant = 1) AS relevant, SUM(is_relevant IS NOT NULL) AS evaluated
+                FROM ({base})
+            """, params).fetchone()
+            categories = self._conn.execute(f"""
+                SELECT category, COUNT(*) AS count FROM ({base})
+                WHERE category IS NOT NULL AND category != '' GROUP BY category ORDER BY count DESC
+            """, params).fetchall()
+            keywords = self._conn.execute(f"""
+                SELECT k.keyword, COUNT(*) AS count FROM ({base}) f
+                JOIN article_keywords k ON k.article_id = f.id GROUP BY k.keyword ORDER BY count DESC
+            """, params).fetchall()
+            dates = self._conn.execute(f"""
+                SELECT published_date, COUNT(*) AS count FROM ({base})
+                GROUP BY published_date ORDER BY published_date DESC
+            """, params).fetchall()
+        return {
+            "total": totals["total"],
+            "relevant_count": totals["relevant"] or 0,
+            "evaluated_count": totals["evaluated"] or 0,
+            "keyword_counts": {row["keyword"]: row["count"] for row in keywords},
+            "category_counts": {row["category"]: row["count"] for row in categories},
+            "date_counts": {row["published_date"]: row["count"] for row in dates}
+        }
+
+    def get(self, article_id: int) -> Optional[Dict[str, Any]]:
+        """
+        기사 한 건 조회
+        """
+        columns = ", ".join(ARTICLE_COLUMNS)
+        with self._lock:
+            row = self._conn.execute(f"SELECT {columns} FROM articles WHERE id = ?", (article_id,)).fetchone()
+        return self._article(row) if row is not None else None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    @staticmethod
+    def _article(row: sqlite3.Row) -> Dict[str, Any]:
+        article = dict(row)
+        if article.get("is_relevant") is not None:
+            article["is_relevant"] = bool(article["is_relevant"])
+        article["matched_keywords"] = [
+            keyword for keyword in (article.get("matched_keywords") or "").split(LIST_SEPARATOR) if keyword
+        ]
+        return article
+
+
+def store_articles(news_items: List[Dict[str, Any]], file_path: Optional[str] = None) -> None:
+    """
+    결과 파일 저장 후 기사 저장소에도 기록 (ARTICLE_STORE 설정이 꺼져 있으면 건너뜀)
+
+    저장소 기록에 실패해도 결과 파일 저장은 성공으로 처리함
+    """
+    if not settings.ARTICLE_STORE:
+        return
+    try:
+        stored = get_article_store().upsert(news_items, file_path)
+        logger.info(f"Stored {stored} articles in article store")
+    except Exception as e:
+        logger.error(f"Error storing articles in article store: {str(e)}")
+
+
+_article_store: Optional[ArticleStore] = None
+_article_store_lock = threading.Lock()
+
+
+def get_article_store() -> ArticleStore:
+    """
+    프로세스 전역 기사 저장소 반환
+    """
+    global _article_store
+    with _article_store_lock:
+        if _article_store is None:
+            _article_store = ArticleStore(settings.ARTICLE_DB_PATH)
+        return _article_store
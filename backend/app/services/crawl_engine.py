@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+asyncio 기반 네이버 뉴스 크롤링 엔진
+여러 키워드와 페이지를 동시에 요청하되, 전체 동시 요청 수와 호스트별 동시 요청 수를 제한
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from app.services.http_session import CrawlerHttpSession
+from app.utils.debug_utils import PageDumper, log_event
+from app.utils.rate_limiter import HostRateLimiter, RETRY_STATUS_CODES, backoff_delay
+from app.utils.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# 네이버 검색 결과 한 페이지당 뉴스 수
+NEWS_PER_PAGE = 10
+
+# 페이지 처리 완료 콜백: (키워드, 페이지, 이 페이지에서 추가된 뉴스 아이템 목록) -> False이면 크롤링 중단
+PageCallback = Callable[[str, int, List[Dict[str, Any]]], Optional[bool]]
+
+
+class _CrawlRun:
+    """
+    크롤링 1회 실행 동안 사용하는 전체/호스트별 세마포어와 요청 통계
+    """
+    def __init__(self, max_concurrency: int, per_host_concurrency: int, on_page: Optional[PageCallback] = None):
+        self.on_page = on_page
+        self.cancelled = False
+        self.global_semaphore = asyncio.Semaphore(max_concurrency)
+        self.per_host_concurrency = per_host_concurrency
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.page_errors: Dict[str, str] = {}
+        self.stats: Dict[str, Any] = {
+            "pages_requested": 0,
+            "pages_failed": 0,
+            "requests": 0,
+            "retries": 0,
+            "throttled_responses": 0,
+            "rate_limit_wait_seconds": 0.0,
+            "stopped_at_known": 0
+        }
+
+    def for_url(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return self.host_semaphores[host]
+
+    def notify_page(self, keyword: str, page: int, items: List[Dict[str, Any]]) -> None:
+        if self.on_page is None:
+            return
+        try:
+            if self.on_page(keyword, page, items) is False:
+                # 모든 키워드의 남은 페이지 요청 중단
+                self.cancelled = True
+        except Exception as e:
+            # 진행 상황 알림 실패가 크롤링을 멈추지 않도록 함
+            logger.error(f"Error in page callback for keyword '{keyword}' page {page}: {str(e)}")
+
+
+class AsyncCrawlEngine:
+    """
+    동시성 제한이 있는 비동기 크롤링 엔진
+    """
+    def __init__(
+        self,
+        session: CrawlerHttpSession,
+        build_url: Callable[[str, int], str],
+        parse_page: Callable[[str, str], Tuple[List[Dict[str, Any]], int]],
+        headers: Dict[str, str],
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 4,
+        page_window: int = 3,
+        max_pages: int = 20,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        page_dumper: Optional[PageDumper] = None,
+        parse_executor: Optional[Executor] = None,
+        replace_parse_executor: Optional[Callable[[Executor], Optional[Executor]]] = None
+    ):
+        """
+        엔진 초기화
+
+        Args:
+            session: 프로세스 전역 HTTP 세션 (연결 풀 공유)
+            build_url: (키워드, 페이지) -> 검색 URL 생성 함수
+            parse_page: (HTML, 키워드) -> (뉴스 아이템 목록, 페이지 내 원본 아이템 수) 파싱 함수
+            headers: 요청 헤더
+            max_concurrency: 전체 동시 요청 수
+            per_host_concurrency: 호스트별 동시 요청 수
+            page_window: 키워드당 한 번에 요청할 페이지 수
+            max_pages: 키워드당 최대 페이지 수
+            rate_limiter: 호스트별 토큰 버킷 (실행 간 공유되어 적응형 속도 유지)
+            max_retries: 403/429/5xx 및 네트워크 오류 시 최대 재시도 횟수
+            backoff_base: 재시도 기본 대기 시간 (초)
+            backoff_max: 재시도 최대 대기 시간 (초)
+            page_dumper: 디버깅용 원본 페이지 저장기 (None이면 저장하지 않음)
+            parse_executor: 파싱을 실행할 프로세스 풀 (None이면 이벤트 루프 스레드에서 직접 파싱,
+                지정하면 parse_page는 pickle 가능한 모듈 수준 함수여야 함)
+            replace_parse_executor: 파싱 프로세스가 죽어 풀을 쓸 수 없을 때 새 풀을 반환하는 함수
+                (None이면 이후 이벤트 루프 스레드에서 직접 파싱)
+        """
+        self.session = session
+        self.build_url = build_url
+        self.parse_page = parse_page
+        self.headers = headers
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.page_window = max(1, page_window)
+        self.max_pages = max_pages
+        self.rate_limiter = rate_limiter
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.page_dumper = page_dumper
+        self.parse_executor = parse_executor
+        self.replace_parse_executor = replace_parse_executor
+        # 교체 중인 풀과 교체 결과 (동시에 실패한 페이지들이 같은 교체를 기다리도록 공유)
+        self._replacing: Optional[Tuple[Executor, "asyncio.Future[Optional[Executor]]"]] = None
+
+    def _dump(self, html: str, reason: str, keyword: str, page: int, failed: bool = True) -> None:
+        if self.page_dumper is None:
+            return
+        file_path = self.page_dumper.dump(html, reason, keyword, page, failed)
+        if file_path:
+            log_event(logger, logging.INFO, "page.dumped", keyword=keyword, page=page, reason=reason, path=file_path)
+
+    async def _fetch_page(self, run: "_CrawlRun", keyword: str, page: int) -> Optional[str]:
+        """
+        검색 결과 페이지 요청 (속도 제한 및 재시도 적용)
+
+        Returns:
+            HTML 문자열 또는 실패 시 None
+        """
+        url = self.build_url(keyword, page)
+        bucket = self.rate_limiter.bucket(url) if self.rate_limiter else None
+        run.stats["pages_requested"] += 1
+        failure = ""
+
+        for attempt in range(self.max_retries + 1):
+            if bucket:
+                wait = await bucket.acquire_async()
+                run.stats["rate_limit_wait_seconds"] += wait
+
+            retry_after = None
+            try:
+                async with run.global_semaphore, run.for_url(url):
+                    log_event(logger, logging.DEBUG, "page.request", keyword=keyword, page=page, attempt=attempt + 1, url=url)
+                    run.stats["requests"] += 1
+                    response = await self.session.get(url, headers=self.headers)
+            except httpx.TransportError as e:
+                failure = f"{type(e).__name__}: {str(e)}"
+                log_event(logger, logging.WARNING, "page.request_error", keyword=keyword, page=page,
+                          attempt=attempt + 1, error=failure)
+            else:
+                if response.status_code == 200:
+                    if bucket:
+                        bucket.on_success()
+                    return response.text
+
+                failure = f"HTTP {response.status_code}"
+                if response.status_code not in RETRY_STATUS_CODES:
+                    log_event(logger, logging.ERROR, "page.failed", keyword=keyword, page=page,
+                              status=response.status_code, body=lambda: response.text[:500])
+                    self._dump(response.text, f"http_{response.status_code}", keyword, page)
+                    break
+
+                run.stats["throttled_responses"] += 1
+                retry_after = response.headers.get("Retry-After")
+                log_event(logger, logging.WARNING, "page.throttled", keyword=keyword, page=page,
+                          status=response.status_code, attempt=attempt + 1)
+                self._dump(response.text, f"http_{response.status_code}", keyword, page)
+
+            if attempt >= self.max_retries:
+                break
+
+            delay = backoff_delay(attempt, self.backoff_base, self.backoff_max, retry_after)
+            if bucket:
+                # 같은 호스트로 가는 다른 요청도 함께 멈추고 속도를 낮춤
+                bucket.on_throttle(delay)
+            else:
+                await asyncio.sleep(delay)
+            run.stats["retries"] += 1
+
+        run.stats["pages_failed"] += 1
+        run.page_errors[keyword] = f"page {page}: {failure} after {attempt + 1} attempts"
+        logger.error(f"Giving up page {page} for keyword '{keyword}': {failure}")
+        return None
+
+    async def _parse(self, html: str, keyword: str) -> Tuple[List[Dict[str, Any]], int]:
+        if self.parse_executor is None:
+            return self.parse_page(html, keyword)
+        # 파싱하는 동안 다른 페이지 요청이 진행되도록 프로세스 풀에서 실행
+        loop = asyncio.get_running_loop()
+        executor = self.parse_executor
+        try:
+            return await loop.run_in_executor(executor, self.parse_page, html, keyword)
+        except BrokenProcessPool:
+            # 파싱 프로세스가 죽으면(메모리 부족, 파서 오류 등) 풀 전체를 쓸 수 없으므로 새 풀로 한 번만 다시 시도
+            # (같은 페이지가 다시 프로세스를 죽이면 이 페이지만 실패 처리하고 다음 크롤링을 위해 풀을 다시 만듦)
+            logger.warning(f"HTML parsing process died while parsing a page for keyword '{keyword}'")
+            executor = await self._replace_broken_executor(executor)
+            if executor is None:
+                return self.parse_page(html, keyword)
+            try:
+                return await loop.run_in_executor(executor, self.parse_page, html, keyword)
+            except BrokenProcessPool:
+                await self._replace_broken_executor(executor)
+                raise
+
+    async def _replace_broken_executor(self, broken: Executor) -> Optional[Executor]:
+        # 동시에 실패한 다른 페이지가 이미 바꿨으면 그 풀을 사용
+        if self.parse_executor is not broken:
+            return self.parse_executor
+        if self.replace_parse_executor is None:
+            self.parse_executor = None
+            return None
+        # 풀 종료와 새 프로세스 생성은 오래 걸릴 수 있으므로 이벤트 루프 밖에서 한 번만 실행
+        if self._replacing is None or self._replacing[0] is not broken:
+            loop = asyncio.get_running_loop()
+            self._replacing = (broken, loop.run_in_executor(None, self.replace_parse_executor, broken))
+        replacement = await self._replacing[1]
+        if self.parse_executor is broken:
+            self.parse_executor = replacement
+            self._replacing = None
+        return self.parse_executor
+
+    async def _crawl_keyword(
+        self,
+        run: "_CrawlRun",
+        keyword: str,
+        max_news: int,
+        known_urls: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 키워드에 대한 뉴스 크롤링 (페이지 단위 동시 요청)
+
+        known_urls가 있으면 (증분 모드) 한 페이지씩 요청하고, 이미 수집한 기사가 나타나면 중단
+        """
+        logger.info(f"Crawling news for keyword: {keyword}, max_news: {max_news}")
+        news_items: List[Dict[str, Any]] = []
+        page = 1
+        done = False
+        # 증분 모드에서는 대부분 첫 페이지에서 끝나므로 미리 여러 페이지를 요청하지 않음
+        page_window = 1 if known_urls else self.page_window
+
+        while not done and not run.cancelled and len(news_items) < max_news and page <= self.max_pages:
+            # 남은 건수를 채우는 데 필요한 페이지만큼만 동시에 요청
+            needed_pages = -(-(max_news - len(news_items)) // NEWS_PER_PAGE)
+            window = min(page_window, needed_pages, self.max_pages - page + 1)
+            pages = list(range(page, page + window))
+
+            results = await asyncio.gather(
+                *(self._fetch_page(run, keyword, p) for p in pages),
+                return_exceptions=True
+            )
+
+            # 페이지 순서대로 결과 반영
+            for current_page, result in zip(pages, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error crawling page {current_page} for keyword '{keyword}': {str(result)}")
+                    done = True
+                    break
+
+                if result is None:
+                    done = True
+                    break
+
+                try:
+                    items, raw_count = await self._parse(result, keyword)
+                except Exception as e:
+                    logger.error(f"Error parsing page {current_page} for keyword '{keyword}': {str(e)}")
+                    self._dump(result, "parse_error", keyword, current_page)
+                    done = True
+                    break
+
+                if raw_count == 0:
+                    logger.warning(f"No news items found on page {current_page} for keyword '{keyword}'")
+                    self._dump(result, "no_items", keyword, current_page)
+                    done = True
+                    break
+
+                self._dump(result, "sample", keyword, current_page, failed=False)
+                log_event(logger, logging.DEBUG, "page.parsed", keyword=keyword, page=current_page,
+                          html_length=len(result), items=raw_count, valid_items=len(items))
+
+                page_start = len(news_items)
+                for item in items:
+                    if len(news_items) >= max_news:
+                        break
+                    if known_urls and canonicalize_url(item.get('url', '')) in known_urls:
+                        # 최신순 정렬이므로 이후 기사는 모두 이전 실행에서 수집한 기사
+                        logger.info(f"Reached previously crawled news at page {current_page} for keyword '{keyword}'")
+                        run.stats["stopped_at_known"] += 1
+                        done = True
+                        break
+                    news_items.append(item)
+
+                run.notify_page(keyword, current_page, news_items[page_start:])
+                if done or run.cancelled:
+                    break
+
+                # 더 이상 결과가 없으면 중단
+                if raw_count < NEWS_PER_PAGE:
+                    logger.info(f"End of results reached for keyword '{keyword}' at page {current_page + 1}")
+                    done = True
+                    break
+
+                if len(news_items) >= max_news:
+                    break
+
+            page += window
+
+        if not done and page > self.max_pages and len(news_items) < max_news:
+            logger.info(f"Maximum page limit reached for keyword '{keyword}'")
+
+        logger.info(f"Crawled {len(news_items)} news items for keyword '{keyword}'")
+        return news_items
+
+    async def crawl_keywords(
+        self,
+        keywords: List[str],
+        max_news_per_keyword: int,
+        known_urls: Optional[Dict[str, Set[str]]] = None,
+        on_page: Optional[PageCallback] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str], Dict[str, Any]]:
+        """
+        여러 키워드 동시 크롤링 (세션 이벤트 루프에서 실행되어야 함)
+
+        Args:
+            keywords: 검색 키워드 목록
+            max_news_per_keyword: 키워드당 최대 뉴스 건수
+            known_urls: 증분 모드에서 키워드별로 이미 수집한 기사의 정규화 URL (None이면 전체 크롤링)
+            on_page: 페이지 처리 완료 시 호출할 콜백 (이벤트 루프 스레드에서 호출되므로 빨리 반환해야 함, False를 반환하면 중단)
+
+        Returns:
+            (크롤링한 뉴스 아이템 목록, 오류 정보, 요청 통계) - 아이템은 키워드 순서, 페이지 순서를 유지
+        """
+        # 세마포어는 이벤트 루프에 묶이므로 crawl 호출마다 생성
+        run = _CrawlRun(self.max_concurrency, self.per_host_concurrency, on_page)
+        started_at = time.monotonic()
+
+        results = await asyncio.gather(
+            *(
+                self._crawl_keyword(run, keyword, max_news_per_keyword, (known_urls or {}).get(keyword))
+                for keyword in keywords
+            ),
+            return_exceptions=True
+        )
+
+        all_news_items: List[Dict[str, Any]] = []
+        errors: Dict[str, str] = dict(run.page_errors)
+        for keyword, result in zip(keywords, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error crawling keyword '{keyword}': {str(result)}")
+                errors[keyword] = str(result)
+            else:
+                all_news_items.extend(result)
+
+        elapsed = time.monotonic() - started_at
+        stats = dict(run.stats)
+        stats["rate_limit_wait_seconds"] = round(stats["rate_limit_wait_seconds"], 2)
+        stats["elapsed_seconds"] = round(elapsed, 2)
+        stats["cancelled"] = run.cancelled
+        stats["pages_per_second"] = round(stats["requests"] / elapsed, 2) if elapsed > 0 else 0.0
+        if self.rate_limiter:
+            stats["rate_limits"] = self.rate_limiter.stats()
+
+        return all_news_items, errors, stats
@@ -2,23 +2,72 @@
 # -*- coding: utf-8 -*-
 
 import os
-import requests
 # import pandas as pd
 from app.utils.csv_utils import save_to_csv, save_to_excel
-from bs4 import BeautifulSoup
+from app.utils.columnar_utils import save_columnar_copy
 from urllib.parse import quote_plus
 import logging
 import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 
-from app.utils.naver_news_helper import (
-    extract_news_items, extract_title, extract_url, 
-    extract_source, extract_date, extract_content
+from app.utils.debug_utils import PageDumper, log_event
+from app.utils.html_parser import parse_html
+from app.utils.naver_news_helper import extract_news_items, extract_fields, selector_memo
+from app.services.crawl_engine import AsyncCrawlEngine, PageCallback
+from app.services.dedup_service import (
+    SEEN_MODE_OFF, SEEN_MODES, apply_seen_index, assign_clusters, deduplicate_items, get_seen_index
 )
+from app.services.http_session import get_http_session
+from app.services.watermark_service import get_watermark_store
+from app.services.article_store import store_articles
+from app.services.file_catalog import catalog_file
+from app.utils.rate_limiter import HostRateLimiter
 from app.core.config import settings
+from app.core.executors import get_parse_executor, replace_parse_executor
 
 logger = logging.getLogger(__name__)
 
+
+def parse_search_page(html: str, keyword: str) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    검색 결과 페이지 HTML에서 뉴스 아이템 추출
+    
+    파싱 프로세스 풀에서 실행할 수 있도록 모듈 수준 함수로 둠 (선택자 캐시는 프로세스마다 따로 학습)
+    
+    Args:
+        html: 검색 결과 페이지 HTML
+        keyword: 검색 키워드
+        
+    Returns:
+        (유효한 뉴스 아이템 목록, 페이지에서 찾은 원본 아이템 수)
+    """
+    # HTML 파싱 (뉴스 목록 영역만)
+    soup = parse_html(html, settings.CRAWLER_HTML_PARSER, settings.CRAWLER_PARSE_SCOPE)
+    
+    # 디버그용 - HTML 구조 파악 (DEBUG 레벨일 때만 직렬화)
+    log_event(logger, logging.DEBUG, "page.html", keyword=keyword, length=len(html), head=lambda: html[:1000])
+    log_event(logger, logging.DEBUG, "page.list_element", keyword=keyword,
+              html=lambda: str(soup.select_one('ul.list_news._infinite_list'))[:500])
+    
+    # 뉴스 아이템 추출
+    adaptive = settings.CRAWLER_ADAPTIVE_SELECTORS
+    items = extract_news_items(soup, adaptive=adaptive)
+    
+    # 각 뉴스 항목 처리
+    news_items = []
+    for item in items:
+        # 제목/URL/출처/날짜/내용을 1회 순회로 추출
+        fields = extract_fields(item, adaptive=adaptive)
+        
+        # 유효한 항목만 추가
+        if fields['title'] and fields['url']:
+            fields['keyword'] = keyword
+            news_items.append(fields)
+    
+    return news_items, len(items)
+
+
 class CrawlerService:
     """
     네이버 뉴스 크롤링 서비스
@@ -32,6 +81,36 @@ class CrawlerService:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
         
+        # 프로세스 전역 HTTP 세션 (연결 풀, keep-alive 공유)
+        self.session = get_http_session()
+        
+        # 비동기 크롤링 엔진 (키워드/페이지 동시 요청)
+        self.engine = AsyncCrawlEngine(
+            session=self.session,
+            build_url=self._build_search_url,
+            parse_page=parse_search_page,
+            parse_executor=get_parse_executor(),
+            replace_parse_executor=replace_parse_executor,
+            headers=self.headers,
+            max_concurrency=settings.CRAWLER_MAX_CONCURRENCY,
+            per_host_concurrency=settings.CRAWLER_PER_HOST_CONCURRENCY,
+            page_window=settings.CRAWLER_PAGE_WINDOW,
+            max_pages=settings.CRAWLER_MAX_PAGES,
+            rate_limiter=HostRateLimiter(
+                rate=settings.CRAWLER_RATE_LIMIT_RPS,
+                burst=settings.CRAWLER_RATE_LIMIT_BURST,
+                min_rate=settings.CRAWLER_RATE_LIMIT_MIN_RPS
+            ),
+            max_retries=settings.CRAWLER_MAX_RETRIES,
+            backoff_base=settings.CRAWLER_BACKOFF_BASE,
+            backoff_max=settings.CRAWLER_BACKOFF_MAX,
+            page_dumper=PageDumper(
+                settings.CRAWLER_DEBUG_DUMP_PATH,
+                sample_rate=settings.CRAWLER_DEBUG_DUMP_SAMPLE_RATE,
+                max_files=settings.CRAWLER_DEBUG_DUMP_MAX_FILES
+            ) if settings.CRAWLER_DEBUG_DUMP else None
+        )
+        
         # 결과 저장 디렉토리 확인 및 생성
         os.makedirs(settings.RESULTS_PATH, exist_ok=True)
     
@@ -118,89 +197,7 @@ class CrawlerService:
         Returns:
             크롤링한 뉴스 아이템 목록
         """
-        logger.info(f"Crawling news for keyword: {keyword}, max_news: {max_news}")
-        news_items = []
-        page = 1
-        
-        while len(news_items) < max_news:
-            try:
-                # 검색 URL 생성 및 요청
-                url = self._build_search_url(keyword, page)
-                logger.info(f"Requesting URL: {url}")
-                
-                # URL 로그 기록 기능 제거됨
-                
-                response = requests.get(url, headers=self.headers)
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch page {page} for keyword '{keyword}': {response.status_code}")
-                    logger.error(f"Response content: {response.text[:500]}")
-                    
-                    # 오류 로그 기록 기능 제거됨
-                    
-                    break
-                
-                # HTML 파싱
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 디버그용 - HTML 구조 파악
-                logger.info(f"HTML Content Length: {len(response.text)}")
-                logger.debug(f"First 1000 chars of HTML: {response.text[:1000]}")
-                
-                # HTML 저장 기능 제거됨
-                
-                # CSS 선택자 확인
-                ul_element = soup.select_one('ul.list_news._infinite_list')
-                if ul_element:
-                    logger.info("Found list_news._infinite_list element")
-                    logger.debug(f"First ul element: {str(ul_element)[:500]}")
-                
-                # 뉴스 아이템 추출
-                items = extract_news_items(soup)
-                
-                if not items:
-                    logger.warning(f"No news items found on page {page} for keyword '{keyword}'")
-                    break
-                
-                # 각 뉴스 항목 처리
-                for item in items:
-                    if len(news_items) >= max_news:
-                        break
-                    
-                    title = extract_title(item)
-                    url = extract_url(item)
-                    source = extract_source(item)
-                    date = extract_date(item)
-                    content = extract_content(item)
-                    
-                    # 유효한 항목만 추가
-                    if title and url:
-                        news_items.append({
-                            'title': title,
-                            'url': url,
-                            'source': source,
-                            'date': date,
-                            'content': content,
-                            'keyword': keyword
-                        })
-                
-                # 다음 페이지로 이동
-                page += 1
-                
-                # 더 이상 결과가 없으면 중단
-                if len(items) < 10:
-                    logger.info(f"End of results reached for keyword '{keyword}' at page {page}")
-                    break
-                
-                # 최대 20페이지까지만 검색 (네이버 최대 페이지 제한)
-                if page > 20:
-                    logger.info(f"Maximum page limit reached for keyword '{keyword}'")
-                    break
-                
-            except Exception as e:
-                logger.error(f"Error crawling page {page} for keyword '{keyword}': {str(e)}")
-                break
-        
-        logger.info(f"Crawled {len(news_items)} news items for keyword '{keyword}'")
+        news_items, _ = self.crawl_keywords([keyword], max_news)
         return news_items
     
     def crawl_keywords(self, keywords: List[str], max_news_per_keyword: int = 50) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
@@ -214,19 +211,105 @@ class CrawlerService:
         Returns:
             (크롤링한 뉴스 아이템 목록, 오류 정보)
         """
-        all_news_items = []
-        errors = {}
+        all_news_items, errors, _ = self.crawl_keywords_with_stats(keywords, max_news_per_keyword)
+        return all_news_items, errors
+    
+    def crawl_keywords_with_stats(
+        self,
+        keywords: List[str],
+        max_news_per_keyword: int = 50,
+        seen_mode: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        on_page: Optional[PageCallback] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str], Dict[str, Any]]:
+        """
+        여러 키워드에 대한 뉴스 크롤링 (요청/재시도/속도 제한 통계 포함)
+        키워드와 페이지를 비동기 엔진으로 동시에 요청하고, 키워드 간 중복 기사를 병합
+        
+        Args:
+            keywords: 검색 키워드 목록
+            max_news_per_keyword: 키워드당 최대 뉴스 건수 (기본값: 50)
+            seen_mode: 이전 실행에서 수집한 기사 처리 방식 (mark, skip, off / 기본값: 설정값)
+            incremental: 지난번 저장한 최신 기사가 나타나면 페이지 요청 중단 (기본값: 설정값)
+            on_page: 페이지 처리 완료 시 호출할 콜백 (키워드, 페이지, 뉴스 아이템 목록 / False를 반환하면 중단)
+            
+        Returns:
+            (크롤링한 뉴스 아이템 목록, 오류 정보, 크롤링 통계)
+        """
+        if incremental is None:
+            incremental = settings.CRAWLER_INCREMENTAL
         
-        for keyword in keywords:
+        known_urls = None
+        if incremental:
             try:
-                news_items = self.crawl_keyword(keyword, max_news_per_keyword)
-                all_news_items.extend(news_items)
+                known_urls = get_watermark_store().known_urls(keywords)
             except Exception as e:
-                logger.error(f"Error crawling keyword '{keyword}': {str(e)}")
-                errors[keyword] = str(e)
+                logger.error(f"Error reading crawl watermarks, running full crawl: {str(e)}")
+        
+        all_news_items, errors, stats = self.session.run(
+            self.engine.crawl_keywords(keywords, max_news_per_keyword, known_urls, on_page)
+        )
+        stats["incremental"] = bool(incremental)
+        if settings.CRAWLER_ADAPTIVE_SELECTORS and self.engine.parse_executor is None:
+            # 파싱 프로세스 풀을 쓰면 선택자 캐시는 각 파싱 프로세스에 있음
+            stats["selector_memo"] = selector_memo.stats()
+        
+        all_news_items, dedup_stats = self._deduplicate(all_news_items, seen_mode or settings.CRAWLER_SEEN_MODE)
+        stats["dedup"] = dedup_stats
         
         logger.info(f"Crawled total of {len(all_news_items)} news items for {len(keywords)} keywords")
-        return all_news_items, errors
+        return all_news_items, errors, stats
+    
+    def _deduplicate(self, news_items: List[Dict[str, Any]], seen_mode: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        키워드 간 중복 병합 후 이전 실행에서 수집한 기사 표시/제외
+        
+        Args:
+            news_items: 크롤링한 뉴스 아이템 목록
+            seen_mode: 이전 실행에서 수집한 기사 처리 방식
+            
+        Returns:
+            (처리된 뉴스 아이템 목록, 중복 제거 통계)
+        """
+        if not settings.CRAWLER_DEDUP:
+            return news_items, {"enabled": False}
+        
+        news_items, stats = deduplicate_items(news_items)
+        if seen_mode not in SEEN_MODES:
+            logger.warning(f"Unknown seen mode '{seen_mode}', ignoring seen-article index")
+            seen_mode = SEEN_MODE_OFF
+        
+        if seen_mode != SEEN_MODE_OFF:
+            try:
+                news_items, seen_stats = apply_seen_index(news_items, get_seen_index(), seen_mode)
+                stats.update(seen_stats)
+            except Exception as e:
+                # 색인을 사용할 수 없어도 크롤링 결과는 그대로 반환
+                logger.error(f"Error reading seen-article index: {str(e)}")
+        
+        if stats["duplicates_merged"] or stats.get("skipped_seen"):
+            logger.info(f"Merged {stats['duplicates_merged']} duplicate news items, skipped {stats.get('skipped_seen', 0)} seen in earlier runs")
+        
+        # 유사 기사 군집화 (관련성 평가 시 군집당 1회만 LLM 호출)
+        if settings.NEAR_DUP_CLUSTERING and news_items:
+            stats["clustering"] = assign_clusters(news_items, settings.NEAR_DUP_THRESHOLD)
+        return news_items, stats
+    
+    def _remember_saved(self, news_items: List[Dict[str, Any]]) -> None:
+        """
+        저장에 성공한 기사를 수집 기사 색인과 증분 크롤링 기준점에 기록
+        """
+        try:
+            get_watermark_store().update(news_items)
+        except Exception as e:
+            logger.error(f"Error updating crawl watermarks: {str(e)}")
+        
+        if not settings.CRAWLER_DEDUP or settings.CRAWLER_SEEN_MODE == SEEN_MODE_OFF:
+            return
+        try:
+            get_seen_index().remember(news_items)
+        except Exception as e:
+            logger.error(f"Error updating seen-article index: {str(e)}")
     
     def save_results(self, news_items: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -252,16 +335,23 @@ class CrawlerService:
             file_name = f"naver_news_{keywords_str}_{timestamp}.csv"
             file_path = os.path.join(settings.RESULTS_PATH, file_name)
             
-            # CSV 파일로 저장 (다운로드 폴더에도 복사)
+            # CSV 파일로 저장 (다운로드 폴더에도 복사, 통계 파일과 행 위치 색인 함께 저장)
             success, download_path = save_to_csv(
                 news_items, 
                 file_path, 
                 encoding='utf-8-sig',
                 copy_to_download=settings.AUTO_COPY_TO_DOWNLOADS,
-                download_path=settings.USER_DOWNLOAD_PATH
+                download_path=settings.USER_DOWNLOAD_PATH,
+                write_statistics=True,
+                write_row_index=True
             )
             
             if success:
+                self._remember_saved(news_items)
+                if settings.RESULTS_COLUMNAR:
+                    save_columnar_copy(news_items, file_path)
+                store_articles(news_items, file_path)
+                catalog_file(file_path)
                 if download_path:
                     logger.info(f"Saved {len(news_items)} news items to {file_path} and copied to {download_path}")
                 else:
@@ -308,6 +398,7 @@ class CrawlerService:
             )
             
             if success:
+                self._remember_saved(news_items)
                 if download_path:
                     logger.info(f"Saved {len(news_items)} news items to Excel file {file_path} and copied to {download_path}")
                 else:
@@ -320,3 +411,11 @@ class CrawlerService:
         except Exception as e:
             logger.error(f"Error saving results to Excel: {str(e)}")
             return None, None
+
+
+@lru_cache()
+def get_crawler_service() -> CrawlerService:
+    """
+    프로세스 전역 크롤러 서비스 반환 (HTTP 세션과 속도 제한 상태를 공유하는 단일 인스턴스)
+    """
+    return CrawlerService()
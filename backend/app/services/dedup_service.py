@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 아이템 중복 제거 서비스
+정규화 URL(및 언론사+제목)로 키워드 간 중복을 합치고,
+디스크에 저장된 색인으로 이전 실행에서 이미 수집한 기사를 표시하거나 건너뜀
+"""
+
+import datetime
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.rule_filter import get_rule_classifier
+from app.utils.minhash import cluster_texts
+from app.utils.naver_news_helper import TITLE_DEFAULT
+from app.utils.sqlite_utils import connect
+from app.utils.url_utils import canonicalize_url, normalize_title
+
+logger = logging.getLogger(__name__)
+
+# 이전 실행에서 수집한 기사 처리 방식
+SEEN_MODE_MARK = "mark"  # seen_before 열로 표시
+SEEN_MODE_SKIP = "skip"  # 결과에서 제외
+SEEN_MODE_OFF = "off"    # 색인 사용 안 함
+SEEN_MODES = (SEEN_MODE_MARK, SEEN_MODE_SKIP, SEEN_MODE_OFF)
+
+_DEFAULT_TITLE_KEY = normalize_title(TITLE_DEFAULT)
+
+
+def _title_key(item: Dict[str, Any]) -> Optional[str]:
+    # 제목 추출에 실패한 기사(기본값 "제목 없음")는 제목으로 중복 판정하지 않음
+    title = normalize_title(item.get('title', ''))
+    if not title or title == _DEFAULT_TITLE_KEY:
+        return None
+    return f"{item.get('source', '')}|{title}"
+
+
+def deduplicate_items(news_items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    키워드 간 중복 기사 병합
+
+    같은 정규화 URL이거나 같은 언론사의 같은 제목이면 중복으로 보고 처음 나온 기사만 유지.
+    일치한 모든 키워드는 matched_keywords 목록으로 보존
+
+    Args:
+        news_items: 크롤링한 뉴스 아이템 목록
+
+    Returns:
+        (중복 제거된 뉴스 아이템 목록, 중복 제거 통계)
+    """
+    unique_items: List[Dict[str, Any]] = []
+    by_url: Dict[str, Dict[str, Any]] = {}
+    by_title: Dict[str, Dict[str, Any]] = {}
+
+    for item in news_items:
+        url_key = canonicalize_url(item.get('url', ''))
+        title_key = _title_key(item)
+        existing = by_url.get(url_key) if url_key else None
+        if existing is None and title_key:
+            existing = by_title.get(title_key)
+
+        keyword = item.get('keyword', '')
+        if existing is not None:
+            if keyword and keyword not in existing['matched_keywords']:
+                existing['matched_keywords'].append(keyword)
+            continue
+
+        item = dict(item)
+        item['matched_keywords'] = [keyword] if keyword else []
+        unique_items.append(item)
+        if url_key:
+            by_url[url_key] = item
+        if title_key:
+            by_title[title_key] = item
+
+    stats = {
+        "input_items": len(news_items),
+        "unique_items": len(unique_items),
+        "duplicates_merged": len(news_items) - len(unique_items)
+    }
+    return unique_items, stats
+
+
+def assign_clusters(news_items: List[Dict[str, Any]], threshold: float = 0.6) -> Dict[str, Any]:
+    """
+    제목과 본문 요약이 거의 같은 기사(통신사 기사 전재 등)를 군집으로 묶어 cluster_id 부여
+
+    군집 번호는 1부터 시작하며 군집의 첫 기사(대표 기사) 순서대로 매김.
+    같은 양식의 기사라도 제목의 회사명(자사명/업계 사전 단어)이 다르면 다른 군집으로 나눔
+
+    Args:
+        news_items: 뉴스 아이템 목록 (cluster_id가 추가됨)
+        threshold: 같은 군집으로 묶을 최소 유사도 (0.0 ~ 1.0)
+
+    Returns:
+        군집화 통계
+    """
+    texts = [f"{normalize_title(item.get('title', ''))} {item.get('content', '')}" for item in news_items]
+    representatives, stats = cluster_texts(texts, threshold=threshold)
+    # 대표 기사 위치로 임시 번호를 붙인 뒤 회사명 기준으로 나누면서 1부터 다시 매김
+    for item, representative in zip(news_items, representatives):
+        item['cluster_id'] = representative + 1
+
+    entity_splits = split_entity_clusters(news_items)
+    clusters = stats["clusters"] + entity_splits
+    return {
+        "clusters": clusters,
+        "near_duplicates": len(news_items) - clusters,
+        "candidate_pairs": stats["candidate_pairs"],
+        "entity_splits": entity_splits
+    }
+
+
+def split_entity_clusters(news_items: List[Dict[str, Any]]) -> int:
+    """
+    제목의 회사명(자사명/업계 사전 단어)이 다른 기사를 다른 군집으로 나누고 군집 번호를 다시 매김
+
+    "코스맥스, 1분기 영업이익 증가"와 "한국콜마, 1분기 영업이익 증가"처럼 양식이 같아 유사도가 높아도
+    카테고리가 달라지는 기사가 대표 기사의 판정을 복사받지 않도록 함.
+    군집 번호가 없는 기사는 그대로 두며, 이미 나뉜 군집은 번호만 같게 유지됨
+
+    Args:
+        news_items: cluster_id가 있는 뉴스 아이템 목록 (cluster_id가 바뀜)
+
+    Returns:
+        새로 생긴 군집 수
+    """
+    classifier = get_rule_classifier()
+    cluster_ids: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+    original_clusters = set()
+    for item in news_items:
+        cluster_id = str(item.get('cluster_id', '') or '')
+        if not cluster_id:
+            continue
+        original_clusters.add(cluster_id)
+        key = (cluster_id, classifier.entity_words(item))
+        if key not in cluster_ids:
+            cluster_ids[key] = len(cluster_ids) + 1
+        item['cluster_id'] = cluster_ids[key]
+    return len(cluster_ids) - len(original_clusters)
+
+
+class SeenArticleIndex:
+    """
+    이전 실행에서 수집한 기사의 영구 색인 (SQLite)
+    """
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 색인 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_articles (
+                    url_key TEXT PRIMARY KEY,
+                    title_key TEXT,
+                    title TEXT,
+                    source TEXT,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    seen_count INTEGER NOT NULL DEFAULT 1
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_title_key ON seen_articles(title_key)")
+
+    def lookup(self, news_items: List[Dict[str, Any]]) -> Dict[int, str]:
+        """
+        이미 수집한 기사 조회
+
+        Returns:
+            아이템 위치 -> 최초 수집 시각
+        """
+        seen: Dict[int, str] = {}
+        with self._lock:
+            for index, item in enumerate(news_items):
+                url_key = canonicalize_url(item.get('url', ''))
+                row = self._conn.execute(
+                    "SELECT first_seen FROM seen_articles WHERE url_key = ?", (url_key,)
+                ).fetchone()
+                if row is None:
+                    title_key = _title_key(item)
+                    if title_key:
+                        row = self._conn.execute(
+                            "SELECT first_seen FROM seen_articles WHERE title_key = ? LIMIT 1", (title_key,)
+                        ).fetchone()
+                if row is not None:
+                    seen[index] = row["first_seen"]
+        return seen
+
+    def remember(self, news_items: List[Dict[str, Any]]) -> None:
+        """
+        기사를 색인에 기록 (이미 있으면 마지막 수집 시각과 횟수 갱신)
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = []
+        for item in news_items:
+            url_key = canonicalize_url(item.get('url', ''))
+            if url_key:
+                rows.append((url_key, _title_key(item), item.get('title', ''), item.get('source', ''), now, now))
+
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO seen_articles (url_key, title_key, title, source, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    last_seen = excluded.last_seen,
+                    seen_count = seen_count + 1
+            """, rows)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+
+
+def apply_seen_index(
+    news_items: List[Dict[str, Any]],
+    index: SeenArticleIndex,
+    mode: str = SEEN_MODE_MARK
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    이전 실행에서 수집한 기사 표시 또는 제외
+
+    Args:
+        news_items: 중복 제거된 뉴스 아이템 목록
+        index: 영구 색인
+        mode: mark(표시) 또는 skip(제외)
+
+    Returns:
+        (처리된 뉴스 아이템 목록, 통계)
+    """
+    seen = index.lookup(news_items)
+
+    if mode == SEEN_MODE_SKIP:
+        result = [item for position, item in enumerate(news_items) if position not in seen]
+    else:
+        result = []
+        for position, item in enumerate(news_items):
+            item['seen_before'] = position in seen
+            item['first_seen'] = seen.get(position, "")
+            result.append(item)
+
+    return result, {"seen_before": len(seen), "seen_mode": mode, "skipped_seen": len(news_items) - len(result)}
+
+
+_seen_index: Optional[SeenArticleIndex] = None
+_seen_index_lock = threading.Lock()
+
+
+def get_seen_index() -> SeenArticleIndex:
+    """
+    프로세스 전역 수집 기사 색인 반환
+    """
+    global _seen_index
+    with _seen_index_lock:
+        if _seen_index is None:
+            _seen_index = SeenArticleIndex(settings.SEEN_INDEX_PATH)
+        return _seen_index
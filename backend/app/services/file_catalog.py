@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+결과 파일 목록 색인 (SQLite)
+결과 파일의 크기, 수정 시각, 평가 여부, 행 수, 키워드를 색인에 기록해 두고 목록 조회는 색인에서 페이지 단위로 읽음.
+파일 저장 시 바로 기록하고, 다른 경로로 추가/삭제/수정된 파일은 폴더를 다시 훑어 바뀐 파일만 갱신
+(폴더 수정 시각이 그대로이면 다시 훑지 않음)
+"""
+
+import datetime
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.csv_utils import format_size
+from app.utils.columnar_utils import get_result_statistics
+from app.utils.sqlite_utils import connect
+
+logger = logging.getLogger(__name__)
+
+# 정렬 기준 (요청 값 -> 열)
+SORT_COLUMNS = {
+    "modified_time": "mtime",
+    "file_name": "file_name",
+    "file_size": "file_size",
+    "row_count": "row_count"
+}
+
+
+class FileCatalog:
+    """
+    결과 파일 목록 색인 (폴더별)
+    """
+    def __init__(self, db_path: str, refresh_interval: float = 5.0):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            refresh_interval: 폴더를 다시 확인하는 최소 간격 (초)
+        """
+        self.db_path = db_path
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        # 폴더별 (마지막 확인 시각, 마지막으로 훑었을 때의 폴더 수정 시각)
+        self._scanned: Dict[str, Tuple[float, int]] = {}
+        self._conn = connect(db_path)
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS result_files (
+                    file_path TEXT PRIMARY KEY,
+                    directory TEXT NOT NULL,
+                    file_name TEXT NOT NULL,
+                    file_size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    has_evaluation INTEGER NOT NULL,
+                    is_evaluated INTEGER NOT NULL,
+                    row_count INTEGER,
+                    relevant_count INTEGER,
+                    keywords TEXT
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS result_file_keywords (
+                    keyword TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    PRIMARY KEY (keyword, file_path)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_result_files_mtime ON result_files(directory, mtime)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_result_files_name ON result_files(directory, file_name)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_result_files_size ON result_files(directory, file_size)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_result_files_rows ON result_files(directory, row_count)")
+
+    def record(self, file_path: str) -> None:
+        """
+        결과 파일 정보 기록 (파일 저장 직후 호출, 통계 파일이 있으면 파일을 다시 읽지 않음)
+
+        Args:
+            file_path: 결과 CSV 파일 경로
+        """
+        file_path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self._remove([file_path])
+            return
+
+        stats = get_result_statistics(file_path)
+        column_names = stats.get("column_names", [])
+        keywords = sorted(stats.get("keyword_counts", {}).keys())
+        file_name = os.path.basename(file_path)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO result_files (
+                    file_path, directory, file_name, file_size, mtime_ns, mtime, has_evaluation, is_evaluated,
+                    row_count, relevant_count, keywords
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                file_path, os.path.dirname(file_path), file_name, stat.st_size, stat.st_mtime_ns, stat.st_mtime,
+                int('is_relevant' in column_names), int("_evaluated" in file_name),
+                stats.get("total_rows", 0 if stats.get("error") == "Empty file" else None),
+                stats.get("relevant_count"), "|".join(keywords)
+            ))
+            self._conn.execute("DELETE FROM result_file_keywords WHERE file_path = ?", (file_path,))
+            self._conn.executemany(
+                "INSERT INTO result_file_keywords (keyword, file_path) VALUES (?, ?)",
+                [(keyword, file_path) for keyword in keywords]
+            )
+
+    def _remove(self, file_paths: List[str]) -> None:
+        with self._lock, self._conn:
+            for file_path in file_paths:
+                self._conn.execute("DELETE FROM result_files WHERE file_path = ?", (file_path,))
+                self._conn.execute("DELETE FROM result_file_keywords WHERE file_path = ?", (file_path,))
+
+    def refresh(self, directory: str, force: bool = False) -> Dict[str, int]:
+        """
+        폴더를 훑어 색인과 다른 파일만 갱신 (추가/수정된 파일 기록, 사라진 파일 삭제)
+
+        Args:
+            directory: 결과 폴더 경로
+            force: 확인 간격과 폴더 수정 시각에 관계없이 다시 훑을지 여부
+
+        Returns:
+            {"added", "updated", "removed"} 파일 수
+        """
+        directory = os.path.abspath(directory)
+        changes = {"added": 0, "updated": 0, "removed": 0}
+        with self._refresh_lock:
+            try:
+                directory_mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                return changes
+
+            now = time.monotonic()
+            checked_at, scanned_mtime = self._scanned.get(directory, (0.0, None))
+            if not force and now - checked_at < self.refresh_interval:
+                return changes
+            # 파일 추가/삭제/이름 변경은 폴더 수정 시각을 바꿈 (내용 수정은 저장 시 record로 반영)
+            if not force and scanned_mtime == directory_mtime:
+                self._scanned[directory] = (now, scanned_mtime)
+                return changes
+
+            with self._lock:
+                indexed = {
+                    row["file_path"]: (row["file_size"], row["mtime_ns"])
+                    for row in self._conn.execute(
+                        "SELECT file_path, file_size, mtime_ns FROM result_files WHERE directory = ?", (directory,)
+                    )
+                }
+
+            present = set()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.csv') or not entry.is_file():
+                        continue
+                    present.add(entry.path)
+                    stat = entry.stat()
+                    signature = indexed.get(entry.path)
+                    if signature == (stat.st_size, stat.st_mtime_ns):
+                        continue
+                    try:
+                        self.record(entry.path)
+                        changes["updated" if signature else "added"] += 1
+                    except Exception as e:
+                        logger.error(f"Error cataloging '{entry.path}': {str(e)}")
+
+            removed = [file_path for file_path in indexed if file_path not in present]
+            self._remove(removed)
+            changes["removed"] = len(removed)
+            self._scanned[directory] = (now, directory_mtime)
+
+        if any(changes.values()):
+            logger.info(f"File catalog refreshed for {directory}: {changes}")
+        return changes
+
+    def list(
+        self,
+        directory: str,
+        page: int = 1,
+        page_size: Optional[int] = 100,
+        sort: str = "modified_time",
+        descending: bool = True,
+        evaluated: Optional[bool] = None,
+        keyword: Optional[str] = None,
+        name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        결과 파일 목록 조회 (색인에서 한 페이지만 읽음)
+
+        Args:
+            directory: 결과 폴더 경로
+            page: 페이지 번호 (1부터)
+            page_size: 페이지당 파일 수 (None이면 전체 목록)
+            sort: 정렬 기준 (modified_time, file_name, file_size, row_count)
+            descending: 내림차순 여부
+            evaluated: 평가 결과 파일(_evaluated)만/제외
+            keyword: 이 키워드를 포함한 파일만
+            name: 파일명에 포함된 문자열
+
+        Returns:
+            {"files", "total", "page", "page_size"}
+        """
+        self.refresh(directory)
+        directory = os.path.abspath(directory)
+        clauses = ["directory = ?"]
+        params: List[Any] = [directory]
+        if evaluated is not None:
+            clauses.append("is_evaluated = ?")
+            params.append(int(evaluated))
+        if keyword:
+            clauses.append("file_path IN (SELECT file_path FROM result_file_keywords WHERE keyword = ?)")
+            params.append(keyword)
+        if name:
+            clauses.append("instr(file_name, ?) > 0")
+            params.append(name)
+        where = " AND ".join(clauses)
+        column = SORT_COLUMNS.get(sort, "mtime")
+        direction = "DESC" if descending else "ASC"
+        page = max(1, page) if page_size is not None else 1
+        # 전체 목록이면 LIMIT -1 (제한 없음)
+        limit = max(1, page_size) if page_size is not None else -1
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM result_files WHERE {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT * FROM result_files WHERE {where} ORDER BY {column} {direction}, file_name {direction} "
+                f"LIMIT ? OFFSET ?",
+                params + [limit, (page - 1) * max(0, limit)]
+            ).fetchall()
+        return {
+            "files": [self._file_info(row) for row in rows],
+            "total": total,
+            "page": page,
+            "page_size": limit if limit > 0 else total
+        }
+
+    @staticmethod
+    def _file_info(row: Any) -> Dict[str, Any]:
+        # get_csv_files와 같은 형식에 행 수와 키워드를 추가
+        return {
+            "file_name": row["file_name"],
+            "file_path": row["file_path"],
+            "file_size": row["file_size"],
+            "file_size_str": format_size(row["file_size"]),
+            "modified_time": row["mtime"],
+            "modified_time_str": datetime.datetime.fromtimestamp(row["mtime"]).strftime("%Y-%m-%d %H:%M:%S"),
+            "has_evaluation": bool(row["has_evaluation"]),
+            "is_evaluated": bool(row["is_evaluated"]),
+            "row_count": row["row_count"],
+            "relevant_count": row["relevant_count"],
+            "keywords": [keyword for keyword in (row["keywords"] or "").split("|") if keyword]
+        }
+
+
+def catalog_file(file_path: str) -> None:
+    """
+    저장한 결과 파일을 목록 색인에 기록 (기록에 실패해도 다음 목록 조회 때 폴더를 훑어 반영)
+    """
+    try:
+        get_file_catalog().record(file_path)
+    except Exception as e:
+        logger.error(f"Error cataloging '{file_path}': {str(e)}")
+
+
+_file_catalog: Optional[FileCatalog] = None
+_file_catalog_lock = threading.Lock()
+
+
+def get_file_catalog() -> FileCatalog:
+    """
+    프로세스 전역 결과 파일 목록 색인 반환
+    """
+    global _file_catalog
+    with _file_catalog_lock:
+        if _file_catalog is None:
+            _file_catalog = FileCatalog(settings.FILE_CATALOG_PATH, settings.FILE_CATALOG_REFRESH_INTERVAL)
+        return _file_catalog
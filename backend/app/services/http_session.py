@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 전용 프로세스 전역 HTTP 세션
+전용 이벤트 루프 스레드에서 httpx.AsyncClient 하나를 유지하여
+요청마다 TCP/TLS 연결을 새로 맺지 않고 keep-alive 연결을 재사용
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+from typing import Any, Coroutine, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlerHttpSession:
+    """
+    연결 풀과 연결 재사용 카운터를 가진 HTTP 세션
+    """
+    def __init__(
+        self,
+        pool_size: int = 20,
+        keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        http2: bool = True
+    ):
+        """
+        세션 초기화 (이벤트 루프와 클라이언트는 첫 사용 시 생성)
+
+        Args:
+            pool_size: 최대 동시 연결 수
+            keepalive_connections: 유지할 keep-alive 연결 수
+            keepalive_expiry: keep-alive 연결 유지 시간 (초)
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 읽기 타임아웃 (초)
+            http2: HTTP/2 사용 여부 (h2 패키지가 설치된 경우에만 적용)
+        """
+        self.limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.info("h2 package not installed, falling back to HTTP/1.1")
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+        # 연결 재사용 카운터
+        self._stats_lock = threading.Lock()
+        self._request_count = 0
+        self._new_connection_count = 0
+        self._error_count = 0
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """
+        전용 이벤트 루프 스레드 시작
+        """
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="crawler-http-session", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+                logger.info(f"Started crawler HTTP session (pool={self.limits.max_connections}, http2={self.http2})")
+            return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # 세션 루프 안에서만 호출되므로 별도 잠금 불필요
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2,
+                follow_redirects=True
+            )
+        return self._client
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        # 새 TCP 연결이 맺어질 때만 카운트 (나머지 요청은 기존 연결 재사용)
+        if event_name == "connection.connect_tcp.complete":
+            with self._stats_lock:
+                self._new_connection_count += 1
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        GET 요청 (세션 이벤트 루프 안에서 실행되어야 함)
+        """
+        with self._stats_lock:
+            self._request_count += 1
+        try:
+            return await self._get_client().get(url, headers=headers, extensions={"trace": self._trace})
+        except Exception:
+            with self._stats_lock:
+                self._error_count += 1
+            raise
+
+    def run(self, coro: Coroutine) -> Any:
+        """
+        세션 이벤트 루프에서 코루틴을 실행하고 결과를 기다림 (동기 호출용)
+        """
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def run_async(self, coro: Coroutine) -> Any:
+        """
+        세션 이벤트 루프에서 코루틴을 실행하고 결과를 기다림 (다른 이벤트 루프에서 호출용)
+        """
+        loop = self._ensure_started()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        연결 재사용 통계
+        """
+        with self._stats_lock:
+            requests_total = self._request_count
+            new_connections = self._new_connection_count
+            errors = self._error_count
+        reused = max(0, requests_total - new_connections - errors)
+        return {
+            "requests": requests_total,
+            "new_connections": new_connections,
+            "reused_connections": reused,
+            "reuse_ratio": round(reused / requests_total, 3) if requests_total else 0.0,
+            "errors": errors,
+            "http2": self.http2,
+            "pool_size": self.limits.max_connections
+        }
+
+    def close(self) -> None:
+        """
+        클라이언트와 이벤트 루프 종료
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+
+        if self._client is not None:
+            client = self._client
+            self._client = None
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+        logger.info("Closed crawler HTTP session")
+
+
+_session: Optional[CrawlerHttpSession] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> CrawlerHttpSession:
+    """
+    프로세스 전역 크롤러 HTTP 세션 반환
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = CrawlerHttpSession(
+                pool_size=settings.CRAWLER_HTTP_POOL_SIZE,
+                keepalive_connections=settings.CRAWLER_HTTP_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.CRAWLER_HTTP_KEEPALIVE_EXPIRY,
+                connect_timeout=settings.CRAWLER_CONNECT_TIMEOUT,
+                read_timeout=settings.CRAWLER_READ_TIMEOUT,
+                http2=settings.CRAWLER_HTTP2
+            )
+        return _session
+
+
+def close_http_session() -> None:
+    """
+    프로세스 전역 크롤러 HTTP 세션 종료
+    """
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
@@ -0,0 +1,791 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+백그라운드 작업 큐 (크롤링, 관련성 평가)
+요청 핸들러는 작업을 SQLite 큐에 등록하고 즉시 작업 ID를 반환함.
+작업은 API 프로세스 안의 작업 스레드(JOB_LOCAL_WORKERS) 또는 별도 작업 프로세스(worker.py)가
+큐에서 가져가 실행하며, 상태와 진행 이벤트(페이지별 크롤링 결과, 기사별 평가 결과)를 큐에 기록함.
+같은 호스트에서 상태 디렉토리(STATE_PATH)와 결과 디렉토리를 공유하면 여러 프로세스가 작업을 나누어 실행할 수 있음
+(작업 큐는 SQLite WAL 모드를 사용하므로 네트워크 파일 시스템을 통해 여러 서버가 공유할 수 없음)
+"""
+
+import json
+import logging
+import os
+import queue
+import signal
+import socket
+import threading
+import time
+import traceback
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.utils.sqlite_utils import connect
+
+logger = logging.getLogger(__name__)
+
+JOB_TYPE_CRAWL = "crawl"
+JOB_TYPE_EVALUATE = "evaluate"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+TERMINAL_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED)
+
+# 이벤트 종류
+EVENT_STATUS = "status"
+EVENT_PAGE = "page"
+EVENT_VERDICTS = "verdicts"
+EVENT_RESULT = "result"
+
+# 작업 취소 요청 확인 간격 (초, 진행 이벤트마다 데이터베이스를 읽지 않도록 제한)
+CANCEL_CHECK_INTERVAL = 1.0
+
+# 보존 기간이 지난 작업을 정리하는 간격 (초)
+PURGE_INTERVAL = 3600.0
+
+
+class JobStore:
+    """
+    작업 큐, 상태 및 진행 이벤트 저장소 (SQLite, 여러 프로세스에서 공유)
+    """
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        # 삭제한 비밀 값이 데이터베이스 파일의 빈 페이지에 남지 않도록 0으로 덮어씀 (WAL 파일에는 체크포인트 전까지 남음)
+        self._conn.execute("PRAGMA secure_delete = ON")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+            """)
+            # 작업 큐 정보 (이전 버전 데이터베이스에는 없는 열)
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            for column, definition in (
+                ("attempts", "INTEGER NOT NULL DEFAULT 0"),
+                ("worker_id", "TEXT"),
+                ("heartbeat_at", "REAL"),
+                ("cancel_requested", "INTEGER NOT NULL DEFAULT 0")
+            ):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {definition}")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_events (
+                    job_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    type TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, seq)
+                )
+            """)
+            # API 키 등 비밀 값 (평문, 작업이 끝나면 삭제)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_secrets (
+                    job_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL
+                )
+            """)
+
+    @staticmethod
+    def _to_dict(row: Any) -> Dict[str, Any]:
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+    def create(self, job_type: str, params: Dict[str, Any], secrets: Optional[Dict[str, Any]] = None) -> str:
+        """
+        작업 등록
+
+        Args:
+            job_type: 작업 종류 (crawl, evaluate)
+            params: 작업 파라미터 (API 키 등 비밀 값은 넣지 않음)
+            secrets: 실행에만 사용할 비밀 값 (작업이 끝나면 삭제)
+
+        Returns:
+            작업 ID
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, type, status, params, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, job_type, STATUS_QUEUED, json.dumps(params, ensure_ascii=False), time.time())
+            )
+            if secrets:
+                self._conn.execute(
+                    "INSERT INTO job_secrets (job_id, data) VALUES (?, ?)", (job_id, json.dumps(secrets))
+                )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, job_type: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        최근 등록된 작업 목록
+
+        Args:
+            status: 상태 필터
+            job_type: 작업 종류 필터
+            limit: 최대 건수
+
+        Returns:
+            작업 목록 (최근 등록 순)
+        """
+        query = "SELECT * FROM jobs WHERE 1 = 1"
+        args: List[Any] = []
+        if status:
+            query += " AND status = ?"
+            args.append(status)
+        if job_type:
+            query += " AND type = ?"
+            args.append(job_type)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def claim(self, worker_id: str, job_types: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        가장 오래 기다린 작업을 가져가 실행 상태로 변경 (여러 작업자가 동시에 호출해도 한 작업자만 가져감)
+
+        Args:
+            worker_id: 작업자 ID
+            job_types: 가져갈 작업 종류 (None이면 전체)
+
+        Returns:
+            작업 정보 (secrets 포함), 대기 중인 작업이 없으면 None
+        """
+        type_filter = ""
+        args: List[Any] = [worker_id, time.time(), time.time(), STATUS_RUNNING, STATUS_QUEUED]
+        if job_types:
+            type_filter = f" AND type IN ({', '.join('?' for _ in job_types)})"
+            args.extend(job_types)
+        with self._lock, self._conn:
+            row = self._conn.execute(f"""
+                UPDATE jobs SET worker_id = ?, started_at = ?, heartbeat_at = ?, status = ?, attempts = attempts + 1
+                WHERE id = (
+                    SELECT id FROM jobs WHERE status = ?{type_filter} ORDER BY created_at LIMIT 1
+                )
+                RETURNING *
+            """, args).fetchone()
+            if row is None:
+                return None
+            secrets = self._conn.execute("SELECT data FROM job_secrets WHERE job_id = ?", (row["id"],)).fetchone()
+        job = self._to_dict(row)
+        job["secrets"] = json.loads(secrets["data"]) if secrets else {}
+        return job
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """
+        실행 중인 작업의 하트비트 기록
+
+        Returns:
+            이 작업자가 아직 작업을 맡고 있으면 True (멈춘 작업으로 처리되어 다시 대기열에 들어갔거나
+            다른 작업자가 가져갔으면 False)
+        """
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND worker_id = ? AND status = ?",
+                (time.time(), job_id, worker_id, STATUS_RUNNING)
+            ).rowcount > 0
+
+    def owns(self, job_id: str, worker_id: str) -> bool:
+        """
+        작업자가 실행 중인 작업을 아직 맡고 있는지 여부
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE id = ? AND worker_id = ? AND status = ?", (job_id, worker_id, STATUS_RUNNING)
+            ).fetchone()
+        return row is not None
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        worker_id: Optional[str] = None
+    ) -> bool:
+        """
+        작업 종료 상태 기록 (비밀 값 삭제)
+
+        Args:
+            worker_id: 작업을 실행한 작업자 ID (지정하면 이 작업자가 아직 작업을 맡고 있을 때만 기록)
+
+        Returns:
+            기록했으면 True
+        """
+        owner_filter = ""
+        args: List[Any] = [status, json.dumps(result, ensure_ascii=False) if result is not None else None,
+                           error, time.time(), job_id]
+        if worker_id is not None:
+            owner_filter = " AND worker_id = ?"
+            args.append(worker_id)
+        with self._lock, self._conn:
+            updated = self._conn.execute(
+                f"UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?{owner_filter}", args
+            ).rowcount
+            if not updated:
+                return False
+            self._conn.execute("DELETE FROM job_secrets WHERE job_id = ?", (job_id,))
+        return True
+
+    def request_cancel(self, job_id: str) -> Optional[str]:
+        """
+        작업 취소 요청 (대기 중이면 바로 취소, 실행 중이면 작업자가 다음 진행 단계에서 중단)
+
+        Returns:
+            변경 후 상태 (작업이 없으면 None)
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status IN (?, ?)",
+                (job_id, STATUS_QUEUED, STATUS_RUNNING)
+            )
+            cancelled = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status = ?",
+                (STATUS_CANCELLED, time.time(), job_id, STATUS_QUEUED)
+            ).rowcount
+            if cancelled:
+                self._conn.execute("DELETE FROM job_secrets WHERE job_id = ?", (job_id,))
+                # 실행 전에 취소된 작업은 작업자가 결과 이벤트를 남기지 않으므로 상태와 함께 기록
+                self._insert_event(job_id, EVENT_RESULT, {"status": STATUS_CANCELLED, "result": None})
+            row = self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row["status"] if row else None
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def recover_stale(self, stale_seconds: float, max_attempts: int) -> Dict[str, str]:
+        """
+        작업자가 멈춘(하트비트가 끊긴) 실행 중 작업 복구
+        시도 횟수가 남았으면 다시 대기열에 넣고, 아니면 실패 처리 (취소 요청된 작업은 취소 처리)
+
+        Returns:
+            작업 ID -> 변경된 상태
+        """
+        now = time.time()
+        recovered: Dict[str, str] = {}
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, attempts, cancel_requested FROM jobs WHERE status = ? AND COALESCE(heartbeat_at, 0) < ?",
+                (STATUS_RUNNING, now - stale_seconds)
+            ).fetchall()
+            for row in rows:
+                if row["cancel_requested"]:
+                    status = STATUS_CANCELLED
+                elif row["attempts"] >= max_attempts:
+                    status = STATUS_FAILED
+                else:
+                    status = STATUS_QUEUED
+                updated = self._conn.execute(
+                    "UPDATE jobs SET status = ?, worker_id = NULL, error = ?, finished_at = ? "
+                    "WHERE id = ? AND status = ? AND COALESCE(heartbeat_at, 0) < ?",
+                    (status, "Worker stopped responding" if status == STATUS_FAILED else None,
+                     now if status in TERMINAL_STATUSES else None, row["id"], STATUS_RUNNING, now - stale_seconds)
+                ).rowcount
+                if updated:
+                    recovered[row["id"]] = status
+                    self._insert_event(row["id"], EVENT_STATUS, {"status": status})
+                    if status in TERMINAL_STATUSES:
+                        self._conn.execute("DELETE FROM job_secrets WHERE job_id = ?", (row["id"],))
+                        self._insert_event(row["id"], EVENT_RESULT, {"status": status, "result": None})
+        return recovered
+
+    def purge(self, retention_seconds: float) -> int:
+        """
+        보존 기간이 지난 종료된 작업과 이벤트 삭제
+
+        Returns:
+            삭제된 작업 수
+        """
+        cutoff = time.time() - retention_seconds
+        statuses = ", ".join("?" for _ in TERMINAL_STATUSES)
+        with self._lock, self._conn:
+            job_ids = [row["id"] for row in self._conn.execute(
+                f"SELECT id FROM jobs WHERE status IN ({statuses}) AND finished_at < ?", (*TERMINAL_STATUSES, cutoff)
+            )]
+            for job_id in job_ids:
+                self._conn.execute("DELETE FROM job_events WHERE job_id = ?", (job_id,))
+                self._conn.execute("DELETE FROM job_secrets WHERE job_id = ?", (job_id,))
+                self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        return len(job_ids)
+
+    def _insert_event(self, job_id: str, event_type: str, data: Dict[str, Any]) -> int:
+        # 순번 계산과 삽입을 한 문장으로 실행하여 여러 프로세스가 기록해도 순번이 겹치지 않음
+        return self._conn.execute("""
+            INSERT INTO job_events (job_id, seq, type, data, created_at)
+            SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ?, ? FROM job_events WHERE job_id = ?
+            RETURNING seq
+        """, (job_id, event_type, json.dumps(data, ensure_ascii=False), time.time(), job_id)).fetchone()[0]
+
+    def add_event(self, job_id: str, event_type: str, data: Dict[str, Any]) -> int:
+        """
+        진행 이벤트 추가
+
+        Returns:
+            작업 내 이벤트 순번 (1부터 시작)
+        """
+        with self._lock, self._conn:
+            return self._insert_event(job_id, event_type, data)
+
+    def poll_events(
+        self, job_id: str, after_seq: int = 0, limit: int = 500
+    ) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """
+        작업 상태와 순번 이후의 진행 이벤트를 한 번에 조회 (이벤트 스트림의 주기적 확인용)
+        상태를 먼저 읽으므로 종료 상태를 본 뒤에는 종료 직전 이벤트까지 함께 조회됨
+
+        Returns:
+            (작업 상태 (작업이 없으면 None), [{"seq", "type", "data"}] 목록)
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            rows = self._conn.execute(
+                "SELECT seq, type, data FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, after_seq, limit)
+            ).fetchall()
+        events = [{"seq": event["seq"], "type": event["type"], "data": json.loads(event["data"])} for event in rows]
+        return (row["status"] if row else None), events
+
+
+class JobContext:
+    """
+    실행 중인 작업의 이벤트 기록 및 취소 요청 확인
+    """
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+        self._cancelled = False
+        self._checked_at = 0.0
+        # 하트비트 기록에 실패하여 작업을 더 이상 맡고 있지 않음 (다른 작업자가 다시 실행)
+        self.lost = False
+
+    def emit(self, event_type: str, data: Dict[str, Any]) -> None:
+        self.store.add_event(self.job_id, event_type, data)
+
+    def cancelled(self) -> bool:
+        """
+        취소 요청 여부 (CANCEL_CHECK_INTERVAL마다 한 번만 저장소 확인, 작업을 잃었으면 항상 True)
+        """
+        if self.lost:
+            return True
+        now = time.monotonic()
+        if not self._cancelled and now - self._checked_at >= CANCEL_CHECK_INTERVAL:
+            self._checked_at = now
+            self._cancelled = self.store.is_cancel_requested(self.job_id)
+        return self._cancelled
+
+
+class _EventWriter:
+    """
+    이벤트를 큐에 넣고 별도 스레드에서 저장소에 기록
+    (크롤링 이벤트 루프 스레드의 콜백이 SQLite 쓰기나 잠금 대기로 페이지 요청을 멈추지 않도록 함)
+    """
+    def __init__(self, context: JobContext):
+        self.context = context
+        # 기록 스레드가 확인한 취소 요청 여부 (콜백은 이 값만 읽음)
+        self.cancelled = False
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"job-events-{context.job_id}", daemon=True)
+        self._thread.start()
+
+    def put(self, event_type: str, data: Dict[str, Any]) -> None:
+        self._queue.put((event_type, data))
+
+    def _run(self) -> None:
+        while True:
+            try:
+                entry = self._queue.get(timeout=CANCEL_CHECK_INTERVAL)
+            except queue.Empty:
+                entry = ()
+            if entry is None:
+                return
+            try:
+                if entry:
+                    self.context.emit(*entry)
+                self.cancelled = self.context.cancelled()
+            except Exception as e:
+                logger.error(f"Error writing events for job {self.context.job_id}: {str(e)}")
+
+    def close(self) -> None:
+        """
+        남은 이벤트를 모두 기록할 때까지 대기
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+
+# 작업 핸들러: (작업 파라미터, 비밀 값, 실행 컨텍스트) -> 작업 결과
+JobHandler = Callable[[Dict[str, Any], Dict[str, Any], JobContext], Dict[str, Any]]
+
+
+def _results_relpath(file_path: str) -> str:
+    return os.path.relpath(file_path, os.path.dirname(settings.RESULTS_PATH))
+
+
+def run_crawl_job(params: Dict[str, Any], secrets: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """
+    크롤링 작업 실행 (페이지마다 수집한 기사를 page 이벤트로 기록, 취소되면 저장하지 않음)
+
+    Returns:
+        /api/crawler/crawl 응답과 같은 형식의 결과
+    """
+    from app.services.crawler_service import get_crawler_service
+
+    # 크롤링 이벤트 루프 스레드에서 호출되므로 큐에 넣고 바로 반환 (기록과 취소 확인은 기록 스레드에서)
+    events = _EventWriter(context)
+
+    def on_page(keyword: str, page: int, items: List[Dict[str, Any]]) -> bool:
+        events.put(EVENT_PAGE, {
+            "keyword": keyword,
+            "page": page,
+            "items": [
+                {"title": item.get('title', ""), "url": item.get('url', ""),
+                 "source": item.get('source', ""), "date": item.get('date', "")}
+                for item in items
+            ]
+        })
+        return not events.cancelled
+
+    crawler_service = get_crawler_service()
+    try:
+        news_items, errors, stats = crawler_service.crawl_keywords_with_stats(
+            params["keywords"],
+            params.get("max_news_per_keyword") or 50,
+            seen_mode=params.get("seen_mode"),
+            incremental=params.get("incremental"),
+            on_page=on_page
+        )
+    finally:
+        events.close()
+    if context.cancelled():
+        return {"success": False, "message": "Crawl cancelled", "item_count": len(news_items), "stats": stats}
+    if not news_items:
+        return {"success": False, "message": "No news items found for the given keywords",
+                "errors": errors, "stats": stats}
+
+    file_path, download_path = crawler_service.save_results(news_items)
+    if not file_path:
+        return {"success": False, "message": "Failed to save crawler results",
+                "errors": {"save_error": "Could not save results to file"}, "stats": stats}
+
+    return {
+        "success": True,
+        "message": f"Successfully crawled {len(news_items)} news items",
+        "file_path": _results_relpath(file_path),
+        "download_path": download_path,
+        "item_count": len(news_items),
+        "keywords": params["keywords"],
+        "errors": errors or None,
+        "stats": stats
+    }
+
+
+def run_evaluate_job(params: Dict[str, Any], secrets: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """
+    관련성 평가 작업 실행 (평가를 마친 기사를 verdicts 이벤트로 기록, 취소되면 체크포인트를 남기고 중단)
+
+    Returns:
+        /api/relevance/evaluate 응답과 같은 형식의 결과
+    """
+    from app.services.relevance_service import RelevanceService
+
+    file_path = params["file_path"]
+    if not os.path.isabs(file_path):
+        file_path = os.path.join(settings.RESULTS_PATH, file_path)
+    if not os.path.exists(file_path):
+        return {"success": False, "message": f"File not found: {params['file_path']}",
+                "errors": {"file_error": "File not found"}}
+
+    # 등록 시 서버 설정 키를 쓰도록 표시된 작업만 OPENAI_API_KEY 사용
+    api_key = settings.OPENAI_API_KEY if params.get("use_server_api_key") else secrets.get("api_key")
+    if not api_key:
+        return {"success": False, "message": "API key is not available for this job",
+                "errors": {"api_key_error": "API key is not available"}}
+
+    def on_progress(progress: Dict[str, Any]) -> bool:
+        context.emit(EVENT_VERDICTS, progress)
+        return not context.cancelled()
+
+    relevance_service = RelevanceService(
+        api_key=api_key, model=params.get("model") or "gpt-3.5-turbo",
+        max_workers=params.get("max_workers"), batch_size=params.get("batch_size"),
+        use_cache=params.get("use_cache"), use_rules=params.get("use_rules"), use_triage=params.get("use_triage")
+    )
+    output_file, stats = relevance_service.process_file(file_path, on_progress=on_progress)
+    if stats.get("cancelled"):
+        return {"success": False, "message": "Evaluation cancelled (checkpoint kept for resuming)"}
+    if not output_file:
+        error = stats.get("error", "Unknown error")
+        return {"success": False, "message": "Failed to process file for relevance evaluation",
+                "errors": {"process_error": str(error)}}
+
+    return {
+        "success": True,
+        "message": f"Successfully evaluated relevance for file: {os.path.basename(file_path)}",
+        "file_path": _results_relpath(output_file),
+        "stats": stats
+    }
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    JOB_TYPE_CRAWL: run_crawl_job,
+    JOB_TYPE_EVALUATE: run_evaluate_job
+}
+
+
+class JobWorker:
+    """
+    큐에서 작업을 가져가 하나씩 실행하는 작업자 (API 프로세스의 스레드 또는 worker.py 프로세스에서 실행)
+    """
+    def __init__(self, store: JobStore, worker_id: Optional[str] = None, job_types: Optional[Sequence[str]] = None):
+        """
+        Args:
+            store: 작업 저장소
+            worker_id: 작업자 ID (기본값: 호스트명:프로세스ID:스레드 이름)
+            job_types: 실행할 작업 종류 (None이면 전체)
+        """
+        self.store = store
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+        self.job_types = list(job_types) if job_types else None
+        self._current_context: Optional[JobContext] = None
+        self._last_purge = 0.0
+
+    def _heartbeat_loop(self, done: threading.Event) -> None:
+        # 긴 평가 요청 중에도 다른 작업자가 멈춘 작업으로 오인하지 않도록 주기적으로 기록
+        while not done.wait(settings.JOB_HEARTBEAT_INTERVAL):
+            context = self._current_context
+            if context is None:
+                continue
+            try:
+                if not self.store.heartbeat(context.job_id, self.worker_id):
+                    # 멈춘 작업으로 처리되어 다시 대기열에 들어간 작업은 중단 (같은 작업을 두 작업자가 실행하지 않도록)
+                    logger.warning(f"Worker {self.worker_id} lost job {context.job_id}, stopping")
+                    context.lost = True
+            except Exception as e:
+                logger.error(f"Error recording heartbeat for job {context.job_id}: {str(e)}")
+
+    def _maintain(self) -> None:
+        for job_id, status in self.store.recover_stale(settings.JOB_STALE_SECONDS, settings.JOB_MAX_ATTEMPTS).items():
+            logger.warning(f"Recovered stale job {job_id}: {status}")
+
+        now = time.monotonic()
+        if now - self._last_purge >= PURGE_INTERVAL:
+            self._last_purge = now
+            purged = self.store.purge(settings.JOB_RETENTION_DAYS * 24 * 60 * 60)
+            if purged:
+                logger.info(f"Purged {purged} jobs older than {settings.JOB_RETENTION_DAYS} days")
+
+    def run_job(self, job: Dict[str, Any]) -> str:
+        """
+        가져간 작업 실행 후 종료 상태 기록 (실행 중 작업을 잃었으면 기록하지 않음)
+
+        Returns:
+            종료 상태 (작업을 잃어 다른 시도로 넘어갔으면 queued)
+        """
+        job_id, job_type = job["id"], job["type"]
+        context = JobContext(self.store, job_id)
+        context.emit(EVENT_STATUS, {"status": STATUS_RUNNING, "worker_id": self.worker_id, "attempt": job["attempts"]})
+        logger.info(f"Worker {self.worker_id} running {job_type} job {job_id}")
+
+        self._current_context = context
+        try:
+            result = JOB_HANDLERS[job_type](job["params"], job.get("secrets") or {}, context)
+            status = STATUS_SUCCEEDED if result.get("success") else STATUS_FAILED
+        except Exception as e:
+            logger.error(f"Error running {job_type} job {job_id}: {str(e)}")
+            traceback.print_exc()
+            status, result = STATUS_FAILED, {"success": False, "message": str(e)}
+        finally:
+            self._current_context = None
+
+        # 다른 시도로 넘어간 작업은 결과를 남기지 않음 (다시 실행 중인 시도의 상태를 덮어쓰지 않도록)
+        if context.lost or not self.store.owns(job_id, self.worker_id):
+            logger.warning(f"Discarding result of {job_type} job {job_id}: no longer owned by {self.worker_id}")
+            return STATUS_QUEUED
+
+        if status != STATUS_SUCCEEDED and self.store.is_cancel_requested(job_id):
+            status = STATUS_CANCELLED
+
+        # 이벤트 스트림은 종료 상태를 본 뒤 남은 이벤트를 모두 보내고 끝나므로 결과 이벤트를 먼저 기록
+        context.emit(EVENT_RESULT, {"status": status, "result": result})
+        self.store.finish(
+            job_id, status, result=result, error=None if result.get("success") else result.get("message"),
+            worker_id=self.worker_id
+        )
+        logger.info(f"Finished {job_type} job {job_id}: {status}")
+        return status
+
+    def run_once(self) -> bool:
+        """
+        대기 중인 작업 하나 실행
+
+        Returns:
+            작업을 실행했으면 True
+        """
+        self._maintain()
+        job = self.store.claim(self.worker_id, self.job_types)
+        if job is None:
+            return False
+        if job["type"] not in JOB_HANDLERS:
+            result = {"success": False, "message": f"Unknown job type: {job['type']}"}
+            self.store.add_event(job["id"], EVENT_RESULT, {"status": STATUS_FAILED, "result": result})
+            self.store.finish(job["id"], STATUS_FAILED, result=result, error=result["message"], worker_id=self.worker_id)
+            return True
+        self.run_job(job)
+        return True
+
+    def run_forever(self, stop_event: Any, wake_event: Optional[threading.Event] = None) -> None:
+        """
+        중지 요청이 있을 때까지 작업 실행 (실행 중인 작업은 끝까지 실행)
+
+        Args:
+            stop_event: 중지 이벤트 (threading.Event 또는 multiprocessing.Event)
+            wake_event: 새 작업 등록 시 설정되는 이벤트 (없으면 JOB_WORKER_POLL_INTERVAL마다 큐 확인)
+        """
+        done = threading.Event()
+        threading.Thread(target=self._heartbeat_loop, args=(done,), daemon=True).start()
+        try:
+            while not stop_event.is_set():
+                try:
+                    if self.run_once():
+                        continue
+                except Exception as e:
+                    logger.error(f"Worker {self.worker_id} error: {str(e)}")
+                if wake_event is not None:
+                    wake_event.wait(settings.JOB_WORKER_POLL_INTERVAL)
+                    wake_event.clear()
+                else:
+                    stop_event.wait(settings.JOB_WORKER_POLL_INTERVAL)
+        finally:
+            done.set()
+
+
+class JobManager:
+    """
+    작업 등록/취소 및 API 프로세스 안의 작업 스레드 관리
+    """
+    def __init__(self, store: JobStore, local_workers: int):
+        """
+        Args:
+            store: 작업 저장소
+            local_workers: API 프로세스 안에서 작업을 실행할 스레드 수 (0이면 worker.py 프로세스만 실행)
+        """
+        self.store = store
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads: List[threading.Thread] = []
+        for index in range(max(0, local_workers)):
+            worker = JobWorker(store, worker_id=f"{socket.gethostname()}:{os.getpid()}:api-{index + 1}")
+            thread = threading.Thread(
+                target=worker.run_forever, args=(self._stop, self._wake), name=f"job-{index + 1}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, job_type: str, params: Dict[str, Any], secrets: Optional[Dict[str, Any]] = None) -> str:
+        """
+        작업 등록
+
+        Args:
+            job_type: 작업 종류
+            params: 작업 파라미터 (저장소에 기록됨)
+            secrets: API 키 등 작업이 끝나면 삭제할 값
+
+        Returns:
+            작업 ID
+        """
+        if job_type not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job type: {job_type}")
+        job_id = self.store.create(job_type, params, secrets)
+        self.store.add_event(job_id, EVENT_STATUS, {"status": STATUS_QUEUED})
+        self._wake.set()
+        logger.info(f"Submitted {job_type} job {job_id}")
+        return job_id
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """
+        작업 취소 요청
+
+        Returns:
+            변경 후 상태 (작업이 없으면 None)
+        """
+        status = self.store.request_cancel(job_id)
+        if status == STATUS_RUNNING:
+            self.store.add_event(job_id, EVENT_STATUS, {"status": STATUS_RUNNING, "cancel_requested": True})
+        logger.info(f"Cancel requested for job {job_id}: {status}")
+        return status
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    프로세스 전역 작업 관리자 반환 (처음 호출 시 작업 스레드 시작)
+    """
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(JobStore(settings.JOB_DB_PATH), settings.JOB_LOCAL_WORKERS)
+        return _job_manager
+
+
+def shutdown_job_manager() -> None:
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is not None:
+            _job_manager.shutdown()
+            _job_manager = None
+
+
+def run_worker_process(stop_event: Any, job_types: Optional[List[str]] = None) -> None:
+    """
+    작업 프로세스 진입점 (worker.py에서 프로세스마다 실행)
+
+    Args:
+        stop_event: 중지 이벤트 (multiprocessing.Event)
+        job_types: 실행할 작업 종류 (None이면 전체)
+    """
+    # Ctrl+C는 부모 프로세스가 받아 중지 이벤트로 전달
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    worker = JobWorker(JobStore(settings.JOB_DB_PATH), job_types=job_types)
+    logger.info(f"Worker {worker.worker_id} started")
+    worker.run_forever(stop_event)
+    logger.info(f"Worker {worker.worker_id} stopped")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+LLM API 요청 스케줄러
+분당 요청 수(RPM)와 분당 토큰 수(TPM) 예산을 토큰 버킷으로 나누어 요청을 보내기 전에 대기하고,
+429 응답을 받으면 모든 요청을 잠시 멈추고 속도를 줄임 (정상 응답이 이어지면 설정값까지 회복)
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.utils.rate_limiter import TokenBucket
+
+# 버킷 용량 (몇 초 분량의 예산을 한 번에 쓸 수 있는지)
+BURST_SECONDS = 10.0
+
+
+def _minute_budget_bucket(per_minute: float) -> TokenBucket:
+    # 어느 60초 구간에서도 (버킷 용량 + 60초 동안 보충량)이 분당 한도를 넘지 않도록 속도를 정함
+    rate = per_minute / (60.0 + BURST_SECONDS)
+    return TokenBucket(rate, max(1, int(rate * BURST_SECONDS)))
+
+
+class LLMRateScheduler:
+    """
+    RPM/TPM 예산 기반 요청 속도 조절기 (스레드 안전)
+    """
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        """
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (0이면 제한 없음)
+            tokens_per_minute: 분당 최대 토큰 수 (프롬프트 + 최대 응답 토큰, 0이면 제한 없음)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_bucket: Optional[TokenBucket] = None
+        self.token_bucket: Optional[TokenBucket] = None
+        if requests_per_minute > 0:
+            self.request_bucket = _minute_budget_bucket(requests_per_minute)
+        if tokens_per_minute > 0:
+            self.token_bucket = _minute_budget_bucket(tokens_per_minute)
+
+        self._lock = threading.Lock()
+        self._stats: Dict[str, float] = {
+            "requests": 0,
+            "tokens_reserved": 0,
+            "throttled_responses": 0,
+            "wait_seconds": 0.0
+        }
+
+    def acquire(self, tokens: int) -> float:
+        """
+        요청 1건과 토큰을 예약하고 예산이 찰 때까지 대기
+
+        Args:
+            tokens: 요청이 사용할 토큰 수 (추정 프롬프트 토큰 + 최대 응답 토큰)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        # 두 버킷을 동시에 예약하고 더 긴 쪽만큼 대기
+        wait = 0.0
+        if self.request_bucket is not None:
+            wait = max(wait, self.request_bucket.reserve(1))
+        if self.token_bucket is not None:
+            wait = max(wait, self.token_bucket.reserve(tokens))
+        if wait > 0:
+            time.sleep(wait)
+
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["tokens_reserved"] += tokens
+            self._stats["wait_seconds"] += wait
+        return wait
+
+    def on_success(self) -> None:
+        for bucket in (self.request_bucket, self.token_bucket):
+            if bucket is not None:
+                bucket.on_success()
+
+    def on_throttle(self, pause: float) -> None:
+        """
+        429 응답 시 pause 초 동안 모든 요청을 멈추고 속도를 절반으로 줄임
+        """
+        for bucket in (self.request_bucket, self.token_bucket):
+            if bucket is not None:
+                bucket.on_throttle(pause)
+        with self._lock:
+            self._stats["throttled_responses"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        누적 요청 통계와 현재 속도
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        stats["wait_seconds"] = round(stats["wait_seconds"], 2)
+        stats["rpm_limit"] = self.requests_per_minute
+        stats["tpm_limit"] = self.tokens_per_minute
+        if self.request_bucket is not None:
+            stats["current_rpm"] = round(self.request_bucket.rate * (60.0 + BURST_SECONDS), 1)
+        if self.token_bucket is not None:
+            stats["current_tpm"] = round(self.token_bucket.rate * (60.0 + BURST_SECONDS), 1)
+        return stats
+
+
+_llm_scheduler: Optional[LLMRateScheduler] = None
+_llm_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMRateScheduler:
+    """
+    프로세스 전역 LLM 요청 스케줄러 반환 (같은 API 키를 쓰는 모든 평가 작업이 예산을 공유)
+    """
+    global _llm_scheduler
+    with _llm_scheduler_lock:
+        if _llm_scheduler is None:
+            _llm_scheduler = LLMRateScheduler(settings.RELEVANCE_RPM_LIMIT, settings.RELEVANCE_TPM_LIMIT)
+        return _llm_scheduler
@@ -7,35 +7,205 @@ import requests
 import json
 import logging
 import re
-from typing import Dict, Any, Optional, Tuple, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, Tuple, List
 import traceback
 
-from app.utils.csv_utils import read_csv, save_to_csv, get_csv_statistics
+from requests.adapters import HTTPAdapter
+
+from app.utils.csv_utils import read_csv, save_to_csv
+from app.utils.columnar_utils import get_result_statistics, save_columnar_copy
+from app.utils.journal_utils import CheckpointJournal, file_fingerprint
+from app.utils.rate_limiter import backoff_delay
+from app.utils.token_utils import estimate_tokens
+from app.services.dedup_service import assign_clusters, split_entity_clusters
+from app.services.llm_scheduler import get_llm_scheduler
+from app.services.article_store import store_articles
+from app.services.file_catalog import catalog_file
+from app.services.rule_filter import get_rule_classifier
+from app.services.triage_service import TRIAGE_REASON, decide, get_triage_model
+from app.services.verdict_cache import get_verdict_cache, verdict_key
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 버전 (평가 기준이나 프롬프트를 바꾸면 올려서 캐시된 이전 결과를 무효화)
+PROMPT_VERSION = "1"
+
+# API 오류로 얻은 결과의 이유 접두어 (캐시하지 않음)
+API_ERROR_REASON = "API 오류"
+REQUEST_ERROR_REASON = "요청 처리 중 오류"
+
+# 카테고리 목록 (우선순위 순)
+CATEGORIES = ("자사 언급기사", "업계 관련기사", "건강기능식품·펫푸드", "기타")
+
+# 여러 기사를 한 번에 평가하는 프롬프트 (평가 기준은 기사별 프롬프트와 동일, 결과는 JSON 배열)
+BATCH_PROMPT_TEMPLATE = """
+당신은 화장품 업계 정보 분석가입니다. 아래 {count}개 기사 각각에 대해 적합성과 카테고리를 판단해주세요.
+
+### 첫 번째 태스크: 적합성 판단 ###
+각 기사가 화장품 연구원이나 화장품 ODM 기업 임직원에게 전달해도 될만한 가치가 있는지 평가해주세요.
+
+중요: 제목과 내용을 모두 면밀히 검토하여 다음 기준에 따라 판단해주세요.
+
+1. 화장품 업계 트렌드나 시장 현황을 제공하는지
+2. 화장품 원료나 기술에 관한 정보를 담고 있는지
+3. 경쟁사나 산업 내 중요한 변화를 담고 있는지
+4. 규제나 법적 변경사항에 대한 정보를 포함하는지
+5. 화장품 연구 개발이나 제조에 영향을 줄 수 있는 내용인지
+6. 화장품 ODM 기업 활동이나 전략에 대한 정보를 담고 있는지
+7. 화장품 산업 내 협업이나 인수합병 정보를 포함하는지
+8. 화장품 회사들의 실적이나 주가 정보를 담고 있는지
+9. 유의미한 국제 무역이나 관세 정책 정보를 담고 있는지
+
+위 항목 중 하나라도 해당된다면 가치가 있다고 판단하고 true로, 그렇지 않다면 false로 응답해주세요.
+
+### 두 번째 태스크: 카테고리 분류 ###
+기사의 내용을 기반으로 다음 4가지 카테고리 중 하나로 분류해주세요:
+
+1. 자사 언급기사: 코스맥스(회사명 "코스맥스", "Cosmax", "코스맥스비티아이" 등)가 직접 언급된 기사
+2. 업계 관련기사: 코스맥스 외 화장품 회사(특히 화장품 제조회사)에 관한 기사 (예: 한국콜마, 아모레퍼시픽, LG생활건강, 코스메카코리아 등)
+3. 건강기능식품·펫푸드: 건강기능식품, 영양제, 펫푸드, 마이크로바이옴, 식품의약품안전처 관련 기사
+4. 기타: 위 세 카테고리에 해당하지 않는 기사 (예: K유통, 일반 소비재 등)
+
+기사가 여러 카테고리에 해당할 경우, 더 높은 우선순위의 카테고리를 선택하세요 (우선순위: 자사 언급기사 > 업계 관련기사 > 건강기능식품·펫푸드 > 기타).
+
+### 기사 목록 ###
+{articles}
+
+응답 형식:
+기사마다 하나씩, 아래 형식의 JSON 배열만 출력해주세요. index는 기사 앞의 번호입니다.
+[{{"index": 1, "relevant": true, "reason": "간략한 이유 설명", "category": "자사 언급기사/업계 관련기사/건강기능식품·펫푸드/기타 중 하나"}}]
+"""
+
+BATCH_ARTICLE_TEMPLATE = """[{index}]
+제목: {title}
+출처: {source}
+날짜: {date}
+내용: {content}
+검색 키워드: {keyword}
+"""
+
+
+def is_error_verdict(verdict: Tuple[bool, str, str]) -> bool:
+    """
+    API/요청 오류로 얻은 결과인지 확인 (캐시나 체크포인트에 저장하지 않고 다음 실행에서 다시 평가)
+    """
+    return verdict[1].startswith((API_ERROR_REASON, REQUEST_ERROR_REASON))
+
+
+def parse_batch_response(result_text: str, count: int) -> List[Optional[Tuple[bool, str, str]]]:
+    """
+    배치 평가 응답(JSON 배열) 파싱
+    
+    Args:
+        result_text: LLM 응답 텍스트
+        count: 배치의 기사 수
+        
+    Returns:
+        기사 순서대로 (적합성 여부, 적합성 이유, 카테고리) 목록 (누락되거나 형식이 잘못된 기사는 None)
+    """
+    verdicts: List[Optional[Tuple[bool, str, str]]] = [None] * count
+    
+    # 코드 블록 등 앞뒤 텍스트를 제외하고 JSON 배열만 추출
+    match = re.search(r'\[.*\]', result_text, re.DOTALL)
+    if not match:
+        return verdicts
+    try:
+        results = json.loads(match.group(0))
+    except ValueError:
+        return verdicts
+    if not isinstance(results, list):
+        return verdicts
+    
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        index = result.get("index")
+        relevant = result.get("relevant")
+        category = result.get("category")
+        if isinstance(relevant, str) and relevant.lower() in ("true", "false"):
+            relevant = relevant.lower() == "true"
+        if not isinstance(index, int) or not 1 <= index <= count or verdicts[index - 1] is not None:
+            continue
+        if not isinstance(relevant, bool) or category not in CATEGORIES:
+            continue
+        reason = str(result.get("reason") or "").strip() or "이유가 명확히 제시되지 않음"
+        verdicts[index - 1] = (relevant, reason, category)
+    
+    return verdicts
+
+
+# LLM API 호출용 프로세스 전역 세션 (keep-alive 연결을 워커 스레드 간 공유)
+_llm_session: Optional[requests.Session] = None
+_llm_session_lock = threading.Lock()
+
+
+def get_llm_session() -> requests.Session:
+    """
+    연결 풀 크기가 동시 평가 수에 맞춰진 공유 requests 세션 반환
+    """
+    global _llm_session
+    with _llm_session_lock:
+        if _llm_session is None:
+            pool_size = max(1, settings.RELEVANCE_MAX_WORKERS)
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _llm_session = session
+        return _llm_session
+
+
 class RelevanceService:
     """
     뉴스 관련성 평가 서비스
     """
-    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-3.5-turbo",
+        max_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        use_rules: Optional[bool] = None,
+        use_triage: Optional[bool] = None
+    ):
         """
         서비스 초기화
         
         Args:
             api_key: OpenAI API 키
             model: 사용할 LLM 모델 (기본값: gpt-3.5-turbo)
+            max_workers: 동시에 보낼 API 요청 수 (기본값: 설정값)
+            batch_size: 한 요청에 담을 최대 기사 수 (1이면 기사별 요청 / 기본값: 설정값)
+            use_cache: 평가 결과 캐시 사용 여부 (기본값: 설정값)
+            use_rules: 규칙 기반 1차 분류 사용 여부 (기본값: 설정값)
+            use_triage: 로컬 분류기 선별 사용 여부 (학습된 모델이 있을 때만 적용 / 기본값: 설정값)
         """
         self.api_key = api_key
         self.model = model
+        self.max_workers = max(1, max_workers or settings.RELEVANCE_MAX_WORKERS)
+        self.batch_size = max(1, batch_size or settings.RELEVANCE_BATCH_SIZE)
+        self.use_cache = settings.RELEVANCE_CACHE if use_cache is None else use_cache
+        self.use_rules = settings.RELEVANCE_RULE_FILTER if use_rules is None else use_rules
+        self.use_triage = settings.RELEVANCE_TRIAGE if use_triage is None else use_triage
+        self.session = get_llm_session()
+        self.scheduler = get_llm_scheduler()
+        
+        # API 호출 통계
+        self._stats_lock = threading.Lock()
+        self.call_stats: Dict[str, Any] = {}
+        self.reset_call_stats()
         self.headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}"
         }
         
-        # OpenAI API 엔드포인트
-        self.api_url = "https://api.openai.com/v1/chat/completions"
+        # OpenAI API 엔드포인트 (OPENAI_API_BASE로 호환 서버 지정 가능)
+        self.api_url = f"{settings.OPENAI_API_BASE.rstrip('/')}/chat/completions"
         
         # Claude API 사용 시 URL 변경 필요
         # self.api_url = "https://api.anthropic.com/v1/messages"
@@ -45,6 +215,109 @@ class RelevanceService:
         #     "x-api-key": api_key
         # }
     
+    def reset_call_stats(self) -> None:
+        """
+        API 호출 통계 초기화
+        """
+        with self._stats_lock:
+            self.call_stats = {
+                "api_calls": 0,
+                "batch_requests": 0,
+                "batched_articles": 0,
+                "batch_fallbacks": 0,
+                "rule_decided": 0,
+                "triage_decided": 0,
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "cache_evictions": 0,
+                "retries": 0,
+                "throttled_responses": 0,
+                "rate_limit_wait_seconds": 0.0,
+                "prompt_tokens_estimated": 0,
+                "tokens_used": 0
+            }
+    
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self.call_stats[key] += amount
+    
+    def _post_completion(self, prompt: str, max_tokens: int) -> requests.Response:
+        """
+        Chat Completions API 호출
+        
+        RPM/TPM 예산에 맞춰 요청을 보내고, 429/5xx 응답이나 네트워크 오류는 백오프 후 재시도
+        (429이면 Retry-After 동안 모든 요청을 멈춤)
+        
+        Args:
+            prompt: 사용자 프롬프트
+            max_tokens: 최대 응답 토큰 수
+            
+        Returns:
+            API 응답 (재시도 후에도 실패하면 마지막 응답)
+        """
+        # OpenAI API 호출
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.3,
+            "max_tokens": max_tokens
+        }
+        
+        # Claude API 사용 시 페이로드 변경 필요
+        # payload = {
+        #     "model": "claude-3-haiku-20240307",
+        #     "max_tokens": max_tokens,
+        #     "temperature": 0.3,
+        #     "system": "You are a cosmetic industry analyst who evaluates news relevance and categorizes them accurately.",
+        #     "messages": [{"role": "user", "content": prompt}]
+        # }
+        
+        # 분당 토큰 한도에는 최대 응답 토큰도 포함됨
+        prompt_tokens = estimate_tokens(prompt, self.model)
+        max_retries = max(0, settings.RELEVANCE_MAX_RETRIES)
+        for attempt in range(max_retries + 1):
+            waited = self.scheduler.acquire(prompt_tokens + max_tokens)
+            self._count("rate_limit_wait_seconds", waited)
+            self._count("api_calls")
+            self._count("prompt_tokens_estimated", prompt_tokens)
+            try:
+                response = self.session.post(
+                    self.api_url, headers=self.headers, json=payload, timeout=settings.RELEVANCE_REQUEST_TIMEOUT
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= max_retries:
+                    raise
+                delay = backoff_delay(attempt, settings.RELEVANCE_BACKOFF_BASE, settings.RELEVANCE_BACKOFF_MAX)
+                logger.warning(f"LLM API request failed ({str(e)}), retrying in {delay:.1f}s")
+                self._count("retries")
+                time.sleep(delay)
+                continue
+            
+            if response.status_code == 200:
+                self.scheduler.on_success()
+                try:
+                    self._count("tokens_used", int(response.json().get("usage", {}).get("total_tokens", 0)))
+                except (ValueError, TypeError, AttributeError):
+                    pass
+                return response
+            
+            if response.status_code != 429 and response.status_code < 500 or attempt >= max_retries:
+                return response
+            
+            delay = backoff_delay(
+                attempt, settings.RELEVANCE_BACKOFF_BASE, settings.RELEVANCE_BACKOFF_MAX,
+                response.headers.get("Retry-After")
+            )
+            if response.status_code == 429:
+                # 한도 초과는 모든 요청에 해당하므로 전체 요청을 멈추고 속도를 줄임
+                self.scheduler.on_throttle(delay)
+                self._count("throttled_responses")
+            logger.warning(f"LLM API returned {response.status_code}, retrying in {delay:.1f}s")
+            self._count("retries")
+            time.sleep(delay)
+        
+        return response
+    
     def check_article_relevance(self, article: Dict[str, Any]) -> Tuple[bool, str, str]:
         """
         기사의 적합성 판단 및 카테고리 분류
@@ -106,24 +379,7 @@ class RelevanceService:
         """
         
         try:
-            # OpenAI API 호출
-            payload = {
-                "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-                "max_tokens": 300
-            }
-            
-            # Claude API 사용 시 페이로드 변경 필요
-            # payload = {
-            #     "model": "claude-3-haiku-20240307",
-            #     "max_tokens": 300,
-            #     "temperature": 0.3,
-            #     "system": "You are a cosmetic industry analyst who evaluates news relevance and categorizes them accurately.",
-            #     "messages": [{"role": "user", "content": prompt}]
-            # }
-            
-            response = requests.post(self.api_url, headers=self.headers, json=payload)
+            response = self._post_completion(prompt, max_tokens=300)
             
             if response.status_code == 200:
                 response_data = response.json()
@@ -170,19 +426,369 @@ class RelevanceService:
                 return is_relevant, reason, category
             else:
                 logger.error(f"API 오류: {response.status_code}, {response.text}")
-                return False, f"API 오류: {response.status_code}", "기타"
+                return False, f"{API_ERROR_REASON}: {response.status_code}", "기타"
         
         except Exception as e:
             logger.error(f"오류 발생: {str(e)}")
             traceback.print_exc()
-            return False, f"요청 처리 중 오류: {str(e)}", "기타"
+            return False, f"{REQUEST_ERROR_REASON}: {str(e)}", "기타"
+    
+    def _run_concurrently(self, func: Callable[[Any], Any], tasks: List[Any], label: str = "article") -> List[Any]:
+        """
+        작업을 max_workers개 스레드로 동시에 실행 (공유 세션으로 API 호출)
+        
+        Args:
+            func: 작업 함수
+            tasks: 작업 목록
+            label: 진행 로그에 표시할 작업 이름
+            
+        Returns:
+            작업 순서대로 결과 목록
+        """
+        total = len(tasks)
+        completed = 0
+        progress_lock = threading.Lock()
+        
+        def run(task: Any) -> Any:
+            nonlocal completed
+            result = func(task)
+            with progress_lock:
+                completed += 1
+                # 진행 로그
+                if completed % 10 == 0 or completed == total:
+                    logger.info(f"Evaluated {label} {completed}/{total}")
+            return result
+        
+        if self.max_workers == 1 or total <= 1:
+            return [run(task) for task in tasks]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, total), thread_name_prefix="relevance") as executor:
+            # map은 입력 순서대로 결과를 반환
+            return list(executor.map(run, tasks))
+    
+    def _format_batch_article(self, index: int, article: Dict[str, Any]) -> str:
+        return BATCH_ARTICLE_TEMPLATE.format(
+            index=index,
+            title=article.get('title', ""),
+            source=article.get('source', ""),
+            date=article.get('date', ""),
+            content=article.get('content', ""),
+            keyword=article.get('keyword', "")
+        )
+    
+    def plan_batches(self, articles: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        프롬프트 토큰 한도 안에서 기사를 배치로 나눔
+        
+        기사 수는 batch_size, 프롬프트 토큰은 RELEVANCE_BATCH_MAX_PROMPT_TOKENS를 넘지 않도록
+        순서대로 채우며, 한도보다 긴 기사는 단독 배치가 됨
+        
+        Args:
+            articles: 평가할 기사 목록
+            
+        Returns:
+            배치별 기사 위치 목록
+        """
+        base_tokens = estimate_tokens(BATCH_PROMPT_TEMPLATE, self.model)
+        max_tokens = settings.RELEVANCE_BATCH_MAX_PROMPT_TOKENS
+        
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = base_tokens
+        for idx, article in enumerate(articles):
+            article_tokens = estimate_tokens(self._format_batch_article(len(current) + 1, article), self.model)
+            if current and (len(current) >= self.batch_size or current_tokens + article_tokens > max_tokens):
+                batches.append(current)
+                current, current_tokens = [], base_tokens
+            current.append(idx)
+            current_tokens += article_tokens
+        if current:
+            batches.append(current)
+        return batches
     
-    def process_file(self, file_path: str) -> Tuple[Optional[str], Dict[str, Any]]:
+    def check_batch_relevance(self, articles: List[Dict[str, Any]]) -> List[Optional[Tuple[bool, str, str]]]:
+        """
+        여러 기사를 한 번의 요청으로 평가
+        
+        Args:
+            articles: 평가할 기사 목록
+            
+        Returns:
+            기사 순서대로 (적합성 여부, 적합성 이유, 카테고리) 목록 (응답에서 결과를 얻지 못한 기사는 None)
+        """
+        if len(articles) == 1:
+            return [self.check_article_relevance(articles[0])]
+        
+        prompt = BATCH_PROMPT_TEMPLATE.format(
+            count=len(articles),
+            articles="\n".join(self._format_batch_article(i + 1, article) for i, article in enumerate(articles))
+        )
+        max_tokens = settings.RELEVANCE_BATCH_OUTPUT_TOKENS_PER_ARTICLE * len(articles) + 50
+        
+        self._count("batch_requests")
+        self._count("batched_articles", len(articles))
+        try:
+            response = self._post_completion(prompt, max_tokens=max_tokens)
+            if response.status_code != 200:
+                logger.error(f"API 오류 (배치 {len(articles)}건): {response.status_code}, {response.text}")
+                return [None] * len(articles)
+            result_text = response.json()["choices"][0]["message"]["content"]
+        except Exception as e:
+            logger.error(f"배치 요청 처리 중 오류: {str(e)}")
+            return [None] * len(articles)
+        
+        return parse_batch_response(result_text, len(articles))
+    
+    def evaluate_articles(self, articles: List[Dict[str, Any]]) -> List[Tuple[bool, str, str]]:
+        """
+        여러 기사 평가
+        
+        규칙으로 확실히 분류되는 기사는 바로 판정하고, 나머지는 캐시를 거쳐 LLM으로 평가
+        
+        Args:
+            articles: 평가할 기사 목록
+            
+        Returns:
+            기사 순서대로 (적합성 여부, 적합성 이유, 카테고리) 목록
+        """
+        if not self.use_rules or not articles:
+            return self._evaluate_with_cache(articles)
+        
+        classifier = get_rule_classifier()
+        verdicts: List[Optional[Tuple[bool, str, str]]] = [classifier.classify(article) for article in articles]
+        undecided = [idx for idx, verdict in enumerate(verdicts) if verdict is None]
+        self._count("rule_decided", len(articles) - len(undecided))
+        
+        for idx, result in zip(undecided, self._evaluate_with_cache([articles[idx] for idx in undecided])):
+            verdicts[idx] = result
+        return verdicts
+    
+    def _evaluate_with_cache(self, articles: List[Dict[str, Any]]) -> List[Tuple[bool, str, str]]:
+        """
+        여러 기사 평가 (캐시에 있는 기사는 API를 호출하지 않음)
+        
+        Args:
+            articles: 평가할 기사 목록
+            
+        Returns:
+            기사 순서대로 (적합성 여부, 적합성 이유, 카테고리) 목록
+        """
+        if not self.use_cache or not articles:
+            return self._evaluate_with_triage(articles)
+        
+        try:
+            cache = get_verdict_cache()
+            keys = [verdict_key(self.model, PROMPT_VERSION, article) for article in articles]
+            cached = cache.get_many(keys)
+        except Exception as e:
+            # 캐시를 사용할 수 없어도 평가는 계속
+            logger.error(f"Error reading verdict cache: {str(e)}")
+            return self._evaluate_with_triage(articles)
+        
+        missing = [idx for idx, key in enumerate(keys) if key not in cached]
+        self._count("cache_hits", len(articles) - len(missing))
+        self._count("cache_misses", len(missing))
+        if len(missing) < len(articles):
+            logger.info(f"Reusing cached verdicts for {len(articles) - len(missing)} of {len(articles)} articles")
+        
+        verdicts: List[Optional[Tuple[bool, str, str]]] = [cached.get(key) for key in keys]
+        new_verdicts: Dict[str, Tuple[bool, str, str]] = {}
+        for idx, result in zip(missing, self._evaluate_with_triage([articles[idx] for idx in missing])):
+            verdicts[idx] = result
+            # API 오류나 로컬 분류기로 얻은 결과는 LLM 판정이 아니므로 저장하지 않음
+            if not is_error_verdict(result) and not result[1].startswith(TRIAGE_REASON):
+                new_verdicts[keys[idx]] = result
+        
+        try:
+            self._count("cache_evictions", cache.put_many(new_verdicts))
+        except Exception as e:
+            logger.error(f"Error updating verdict cache: {str(e)}")
+        
+        return verdicts
+    
+    def _evaluate_with_triage(self, articles: List[Dict[str, Any]]) -> List[Tuple[bool, str, str]]:
+        """
+        로컬 분류기로 모든 기사를 한 번에 점수화하여 확신도가 높은 기사는 바로 판정하고,
+        판정 경계 근처의 기사만 LLM으로 평가
+        
+        Args:
+            articles: 평가할 기사 목록
+            
+        Returns:
+            기사 순서대로 (적합성 여부, 적합성 이유, 카테고리) 목록
+        """
+        model = get_triage_model() if self.use_triage and articles else None
+        if model is None:
+            return self._evaluate_uncached(articles)
+        
+        try:
+            predictions = model.predict(articles)
+        except Exception as e:
+            logger.error(f"Error running triage model: {str(e)}")
+            return self._evaluate_uncached(articles)
+        
+        verdicts: List[Optional[Tuple[bool, str, str]]] = [
+            decide(prediction, settings.TRIAGE_LOW, settings.TRIAGE_HIGH, settings.TRIAGE_CATEGORY_MIN_PROB)
+            for prediction in predictions
+        ]
+        uncertain = [idx for idx, verdict in enumerate(verdicts) if verdict is None]
+        self._count("triage_decided", len(articles) - len(uncertain))
+        logger.info(f"Triage model decided {len(articles) - len(uncertain)} of {len(articles)} articles locally")
+        
+        for idx, result in zip(uncertain, self._evaluate_uncached([articles[idx] for idx in uncertain])):
+            verdicts[idx] = result
+        return verdicts
+    
+    def _evaluate_uncached(self, articles: List[Dict[str, Any]]) -> List[Tuple[bool, str, str]]:
+        """
+        여러 기사를 동시에 평가
+        
+        batch_size가 1보다 크면 여러 기사를 한 요청으로 묶어 평가하고,
+        배치 응답에서 결과가 누락되거나 형식이 잘못된 기사만 기사별 요청으로 다시 평가
+        
+        Args:
+            articles: 평가할 기사 목록
+            
+        Returns:
+            기사 순서대로 (적합성 여부, 적합성 이유, 카테고리) 목록
+        """
+        if not articles:
+            return []
+        
+        if self.batch_size == 1 or len(articles) == 1:
+            return self._run_concurrently(self.check_article_relevance, articles)
+        
+        batches = self.plan_batches(articles)
+        logger.info(f"Packed {len(articles)} articles into {len(batches)} batch requests")
+        batch_results = self._run_concurrently(
+            lambda batch: self.check_batch_relevance([articles[idx] for idx in batch]), batches, label="batch"
+        )
+        
+        verdicts: List[Optional[Tuple[bool, str, str]]] = [None] * len(articles)
+        for batch, results in zip(batches, batch_results):
+            for idx, result in zip(batch, results):
+                verdicts[idx] = result
+        
+        # 배치 응답에서 결과를 얻지 못한 기사는 기사별 요청으로 재평가
+        missing = [idx for idx, verdict in enumerate(verdicts) if verdict is None]
+        if missing:
+            logger.warning(f"{len(missing)} articles missing from batch responses, evaluating individually")
+            self._count("batch_fallbacks", len(missing))
+            for idx, result in zip(missing, self._run_concurrently(self.check_article_relevance, [articles[idx] for idx in missing])):
+                verdicts[idx] = result
+        
+        return verdicts
+    
+    def _progress_reporter(
+        self,
+        data: List[Dict[str, Any]],
+        representatives: Dict[str, int],
+        on_progress: Callable[[Dict[str, Any]], Optional[bool]]
+    ) -> Callable[[Dict[int, Tuple[bool, str, str]]], bool]:
+        """
+        평가를 마친 대표 기사 결과를 군집 전체 행의 진행 상황으로 바꾸어 전달하는 콜백 생성
+        (on_progress가 False를 반환하면 콜백도 False를 반환하여 평가 중단)
+        """
+        members: Dict[int, List[int]] = {}
+        for idx, row in enumerate(data):
+            cluster_id = str(row.get('cluster_id', '') or '')
+            members.setdefault(representatives.get(cluster_id, idx), []).append(idx)
+        completed = 0
+        classifier = get_rule_classifier() if self.use_rules else None
+        
+        def report(chunk_verdicts: Dict[int, Tuple[bool, str, str]]) -> bool:
+            nonlocal completed
+            rows = []
+            for source_idx, verdict in chunk_verdicts.items():
+                for idx in members.get(source_idx, [source_idx]):
+                    # 저장할 결과와 같도록 군집 구성원도 규칙 판정을 먼저 적용
+                    member_verdict = classifier.classify(data[idx]) if classifier and idx != source_idx else None
+                    is_relevant, reason, category = member_verdict or verdict
+                    rows.append({
+                        "row": idx,
+                        "title": data[idx].get('title', ""),
+                        "url": data[idx].get('url', ""),
+                        "is_relevant": is_relevant,
+                        "relevance_reason": reason,
+                        "category": category
+                    })
+            completed += len(rows)
+            try:
+                return on_progress({"rows": rows, "completed": completed, "total": len(data)}) is not False
+            except Exception as e:
+                logger.error(f"Error in evaluation progress callback: {str(e)}")
+                return True
+        
+        return report
+    
+    def _evaluate_with_checkpoint(
+        self,
+        data: List[Dict[str, Any]],
+        evaluate_indices: List[int],
+        journal: CheckpointJournal,
+        on_chunk: Optional[Callable[[Dict[int, Tuple[bool, str, str]]], bool]] = None
+    ) -> Tuple[Dict[int, Tuple[bool, str, str]], int]:
+        """
+        기사를 일정 건수씩 평가하며 결과를 체크포인트 저널에 추가
+        같은 입력의 저널이 있으면 완료된 행은 다시 평가하지 않음
+        
+        Args:
+            data: 전체 행 목록
+            evaluate_indices: 평가할 행 위치 목록
+            journal: 체크포인트 저널
+            on_chunk: 평가를 마친 행 결과를 받을 콜백 (지정하면 더 작은 단위로 평가하여 자주 호출, False를 반환하면 중단)
+            
+        Returns:
+            (행 위치 -> 평가 결과, 저널에서 복원한 행 수) - 중단되면 평가하지 않은 행은 결과에 없음
+        """
+        completed = journal.load()
+        verdicts: Dict[int, Tuple[bool, str, str]] = {
+            idx: (bool(result["is_relevant"]), result["reason"], result["category"])
+            for idx, result in completed.items()
+        }
+        journal.start(resume=bool(completed))
+        
+        remaining = [idx for idx in evaluate_indices if idx not in verdicts]
+        resumed = len(evaluate_indices) - len(remaining)
+        if resumed:
+            logger.info(f"Resuming from checkpoint: {resumed} of {len(evaluate_indices)} articles already evaluated")
+            if on_chunk is not None and not on_chunk({idx: verdicts[idx] for idx in evaluate_indices if idx in verdicts}):
+                return verdicts, resumed
+
+        chunk_size = max(settings.RELEVANCE_CHECKPOINT_ROWS, 1)
+        if on_chunk is not None:
+            # 진행 상황을 전달할 때는 동시 요청 한 번에 처리되는 만큼씩 평가
+            chunk_size = min(chunk_size, self.max_workers * self.batch_size)
+        for start in range(0, len(remaining), chunk_size):
+            chunk = remaining[start:start + chunk_size]
+            results = self.evaluate_articles([data[idx] for idx in chunk])
+            verdicts.update(zip(chunk, results))
+            journal.append({
+                idx: {"is_relevant": result[0], "reason": result[1], "category": result[2]}
+                for idx, result in zip(chunk, results)
+                if not is_error_verdict(result)
+            })
+            logger.info(f"Checkpointed {resumed + start + len(chunk)}/{len(evaluate_indices)} articles")
+            if on_chunk is not None and not on_chunk(dict(zip(chunk, results))):
+                logger.info(f"Evaluation stopped after {resumed + start + len(chunk)}/{len(evaluate_indices)} articles")
+                break
+        
+        return verdicts, resumed
+    
+    def process_file(
+        self,
+        file_path: str,
+        on_progress: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
         """
         CSV 파일 처리 및 적합성 판단 결과 추가
         
+        평가 결과는 진행 중에 체크포인트 저널에 기록되며, 중단 후 같은 파일로 다시 실행하면
+        완료된 행부터 이어서 평가하고 모든 행이 끝나면 _evaluated.csv를 만듦
+        
         Args:
             file_path: 처리할 CSV 파일 경로
+            on_progress: 평가 진행 상황을 받을 콜백 (평가를 마친 행 목록과 진행률 / False를 반환하면 중단)
             
         Returns:
             (저장된 파일 경로, 통계 정보)
@@ -201,20 +807,64 @@ class RelevanceService:
                 logger.info(f"File '{file_path}' already processed")
                 
                 # 파일 통계 가져오기
-                stats = get_csv_statistics(file_path)
+                stats = get_result_statistics(file_path)
                 stats["already_processed"] = True
                 
                 return file_path, stats
             
-            # 각 기사 처리
+            # 군집 정보가 없는 파일(이전 버전 결과)은 여기서 군집화
+            if settings.NEAR_DUP_CLUSTERING and data and not all(row.get('cluster_id') for row in data):
+                assign_clusters(data, settings.NEAR_DUP_THRESHOLD)
+            elif any(row.get('cluster_id') for row in data):
+                # 이전 버전에서 군집화한 파일도 제목의 회사명이 다른 기사는 다른 군집으로 나눔
+                split_entity_clusters(data)
+            
+            # 평가할 기사 선택 (같은 군집은 대표 기사만 평가)
+            representatives: Dict[str, int] = {}
+            evaluate_indices: List[int] = []
+            for idx, row in enumerate(data):
+                cluster_id = str(row.get('cluster_id', '') or '')
+                if cluster_id and cluster_id in representatives:
+                    continue
+                if cluster_id:
+                    representatives[cluster_id] = idx
+                evaluate_indices.append(idx)
+            
+            base_name = os.path.basename(file_path)
+            output_file = os.path.join(os.path.dirname(file_path), base_name.replace('.csv', '_evaluated.csv'))
+            journal = CheckpointJournal(
+                output_file.replace('.csv', '.journal.jsonl'),
+                file_fingerprint(file_path, self.model, PROMPT_VERSION)
+            )
+            
+            logger.info(f"Evaluating {len(evaluate_indices)} of {len(data)} articles with {self.max_workers} workers")
+            self.reset_call_stats()
+            evaluation_started = time.monotonic()
+            verdicts, resumed = self._evaluate_with_checkpoint(
+                data, evaluate_indices, journal,
+                on_chunk=self._progress_reporter(data, representatives, on_progress) if on_progress else None
+            )
+            evaluation_seconds = time.monotonic() - evaluation_started
+            if any(idx not in verdicts for idx in evaluate_indices):
+                # 중단된 경우 체크포인트를 남겨 두어 다시 실행하면 이어서 평가
+                logger.info(f"Evaluation of '{file_path}' cancelled, checkpoint kept at {journal.path}")
+                return None, {"error": "Evaluation cancelled", "cancelled": True}
+            
+            # 각 기사 처리 (같은 군집은 대표 기사 평가 결과를 복사하되, 규칙으로 확실히 분류되는 기사는 규칙 판정 사용)
+            classifier = get_rule_classifier() if self.use_rules else None
             processed_data = []
+            copied = 0
             for idx, row in enumerate(data):
-                # 진행 로그
-                if idx % 10 == 0:
-                    logger.info(f"Processing article {idx+1}/{len(data)}")
-                
                 # 적합성 판단 및 카테고리 분류
-                is_relevant, reason, category = self.check_article_relevance(row)
+                verdict = verdicts.get(idx)
+                if verdict is None and classifier is not None:
+                    verdict = classifier.classify(row)
+                    if verdict is not None:
+                        self._count("rule_decided")
+                if verdict is None:
+                    verdict = verdicts[representatives[str(row.get('cluster_id', '') or '')]]
+                    copied += 1
+                is_relevant, reason, category = verdict
                 
                 # 결과 업데이트
                 row['is_relevant'] = is_relevant
@@ -223,19 +873,43 @@ class RelevanceService:
                 
                 processed_data.append(row)
             
-            # 결과 저장
-            base_name = os.path.basename(file_path)
-            output_file = os.path.join(os.path.dirname(file_path), base_name.replace('.csv', '_evaluated.csv'))
-            
-            success = save_to_csv(processed_data, output_file, encoding='utf-8-sig')
+            # 결과 저장 (저장에 성공해야 체크포인트 삭제, 통계와 행 위치 색인은 저장하면서 계산)
+            success, _ = save_to_csv(
+                processed_data, output_file, encoding='utf-8-sig', write_statistics=True, write_row_index=True
+            )
             if not success:
                 logger.error(f"Failed to save evaluated results to {output_file}")
                 return None, {"error": "Failed to save evaluated results"}
             
+            journal.remove()
             logger.info(f"Saved evaluated results to {output_file}")
+            if settings.RESULTS_COLUMNAR:
+                save_columnar_copy(processed_data, output_file)
+            store_articles(processed_data, output_file)
+            catalog_file(output_file)
             
-            # 통계 정보 계산
-            stats = get_csv_statistics(output_file)
+            # 통계 정보 (저장하면서 계산한 통계 파일 사용)
+            stats = get_result_statistics(output_file)
+            stats["articles_evaluated"] = len(evaluate_indices)
+            stats["resumed_from_checkpoint"] = resumed
+            stats["verdicts_copied_from_cluster"] = copied
+            stats["llm_calls"] = self.call_stats["api_calls"]
+            stats.update(self.call_stats)
+            # 기사별로 LLM을 호출했을 때보다 줄어든 호출 수 (군집 복사, 규칙 판정, 캐시 재사용)
+            stats["llm_calls_saved"] = (
+                stats["verdicts_copied_from_cluster"] + self.call_stats["rule_decided"]
+                + self.call_stats["cache_hits"] + self.call_stats["triage_decided"]
+            )
+            stats["rate_limit_wait_seconds"] = round(self.call_stats["rate_limit_wait_seconds"], 2)
+            # 실제 달성한 LLM 처리량 (RPM/TPM 한도와 비교)
+            minutes = max(evaluation_seconds, 1e-6) / 60.0
+            stats["throughput"] = {
+                "elapsed_seconds": round(evaluation_seconds, 2),
+                "requests_per_minute": round(self.call_stats["api_calls"] / minutes, 1),
+                "tokens_per_minute": round(self.call_stats["tokens_used"] / minutes, 1),
+                "rpm_limit": settings.RELEVANCE_RPM_LIMIT,
+                "tpm_limit": settings.RELEVANCE_TPM_LIMIT
+            }
             
             return output_file, stats
             
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+LLM 호출 전 규칙 기반 1차 분류
+회사명/업계 용어/무관 키워드 사전을 Aho-Corasick 오토마톤으로 한 번에 검색하여
+확실히 분류할 수 있는 기사만 바로 판정하고, 나머지는 LLM으로 넘김
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.aho_corasick import AhoCorasick, build_matcher
+
+logger = logging.getLogger(__name__)
+
+LABEL_SELF = "self"
+LABEL_INDUSTRY = "industry"
+LABEL_OFF_TOPIC = "off_topic"
+
+# 기본 사전 (RELEVANCE_RULES_PATH JSON 파일의 같은 키로 대체 가능)
+DEFAULT_DICTIONARIES: Dict[str, List[str]] = {
+    # 제목에 있으면 자사 언급기사로 확정
+    LABEL_SELF: ["코스맥스", "cosmax"],
+    # 제목/내용에 하나라도 있으면 무관 기사로 판정하지 않음
+    LABEL_INDUSTRY: [
+        "화장품", "뷰티", "코스메틱", "cosmetic", "odm", "oem", "스킨케어", "색조", "선케어",
+        "한국콜마", "콜마", "아모레퍼시픽", "lg생활건강", "코스메카", "씨앤씨인터내셔널", "애경산업", "올리브영",
+        "세라마이드", "히알루론산", "레티놀", "나이아신아마이드", "펩타이드", "콜라겐", "원료",
+        "건강기능식품", "영양제", "펫푸드", "마이크로바이옴", "프로바이오틱스", "식약처", "식품의약품안전처"
+    ],
+    # 제목에 있고 업계 용어가 없으면 무관 기사로 확정
+    LABEL_OFF_TOPIC: [
+        "[부고]", "부고]", "[인사]", "인사]", "[동정]", "[게시판]", "오늘의 운세", "띠별 운세",
+        "로또", "프로야구", "프로축구", "경마"
+    ]
+}
+
+
+def load_dictionaries(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    규칙 사전 읽기 (파일에 있는 키만 기본 사전을 대체)
+
+    Args:
+        path: 사전 JSON 파일 경로
+
+    Returns:
+        라벨 -> 단어 목록
+    """
+    dictionaries = {label: list(words) for label, words in DEFAULT_DICTIONARIES.items()}
+    if path and os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            custom = json.load(f)
+        for label in dictionaries:
+            if isinstance(custom.get(label), list):
+                dictionaries[label] = [str(word) for word in custom[label]]
+    elif path:
+        logger.warning(f"Relevance rules file not found: {path}, using default dictionaries")
+    return dictionaries
+
+
+class RuleClassifier:
+    """
+    사전 기반 기사 분류기
+    """
+    def __init__(self, dictionaries: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            dictionaries: 라벨 -> 단어 목록 (기본값: 기본 사전)
+        """
+        self.matcher: AhoCorasick = build_matcher(dictionaries or DEFAULT_DICTIONARIES)
+
+    def classify(self, article: Dict[str, Any]) -> Optional[Tuple[bool, str, str]]:
+        """
+        기사 분류
+
+        Args:
+            article: 기사 정보
+
+        Returns:
+            확실히 분류되면 (적합성 여부, 적합성 이유, 카테고리), 아니면 None
+        """
+        title = article.get('title', "") or ""
+        self_words = self.matcher.matches(title, LABEL_SELF)
+        if self_words:
+            return True, f"규칙: 제목에 자사명 언급 ({self_words[0]})", "자사 언급기사"
+
+        off_topic_words = self.matcher.matches(title, LABEL_OFF_TOPIC)
+        if off_topic_words:
+            text = f"{title}\n{article.get('content', '') or ''}"
+            if not self.matcher.labels(text) & {LABEL_SELF, LABEL_INDUSTRY}:
+                return False, f"규칙: 업계와 무관한 기사 ({off_topic_words[0]})", "기타"
+
+        return None
+
+    def entity_words(self, article: Dict[str, Any]) -> Tuple[str, ...]:
+        """
+        제목에 있는 자사명/업계 사전 단어 (회사명처럼 카테고리를 가르는 단어, 정렬된 튜플)
+
+        Args:
+            article: 기사 정보
+
+        Returns:
+            일치한 단어 튜플
+        """
+        title = article.get('title', "") or ""
+        words = self.matcher.matches(title, LABEL_SELF) + self.matcher.matches(title, LABEL_INDUSTRY)
+        return tuple(sorted(set(words)))
+
+
+_rule_classifier: Optional[RuleClassifier] = None
+
+
+def get_rule_classifier() -> RuleClassifier:
+    """
+    프로세스 전역 규칙 분류기 반환 (오토마톤은 처음 한 번만 생성)
+    """
+    global _rule_classifier
+    if _rule_classifier is None:
+        _rule_classifier = RuleClassifier(load_dictionaries(settings.RELEVANCE_RULES_PATH))
+    return _rule_classifier
@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+LLM 호출 전 로컬 분류기 선별 (선택 기능, scikit-learn 필요)
+지금까지 쌓인 _evaluated.csv의 LLM 판정으로 TF-IDF + 로지스틱 회귀 모델을 학습하고,
+모든 기사를 한 번에 점수화하여 확신도가 높은 기사만 로컬에서 판정하고
+판정 경계 근처의 기사만 LLM으로 보냄
+"""
+
+import datetime
+import glob
+import importlib.util
+import logging
+import os
+import pickle
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.csv_utils import read_csv
+
+logger = logging.getLogger(__name__)
+
+# 로컬 분류기 판정 결과의 이유 접두어
+TRIAGE_REASON = "로컬 분류기"
+
+# 학습 데이터에서 제외할 판정 (LLM이 아닌 규칙/분류기/오류로 얻은 결과)
+_NON_LLM_REASON_PREFIXES = ("규칙:", TRIAGE_REASON, "API 오류", "요청 처리 중 오류")
+
+
+def is_available() -> bool:
+    """
+    scikit-learn 설치 여부
+    """
+    return importlib.util.find_spec("sklearn") is not None
+
+
+def _article_text(article: Dict[str, Any]) -> str:
+    return f"{article.get('title', '')}\n{article.get('content', '')}\n{article.get('source', '')}"
+
+
+def _is_true(value: Any) -> bool:
+    return str(value).lower() in ('true', '1', 'yes')
+
+
+def load_training_rows(results_path: str) -> List[Dict[str, Any]]:
+    """
+    결과 디렉토리의 _evaluated.csv에서 LLM 판정 행 수집 (URL 기준 중복 제거, 최신 파일 우선)
+
+    Args:
+        results_path: 결과 디렉토리
+
+    Returns:
+        학습용 행 목록
+    """
+    files = sorted(glob.glob(os.path.join(results_path, "*_evaluated.csv")), key=os.path.getmtime, reverse=True)
+    rows: List[Dict[str, Any]] = []
+    seen_keys = set()
+    for file_path in files:
+        for row in read_csv(file_path):
+            if 'is_relevant' not in row or not row.get('category'):
+                continue
+            if str(row.get('relevance_reason', '')).startswith(_NON_LLM_REASON_PREFIXES):
+                continue
+            key = row.get('url') or row.get('title')
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            rows.append(row)
+    return rows
+
+
+class TriageModel:
+    """
+    관련성(이진)과 카테고리(다중) 분류기 묶음
+    """
+    def __init__(self, relevance_model: Any, category_model: Any, metadata: Dict[str, Any]):
+        self.relevance_model = relevance_model
+        self.category_model = category_model
+        self.metadata = metadata
+
+    @staticmethod
+    def _build_pipeline() -> Any:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import make_pipeline
+
+        # 한국어는 띄어쓰기/조사 변화가 많아 문자 n-gram 사용
+        return make_pipeline(
+            TfidfVectorizer(analyzer='char_wb', ngram_range=(2, 4), max_features=50000, sublinear_tf=True),
+            LogisticRegression(max_iter=1000, class_weight='balanced')
+        )
+
+    @classmethod
+    def train(cls, rows: List[Dict[str, Any]]) -> "TriageModel":
+        """
+        LLM 판정 행으로 모델 학습
+
+        Args:
+            rows: is_relevant, category 열이 있는 행 목록
+
+        Returns:
+            학습된 모델
+        """
+        texts = [_article_text(row) for row in rows]
+        relevance_model = cls._build_pipeline().fit(texts, [_is_true(row['is_relevant']) for row in rows])
+        category_model = cls._build_pipeline().fit(texts, [row['category'] for row in rows])
+        metadata = {
+            "trained_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "training_rows": len(rows)
+        }
+        return cls(relevance_model, category_model, metadata)
+
+    def predict(self, articles: List[Dict[str, Any]]) -> List[Tuple[float, str, float]]:
+        """
+        기사를 한 번에 점수화
+
+        Returns:
+            기사 순서대로 (관련성 확률, 카테고리, 카테고리 확률) 목록
+        """
+        texts = [_article_text(article) for article in articles]
+        relevance_classes = list(self.relevance_model.classes_)
+        relevance_probs = self.relevance_model.predict_proba(texts)[:, relevance_classes.index(True)]
+        category_probs = self.category_model.predict_proba(texts)
+        category_classes = self.category_model.classes_
+        best = category_probs.argmax(axis=1)
+        return [
+            (float(relevance_prob), str(category_classes[index]), float(category_probs[row, index]))
+            for row, (relevance_prob, index) in enumerate(zip(relevance_probs, best))
+        ]
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(self, f)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def load(path: str) -> "TriageModel":
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+
+def decide(
+    prediction: Tuple[float, str, float],
+    low: float,
+    high: float,
+    category_min_prob: float
+) -> Optional[Tuple[bool, str, str]]:
+    """
+    점수로 로컬 판정 여부 결정
+
+    Args:
+        prediction: (관련성 확률, 카테고리, 카테고리 확률)
+        low: 이 값 이하이면 관련 없음으로 판정
+        high: 이 값 이상이면 관련 있음으로 판정
+        category_min_prob: 카테고리 확률이 이 값 이상일 때만 판정
+
+    Returns:
+        확신도가 높으면 (적합성 여부, 적합성 이유, 카테고리), 판정 경계 근처이면 None
+    """
+    relevance_prob, category, category_prob = prediction
+    if category_prob < category_min_prob or low < relevance_prob < high:
+        return None
+    is_relevant = relevance_prob >= high
+    return is_relevant, f"{TRIAGE_REASON}: 관련성 확률 {relevance_prob:.2f}", category
+
+
+def measure_agreement(
+    model: TriageModel,
+    rows: List[Dict[str, Any]],
+    low: float,
+    high: float,
+    category_min_prob: float
+) -> Dict[str, Any]:
+    """
+    LLM 판정 대비 로컬 분류기 정확도
+
+    Args:
+        model: 로컬 분류기
+        rows: LLM 판정 행 목록
+
+    Returns:
+        전체 정확도, 로컬 판정 비율(coverage), 로컬 판정 기사의 정확도
+    """
+    if not rows:
+        return {"rows": 0}
+
+    predictions = model.predict(rows)
+    relevance_correct = 0
+    category_correct = 0
+    decided = 0
+    decided_correct = 0
+    for row, prediction in zip(rows, predictions):
+        expected_relevant = _is_true(row['is_relevant'])
+        relevance_correct += (prediction[0] >= 0.5) == expected_relevant
+        category_correct += prediction[1] == row['category']
+        verdict = decide(prediction, low, high, category_min_prob)
+        if verdict is not None:
+            decided += 1
+            decided_correct += verdict[0] == expected_relevant and verdict[2] == row['category']
+
+    return {
+        "rows": len(rows),
+        "relevance_accuracy": round(relevance_correct / len(rows), 4),
+        "category_accuracy": round(category_correct / len(rows), 4),
+        "coverage": round(decided / len(rows), 4),
+        "decided_accuracy": round(decided_correct / decided, 4) if decided else None
+    }
+
+
+def train_model(results_path: Optional[str] = None, holdout: float = 0.2) -> Dict[str, Any]:
+    """
+    결과 디렉토리의 LLM 판정으로 모델을 학습하고 저장
+
+    일부 행(holdout)으로 LLM 대비 정확도를 측정한 뒤, 전체 행으로 다시 학습하여 저장
+
+    Args:
+        results_path: 결과 디렉토리 (기본값: 설정값)
+        holdout: 정확도 측정용 행 비율
+
+    Returns:
+        학습 결과 및 정확도
+    """
+    if not is_available():
+        raise RuntimeError("scikit-learn is not installed (pip install scikit-learn)")
+
+    rows = load_training_rows(results_path or settings.RESULTS_PATH)
+    if len(rows) < settings.TRIAGE_MIN_TRAINING_ROWS:
+        raise ValueError(f"Not enough evaluated rows to train: {len(rows)} < {settings.TRIAGE_MIN_TRAINING_ROWS}")
+
+    from sklearn.model_selection import train_test_split
+
+    train_rows, test_rows = train_test_split(rows, test_size=holdout, random_state=42)
+    metrics = measure_agreement(
+        TriageModel.train(train_rows), test_rows,
+        settings.TRIAGE_LOW, settings.TRIAGE_HIGH, settings.TRIAGE_CATEGORY_MIN_PROB
+    )
+
+    model = TriageModel.train(rows)
+    model.metadata["holdout_metrics"] = metrics
+    model.save(settings.TRIAGE_MODEL_PATH)
+    reset_triage_model()
+
+    logger.info(f"Trained triage model on {len(rows)} rows: {metrics}")
+    return {"model_path": settings.TRIAGE_MODEL_PATH, **model.metadata}
+
+
+def evaluate_model(file_paths: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    저장된 모델을 _evaluated.csv의 LLM 판정과 비교
+
+    Args:
+        file_paths: 비교할 파일 목록 (기본값: 결과 디렉토리의 모든 _evaluated.csv)
+
+    Returns:
+        LLM 대비 정확도
+    """
+    model = get_triage_model()
+    if model is None:
+        raise RuntimeError(f"Triage model not found: {settings.TRIAGE_MODEL_PATH}")
+
+    if file_paths:
+        rows = [row for file_path in file_paths for row in read_csv(file_path)
+                if 'is_relevant' in row and not str(row.get('relevance_reason', '')).startswith(_NON_LLM_REASON_PREFIXES)]
+    else:
+        rows = load_training_rows(settings.RESULTS_PATH)
+
+    metrics = measure_agreement(model, rows, settings.TRIAGE_LOW, settings.TRIAGE_HIGH, settings.TRIAGE_CATEGORY_MIN_PROB)
+    metrics["model_trained_at"] = model.metadata.get("trained_at")
+    return metrics
+
+
+_triage_model: Optional[TriageModel] = None
+_triage_model_mtime: Optional[float] = None
+_triage_model_lock = threading.Lock()
+
+
+def get_triage_model() -> Optional[TriageModel]:
+    """
+    저장된 로컬 분류기 반환 (파일이 갱신되면 다시 읽음, 없거나 scikit-learn이 없으면 None)
+    """
+    global _triage_model, _triage_model_mtime
+    path = settings.TRIAGE_MODEL_PATH
+    if not is_available() or not os.path.exists(path):
+        return None
+
+    with _triage_model_lock:
+        mtime = os.path.getmtime(path)
+        if _triage_model is None or _triage_model_mtime != mtime:
+            try:
+                _triage_model = TriageModel.load(path)
+                _triage_model_mtime = mtime
+            except Exception as e:
+                logger.error(f"Error loading triage model: {str(e)}")
+                return None
+        return _triage_model
+
+
+def reset_triage_model() -> None:
+    global _triage_model, _triage_model_mtime
+    with _triage_model_lock:
+        _triage_model = None
+        _triage_model_mtime = None
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+LLM 관련성 평가 결과 캐시
+(모델, 프롬프트 버전, 제목, 내용, 출처)의 해시를 키로 평가 결과를 SQLite에 저장하여
+같은 기사를 다시 평가할 때 API를 호출하지 않음. 유효 기간(TTL)과 최대 항목 수를 넘으면 삭제
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.sqlite_utils import connect
+
+logger = logging.getLogger(__name__)
+
+Verdict = Tuple[bool, str, str]
+
+
+def verdict_key(model: str, prompt_version: str, article: Dict[str, Any]) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        model: LLM 모델 이름
+        prompt_version: 프롬프트 버전 (프롬프트를 바꾸면 이전 결과를 재사용하지 않음)
+        article: 기사 정보
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    payload = json.dumps(
+        [model, prompt_version, article.get('title', ""), article.get('content', ""), article.get('source', "")],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class VerdictCache:
+    """
+    평가 결과 캐시 (SQLite)
+    """
+    def __init__(self, db_path: str, ttl_seconds: float, max_entries: int):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            ttl_seconds: 평가 결과 유효 기간 (초)
+            max_entries: 최대 항목 수 (넘으면 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS verdicts (
+                    key TEXT PRIMARY KEY,
+                    is_relevant INTEGER NOT NULL,
+                    reason TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_last_used ON verdicts(last_used)")
+
+    def get_many(self, keys: List[str]) -> Dict[str, Verdict]:
+        """
+        캐시된 평가 결과 조회 (유효 기간이 지난 항목은 제외)
+
+        Returns:
+            키 -> (적합성 여부, 적합성 이유, 카테고리)
+        """
+        now = time.time()
+        found: Dict[str, Verdict] = {}
+        with self._lock, self._conn:
+            for key in set(keys):
+                row = self._conn.execute(
+                    "SELECT is_relevant, reason, category, created_at FROM verdicts WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or now - row["created_at"] > self.ttl_seconds:
+                    continue
+                found[key] = (bool(row["is_relevant"]), row["reason"], row["category"])
+            if found:
+                self._conn.executemany(
+                    "UPDATE verdicts SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+                )
+        return found
+
+    def put_many(self, verdicts: Dict[str, Verdict]) -> int:
+        """
+        평가 결과 저장 후 만료/초과 항목 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        if not verdicts:
+            return 0
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT OR REPLACE INTO verdicts (key, is_relevant, reason, category, created_at, last_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(key, int(is_relevant), reason, category, now, now)
+                  for key, (is_relevant, reason, category) in verdicts.items()])
+
+            evicted = self._conn.execute(
+                "DELETE FROM verdicts WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+            overflow = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                evicted += self._conn.execute("""
+                    DELETE FROM verdicts WHERE key IN (
+                        SELECT key FROM verdicts ORDER BY last_used LIMIT ?
+                    )
+                """, (overflow,)).rowcount
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        return {"entries": count, "max_entries": self.max_entries, "ttl_seconds": self.ttl_seconds}
+
+
+_verdict_cache: Optional[VerdictCache] = None
+_verdict_cache_lock = threading.Lock()
+
+
+def get_verdict_cache() -> VerdictCache:
+    """
+    프로세스 전역 평가 결과 캐시 반환
+    """
+    global _verdict_cache
+    with _verdict_cache_lock:
+        if _verdict_cache is None:
+            _verdict_cache = VerdictCache(
+                settings.VERDICT_CACHE_PATH,
+                ttl_seconds=settings.RELEVANCE_CACHE_TTL_DAYS * 24 * 60 * 60,
+                max_entries=settings.RELEVANCE_CACHE_MAX_ENTRIES
+            )
+        return _verdict_cache
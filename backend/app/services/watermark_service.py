@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+키워드별 증분 크롤링 기준점(high-water mark) 저장소
+최신순 검색 결과에서 지난번에 저장한 최신 기사들의 정규화 URL을 기억해 두고,
+다음 실행에서 이 기사들이 나타나면 페이지 요청을 중단
+"""
+
+import datetime
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.utils.sqlite_utils import connect
+from app.utils.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordWatermarkStore:
+    """
+    키워드별 최근 수집 기사 URL 저장소 (SQLite)
+    """
+    def __init__(self, db_path: str, size: int = 50):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            size: 키워드별로 기억할 최근 기사 URL 수
+        """
+        self.db_path = db_path
+        self.size = max(1, size)
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS keyword_watermarks (
+                    keyword TEXT PRIMARY KEY,
+                    recent_urls TEXT NOT NULL,
+                    latest_date TEXT,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
+    def known_urls(self, keywords: List[str]) -> Dict[str, Set[str]]:
+        """
+        키워드별 기준점 URL 조회
+
+        Args:
+            keywords: 검색 키워드 목록
+
+        Returns:
+            키워드 -> 정규화 URL 집합 (기준점이 없는 키워드는 제외)
+        """
+        result: Dict[str, Set[str]] = {}
+        with self._lock:
+            for keyword in keywords:
+                row = self._conn.execute(
+                    "SELECT recent_urls FROM keyword_watermarks WHERE keyword = ?", (keyword,)
+                ).fetchone()
+                if row is not None:
+                    urls = set(json.loads(row["recent_urls"]))
+                    if urls:
+                        result[keyword] = urls
+        return result
+
+    def update(self, news_items: List[Dict[str, Any]]) -> None:
+        """
+        저장된 기사로 키워드별 기준점 갱신 (새 기사가 앞에 오도록 최신순 유지)
+
+        Args:
+            news_items: 최신순으로 정렬된 뉴스 아이템 목록
+        """
+        latest: Dict[str, List[str]] = {}
+        latest_date: Dict[str, str] = {}
+        for item in news_items:
+            url_key = canonicalize_url(item.get('url', ''))
+            if not url_key:
+                continue
+            for keyword in item.get('matched_keywords') or [item.get('keyword', '')]:
+                if not keyword:
+                    continue
+                urls = latest.setdefault(keyword, [])
+                if len(urls) < self.size and url_key not in urls:
+                    urls.append(url_key)
+                latest_date.setdefault(keyword, item.get('date', ''))
+
+        if not latest:
+            return
+
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock, self._conn:
+            for keyword, urls in latest.items():
+                row = self._conn.execute(
+                    "SELECT recent_urls FROM keyword_watermarks WHERE keyword = ?", (keyword,)
+                ).fetchone()
+                previous = json.loads(row["recent_urls"]) if row is not None else []
+                merged = urls + [url for url in previous if url not in urls]
+                self._conn.execute("""
+                    INSERT INTO keyword_watermarks (keyword, recent_urls, latest_date, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(keyword) DO UPDATE SET
+                        recent_urls = excluded.recent_urls,
+                        latest_date = excluded.latest_date,
+                        updated_at = excluded.updated_at
+                """, (keyword, json.dumps(merged[:self.size], ensure_ascii=False), latest_date[keyword], now))
+
+    def reset(self, keyword: Optional[str] = None) -> None:
+        """
+        기준점 초기화 (keyword가 없으면 전체)
+        """
+        with self._lock, self._conn:
+            if keyword is None:
+                self._conn.execute("DELETE FROM keyword_watermarks")
+            else:
+                self._conn.execute("DELETE FROM keyword_watermarks WHERE keyword = ?", (keyword,))
+
+
+_watermark_store: Optional[KeywordWatermarkStore] = None
+_watermark_store_lock = threading.Lock()
+
+
+def get_watermark_store() -> KeywordWatermarkStore:
+    """
+    프로세스 전역 기준점 저장소 반환
+    """
+    global _watermark_store
+    with _watermark_store_lock:
+        if _watermark_store is None:
+            _watermark_store = KeywordWatermarkStore(settings.WATERMARK_DB_PATH, settings.CRAWLER_WATERMARK_SIZE)
+        return _watermark_store
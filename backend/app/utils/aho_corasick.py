@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Aho-Corasick 다중 문자열 검색
+사전의 모든 단어를 하나의 오토마톤으로 만들어 텍스트를 한 번만 훑어서 일치하는 단어를 찾음
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class AhoCorasick:
+    """
+    대소문자를 구분하지 않는 다중 패턴 검색기
+    """
+    def __init__(self, patterns: Dict[str, str]):
+        """
+        오토마톤 생성
+
+        Args:
+            patterns: 단어 -> 라벨 (예: {"코스맥스": "self", "한국콜마": "competitor"})
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]
+
+        for pattern, label in patterns.items():
+            pattern = pattern.lower()
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((pattern, label))
+
+        # 너비 우선으로 실패 링크 계산
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, str]]:
+        """
+        텍스트에서 일치하는 단어 검색
+
+        Yields:
+            (단어 끝 위치, 단어, 라벨)
+        """
+        state = 0
+        for position, char in enumerate(text.lower()):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern, label in self._output[state]:
+                yield position, pattern, label
+
+    def labels(self, text: str) -> Set[str]:
+        """
+        텍스트에서 일치한 라벨 집합
+        """
+        return {label for _, _, label in self.iter_matches(text)}
+
+    def matches(self, text: str, label: str) -> List[str]:
+        """
+        텍스트에서 특정 라벨로 일치한 단어 목록 (중복 제거, 등장 순서)
+        """
+        found: List[str] = []
+        for _, pattern, matched_label in self.iter_matches(text):
+            if matched_label == label and pattern not in found:
+                found.append(pattern)
+        return found
+
+
+def build_matcher(dictionaries: Dict[str, Iterable[str]]) -> AhoCorasick:
+    """
+    라벨별 단어 목록으로 검색기 생성
+
+    Args:
+        dictionaries: 라벨 -> 단어 목록
+
+    Returns:
+        검색기
+    """
+    return AhoCorasick({word: label for label, words in dictionaries.items() for word in words})
@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+결과 파일 열 단위(Parquet) 저장 유틸리티
+pyarrow가 설치되어 있으면 결과 CSV와 같은 이름의 .parquet 파일을 함께 저장하고,
+통계/미리보기/필터 조회는 필요한 열만 읽음 (CSV는 내보내기 형식으로 그대로 유지).
+Parquet 파일이 없거나 CSV보다 오래되었으면 CSV를 읽음
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.utils.csv_utils import (
+    _file_signature, _flatten_row, get_csv_preview, get_csv_statistics, load_statistics_sidecar, read_csv,
+    read_csv_page, write_statistics_sidecar
+)
+
+logger = logging.getLogger(__name__)
+
+PARQUET_EXTENSION = ".parquet"
+
+# 값 종류가 적어 사전 인코딩(dictionary encoding)으로 저장하는 열
+DICTIONARY_COLUMNS = ("keyword", "source", "category")
+
+# 참으로 보는 is_relevant 값
+TRUE_VALUES = ("true", "1", "yes")
+
+
+def is_columnar_available() -> bool:
+    """
+    pyarrow 설치 여부
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def warn_if_columnar_unavailable(enabled: bool) -> None:
+    """
+    열 단위 저장이 켜져 있는데 pyarrow가 없으면 경고 (시작 시 한 번 호출)
+
+    Args:
+        enabled: 열 단위 저장 설정값 (RESULTS_COLUMNAR)
+    """
+    if enabled and not is_columnar_available():
+        logger.warning(
+            "RESULTS_COLUMNAR is enabled but pyarrow is not installed; results are saved as CSV only "
+            "(pip install -r requirements-optional.txt)"
+        )
+
+
+def columnar_path(csv_path: str) -> str:
+    """
+    결과 CSV 파일에 대응하는 Parquet 파일 경로
+    """
+    base, _ = os.path.splitext(csv_path)
+    return base + PARQUET_EXTENSION
+
+
+def fresh_columnar_path(csv_path: str) -> Optional[str]:
+    """
+    CSV 이후에 저장된 Parquet 파일 경로 (없거나 CSV가 더 최근에 수정되었으면 None)
+    """
+    if not is_columnar_available():
+        return None
+    parquet_path = columnar_path(csv_path)
+    try:
+        if os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+            return parquet_path
+    except OSError:
+        pass
+    return None
+
+
+def save_to_parquet(data: List[Dict[str, Any]], file_path: str) -> bool:
+    """
+    데이터를 Parquet 파일로 저장 (keyword/source/category 열은 사전 인코딩)
+
+    CSV를 읽은 결과와 같도록 모든 값을 문자열로 저장함
+
+    Args:
+        data: 저장할 데이터 리스트
+        file_path: 저장할 파일 경로
+
+    Returns:
+        저장 성공 여부
+    """
+    if not data or not is_columnar_available():
+        return False
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    temp_path = f"{file_path}.tmp"
+    try:
+        rows = [_flatten_row(row) for row in data]
+        columns = {}
+        for name in rows[0].keys():
+            values = ["" if row.get(name) is None else str(row.get(name)) for row in rows]
+            array = pa.array(values, type=pa.string())
+            columns[name] = array.dictionary_encode() if name in DICTIONARY_COLUMNS else array
+        table = pa.table(columns)
+
+        # 읽는 쪽에서 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+        pq.write_table(table, temp_path, compression="zstd")
+        os.replace(temp_path, file_path)
+        return True
+    except Exception as e:
+        logger.error(f"Error saving Parquet file '{file_path}': {str(e)}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+
+def save_columnar_copy(data: List[Dict[str, Any]], csv_path: str) -> Optional[str]:
+    """
+    결과 CSV와 같은 이름의 Parquet 파일 저장 (CSV 저장 후 호출)
+
+    Args:
+        data: CSV에 저장한 데이터 리스트
+        csv_path: 저장된 CSV 파일 경로
+
+    Returns:
+        저장된 Parquet 파일 경로 (pyarrow가 없거나 실패하면 None)
+    """
+    parquet_path = columnar_path(csv_path)
+    if save_to_parquet(data, parquet_path):
+        logger.info(f"Saved columnar copy to {parquet_path}")
+        return parquet_path
+    return None
+
+
+def _column_names(parquet_path: str) -> List[str]:
+    import pyarrow.parquet as pq
+
+    return pq.read_schema(parquet_path).names
+
+
+def _value_counts(table: Any, column: str) -> Dict[str, int]:
+    import pyarrow.compute as pc
+
+    counts = {}
+    for entry in pc.value_counts(table.column(column).combine_chunks()).to_pylist():
+        value = entry["values"]
+        if value:
+            counts[value] = entry["counts"]
+    return counts
+
+
+def _relevant_mask(column: Any) -> Any:
+    import pyarrow.compute as pc
+
+    return pc.is_in(pc.utf8_lower(pc.cast(column, "string")), value_set=_string_array(TRUE_VALUES))
+
+
+def _string_array(values: Sequence[str]) -> Any:
+    import pyarrow as pa
+
+    return pa.array(list(values), type=pa.string())
+
+
+def get_parquet_statistics(parquet_path: str) -> Dict[str, Any]:
+    """
+    Parquet 파일 통계 정보 (키워드/관련성/카테고리 열만 읽음)
+
+    Args:
+        parquet_path: Parquet 파일 경로
+
+    Returns:
+        통계 정보 (get_csv_statistics와 같은 형식)
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_metadata(parquet_path)
+        column_names = _column_names(parquet_path)
+        if metadata.num_rows == 0:
+            return {"error": "Empty file"}
+
+        stats = {
+            "total_rows": metadata.num_rows,
+            "total_columns": len(column_names),
+            "column_names": column_names,
+        }
+
+        needed = [name for name in ("keyword", "is_relevant", "category") if name in column_names]
+        table = pq.read_table(parquet_path, columns=needed)
+
+        # 키워드 통계
+        if "keyword" in needed:
+            stats["keyword_counts"] = _value_counts(table, "keyword")
+
+        # 관련성 통계
+        if "is_relevant" in needed:
+            relevant_count = pc.sum(_relevant_mask(table.column("is_relevant"))).as_py() or 0
+            stats["relevant_count"] = relevant_count
+            stats["relevant_percent"] = round((relevant_count / metadata.num_rows) * 100, 1)
+
+        # 카테고리 통계
+        if "category" in needed:
+            stats["category_counts"] = _value_counts(table, "category")
+
+        return stats
+    except Exception as e:
+        logger.error(f"Error getting statistics for Parquet file '{parquet_path}': {str(e)}")
+        return {"error": str(e)}
+
+
+def get_parquet_preview(parquet_path: str, max_rows: int = 5) -> Dict[str, Any]:
+    """
+    Parquet 파일 미리보기 (앞쪽 행 그룹만 읽음)
+
+    Args:
+        parquet_path: Parquet 파일 경로
+        max_rows: 최대 행 수 (기본값: 5)
+
+    Returns:
+        미리보기 데이터 (get_csv_preview와 같은 형식)
+    """
+    import pyarrow.parquet as pq
+
+    try:
+        parquet_file = pq.ParquetFile(parquet_path)
+        column_names = parquet_file.schema_arrow.names
+        preview_data = []
+        if max_rows > 0:
+            for batch in parquet_file.iter_batches(batch_size=max_rows):
+                preview_data = batch.slice(0, max_rows).to_pylist()
+                break
+
+        return {
+            "total_rows": parquet_file.metadata.num_rows,
+            "total_columns": len(column_names),
+            "column_names": column_names,
+            "preview_data": preview_data
+        }
+    except Exception as e:
+        logger.error(f"Error getting preview for Parquet file '{parquet_path}': {str(e)}")
+        return {"error": str(e)}
+
+
+def filter_parquet_rows(
+    parquet_path: str,
+    filters: Dict[str, str],
+    columns: Optional[List[str]] = None,
+    limit: int = 50,
+    offset: int = 0
+) -> Dict[str, Any]:
+    """
+    조건에 맞는 행 조회 (필터 열과 반환할 열만 읽음)
+
+    Args:
+        parquet_path: Parquet 파일 경로
+        filters: 열 이름별 값 (is_relevant는 true/false)
+        columns: 반환할 열 목록 (기본값: 전체)
+        limit: 최대 행 수
+        offset: 건너뛸 행 수
+
+    Returns:
+        {"total_matched", "column_names", "rows"}
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    try:
+        column_names = _column_names(parquet_path)
+        output_columns = [name for name in (columns or column_names) if name in column_names]
+        if any(name not in column_names for name in filters):
+            # 없는 열로 필터링하면 일치하는 행이 없음
+            return {"total_matched": 0, "column_names": output_columns, "rows": []}
+        filter_columns = list(filters)
+
+        table = pq.read_table(parquet_path, columns=list(dict.fromkeys(filter_columns + output_columns)))
+        mask = None
+        for name in filter_columns:
+            value = filters[name]
+            if name == "is_relevant":
+                condition = _relevant_mask(table.column(name))
+                if str(value).lower() not in TRUE_VALUES:
+                    condition = pc.invert(condition)
+            else:
+                condition = pc.equal(pc.cast(table.column(name), "string"), str(value))
+            mask = condition if mask is None else pc.and_(mask, condition)
+
+        matched = table.filter(mask) if mask is not None else table
+        rows = matched.select(output_columns).slice(max(0, offset), max(0, limit)).to_pylist()
+        return {"total_matched": matched.num_rows, "column_names": output_columns, "rows": rows}
+    except Exception as e:
+        logger.error(f"Error filtering Parquet file '{parquet_path}': {str(e)}")
+        return {"error": str(e)}
+
+
+def _filter_csv_rows(
+    csv_path: str,
+    filters: Dict[str, str],
+    columns: Optional[List[str]] = None,
+    limit: int = 50,
+    offset: int = 0
+) -> Dict[str, Any]:
+    data = read_csv(csv_path)
+    column_names = list(data[0].keys()) if data else []
+    output_columns = [name for name in (columns or column_names) if name in column_names]
+
+    def matches(row: Dict[str, Any]) -> bool:
+        for name, value in filters.items():
+            if name not in row:
+                return False
+            if name == "is_relevant":
+                if (str(row[name]).lower() in TRUE_VALUES) != (str(value).lower() in TRUE_VALUES):
+                    return False
+            elif row[name] != str(value):
+                return False
+        return True
+
+    matched = [row for row in data if matches(row)]
+    start = max(0, offset)
+    rows = [{name: row[name] for name in output_columns} for row in matched[start:start + max(0, limit)]]
+    return {"total_matched": len(matched), "column_names": output_columns, "rows": rows}
+
+
+def get_result_statistics(csv_path: str) -> Dict[str, Any]:
+    """
+    결과 파일 통계 정보 (저장된 통계 파일이 현재 파일과 일치하면 그대로 사용하고,
+    아니면 Parquet 파일의 필요한 열만 읽거나 CSV 전체를 읽어 계산한 뒤 통계 파일 갱신)
+    """
+    cached = load_statistics_sidecar(csv_path)
+    if cached is not None:
+        return cached
+    parquet_path = fresh_columnar_path(csv_path)
+    if parquet_path:
+        signature = _file_signature(csv_path)
+        stats = get_parquet_statistics(parquet_path)
+        if "error" not in stats:
+            write_statistics_sidecar(csv_path, stats, signature)
+            return stats
+    return get_csv_statistics(csv_path)
+
+
+def get_result_preview(csv_path: str, max_rows: int = 5) -> Dict[str, Any]:
+    """
+    결과 파일 미리보기 (Parquet 파일이 있으면 행 수를 메타데이터에서 바로 읽음)
+    """
+    parquet_path = fresh_columnar_path(csv_path)
+    if parquet_path:
+        preview = get_parquet_preview(parquet_path, max_rows)
+        if "error" not in preview:
+            return preview
+    return get_csv_preview(csv_path, max_rows)
+
+
+def filter_result_rows(
+    csv_path: str,
+    filters: Dict[str, str],
+    columns: Optional[List[str]] = None,
+    limit: int = 50,
+    offset: int = 0
+) -> Dict[str, Any]:
+    """
+    결과 파일에서 조건에 맞는 행 조회 (Parquet 파일이 없으면 CSV를 읽어 필터링)
+
+    Args:
+        csv_path: 결과 CSV 파일 경로
+        filters: 열 이름별 값 (is_relevant는 true/false)
+        columns: 반환할 열 목록 (기본값: 전체)
+        limit: 최대 행 수
+        offset: 건너뛸 행 수
+
+    Returns:
+        {"total_matched", "column_names", "rows", "storage"}
+    """
+    parquet_path = fresh_columnar_path(csv_path)
+    if parquet_path:
+        result = filter_parquet_rows(parquet_path, filters, columns, limit, offset)
+        if "error" not in result:
+            result["storage"] = "parquet"
+            return result
+    if not filters:
+        # 조건이 없으면 행 위치 색인으로 요청한 구간만 읽음
+        page = read_csv_page(csv_path, offset, limit)
+        if "error" not in page:
+            column_names = [name for name in columns if name in page["column_names"]] if columns else page["column_names"]
+            return {
+                "total_matched": page["total_rows"],
+                "column_names": column_names,
+                "rows": [{name: row.get(name) for name in column_names} for row in page["rows"]],
+                "storage": "csv"
+            }
+    try:
+        result = _filter_csv_rows(csv_path, filters, columns, limit, offset)
+    except Exception as e:
+        logger.error(f"Error filtering CSV file '{csv_path}': {str(e)}")
+        return {"error": str(e)}
+    result["storage"] = "csv"
+    return result
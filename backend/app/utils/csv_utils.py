@@ -2,14 +2,280 @@
 # -*- coding: utf-8 -*-
 
 import csv
+import io
 import os
 import json
+import codecs
 import shutil
+import struct
 import datetime
 import pandas as pd
+from array import array
 from typing import List, Dict, Any, Optional, Tuple
 
-def save_to_csv(data: List[Dict[str, Any]], file_path: str, encoding: str = 'utf-8-sig', copy_to_download: bool = False, download_path: str = None) -> Tuple[bool, Optional[str]]:
+# 목록 값(matched_keywords 등)을 한 칸에 저장할 때 사용하는 구분자
+LIST_SEPARATOR = "|"
+
+# 통계 파일 확장자 (결과 파일과 같은 이름으로 저장)
+STATISTICS_EXTENSION = ".stats.json"
+STATISTICS_VERSION = 1
+
+# 행 위치 색인 파일 확장자와 헤더 (식별자, 버전, CSV 크기, CSV 수정 시각, 행 수) 뒤에 행별 시작 바이트 위치(uint64)
+ROW_INDEX_EXTENSION = ".idx"
+ROW_INDEX_MAGIC = b"NCROWIDX"
+ROW_INDEX_VERSION = 1
+ROW_INDEX_HEADER = struct.Struct("<8sIQqQ")
+
+def _flatten_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    목록 값을 구분자로 이어 붙인 문자열로 변환
+    """
+    return {k: LIST_SEPARATOR.join(str(v) for v in value) if isinstance(value, (list, tuple)) else value
+            for k, value in row.items()}
+
+class CsvStatistics:
+    """
+    행을 하나씩 받아 키워드/관련성/카테고리 통계를 한 번에 누적 (get_csv_statistics와 같은 형식)
+    """
+    def __init__(self, column_names: List[str]):
+        self.column_names = list(column_names)
+        self.total_rows = 0
+        self.keyword_counts: Dict[str, int] = {}
+        self.relevant_count = 0
+        self.category_counts: Dict[str, int] = {}
+
+    def add(self, row: Dict[str, Any]) -> None:
+        self.total_rows += 1
+        keyword = row.get('keyword', '')
+        if keyword:
+            self.keyword_counts[str(keyword)] = self.keyword_counts.get(str(keyword), 0) + 1
+        if str(row.get('is_relevant', '')).lower() in ['true', '1', 'yes']:
+            self.relevant_count += 1
+        category = row.get('category', '')
+        if category:
+            self.category_counts[str(category)] = self.category_counts.get(str(category), 0) + 1
+
+    def result(self) -> Dict[str, Any]:
+        if not self.total_rows:
+            return {"error": "Empty file"}
+        
+        stats = {
+            "total_rows": self.total_rows,
+            "total_columns": len(self.column_names),
+            "column_names": self.column_names,
+        }
+        if 'keyword' in self.column_names:
+            stats["keyword_counts"] = self.keyword_counts
+        if 'is_relevant' in self.column_names:
+            stats["relevant_count"] = self.relevant_count
+            stats["relevant_percent"] = round((self.relevant_count / self.total_rows) * 100, 1)
+        if 'category' in self.column_names:
+            stats["category_counts"] = self.category_counts
+        return stats
+
+def statistics_path(file_path: str) -> str:
+    """
+    결과 파일에 대응하는 통계 파일 경로
+    """
+    base, _ = os.path.splitext(file_path)
+    return base + STATISTICS_EXTENSION
+
+def _file_signature(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+def write_statistics_sidecar(file_path: str, stats: Dict[str, Any], signature: Optional[Tuple[int, int]] = None) -> None:
+    """
+    통계 정보를 결과 파일 옆에 저장 (결과 파일의 크기와 수정 시각을 함께 기록)
+    
+    Args:
+        file_path: 결과 파일 경로
+        stats: 통계 정보
+        signature: 통계를 계산할 때의 (크기, 수정 시각) (기본값: 현재 파일 상태)
+    """
+    if "error" in stats:
+        return
+    
+    sidecar_path = statistics_path(file_path)
+    temp_path = f"{sidecar_path}.tmp"
+    try:
+        size, mtime_ns = signature or _file_signature(file_path)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": STATISTICS_VERSION, "size": size, "mtime_ns": mtime_ns, "stats": stats},
+                      f, ensure_ascii=False)
+        os.replace(temp_path, sidecar_path)
+    except Exception as e:
+        print(f"통계 파일 저장 중 오류: {str(e)}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def load_statistics_sidecar(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    저장된 통계 정보 읽기 (결과 파일의 크기나 수정 시각이 바뀌었으면 None)
+    """
+    try:
+        with open(statistics_path(file_path), 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+        if (sidecar.get("version") == STATISTICS_VERSION
+                and (sidecar.get("size"), sidecar.get("mtime_ns")) == _file_signature(file_path)):
+            return sidecar["stats"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return None
+
+def row_index_path(file_path: str) -> str:
+    """
+    결과 파일에 대응하는 행 위치 색인 파일 경로
+    """
+    base, _ = os.path.splitext(file_path)
+    return base + ROW_INDEX_EXTENSION
+
+def _write_row_index(file_path: str, offsets: array, signature: Tuple[int, int]) -> None:
+    """
+    행 위치 색인 저장 (CSV의 크기와 수정 시각을 함께 기록)
+    """
+    index_path = row_index_path(file_path)
+    temp_path = f"{index_path}.tmp"
+    try:
+        size, mtime_ns = signature
+        packed = array('Q', offsets)
+        if struct.pack('=H', 1) != struct.pack('<H', 1):
+            packed.byteswap()
+        with open(temp_path, 'wb') as f:
+            f.write(ROW_INDEX_HEADER.pack(ROW_INDEX_MAGIC, ROW_INDEX_VERSION, size, mtime_ns, len(packed)))
+            f.write(packed.tobytes())
+        os.replace(temp_path, index_path)
+    except Exception as e:
+        print(f"행 위치 색인 저장 중 오류: {str(e)}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def _read_row_index_count(file_path: str) -> Optional[int]:
+    """
+    행 위치 색인의 행 수 (색인이 없거나 CSV의 크기나 수정 시각이 바뀌었으면 None)
+    """
+    try:
+        with open(row_index_path(file_path), 'rb') as f:
+            magic, version, size, mtime_ns, count = ROW_INDEX_HEADER.unpack(f.read(ROW_INDEX_HEADER.size))
+        if magic == ROW_INDEX_MAGIC and version == ROW_INDEX_VERSION and (size, mtime_ns) == _file_signature(file_path):
+            return count
+    except (OSError, struct.error):
+        pass
+    return None
+
+def _read_row_offsets(file_path: str, start: int, stop: int) -> array:
+    """
+    행 위치 색인에서 start부터 stop 전까지의 행 시작 위치만 읽음
+    """
+    offsets = array('Q')
+    if stop <= start:
+        return offsets
+    with open(row_index_path(file_path), 'rb') as f:
+        f.seek(ROW_INDEX_HEADER.size + start * offsets.itemsize)
+        offsets.frombytes(f.read((stop - start) * offsets.itemsize))
+    if struct.pack('=H', 1) != struct.pack('<H', 1):
+        offsets.byteswap()
+    return offsets
+
+def build_row_index(file_path: str) -> int:
+    """
+    기존 CSV 파일의 행 위치 색인 생성 (한 번 순회, 따옴표 안의 줄바꿈은 같은 행으로 처리)
+    
+    Args:
+        file_path: CSV 파일 경로
+        
+    Returns:
+        행 수 (헤더 제외)
+    """
+    signature = _file_signature(file_path)
+    offsets = array('Q')
+    position = 0
+    record_start = 0
+    in_quotes = False
+    header_seen = False
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if not in_quotes:
+                record_start = position
+                if not line.strip():
+                    # 빈 줄은 csv 모듈처럼 행으로 세지 않음
+                    position += len(line)
+                    continue
+            # 따옴표는 ""로 이스케이프되므로 홀수 개이면 필드가 다음 줄로 이어짐
+            if line.count(b'"') % 2:
+                in_quotes = not in_quotes
+            position += len(line)
+            if not in_quotes:
+                if header_seen:
+                    offsets.append(record_start)
+                header_seen = True
+    
+    _write_row_index(file_path, offsets, signature)
+    return len(offsets)
+
+def ensure_row_index(file_path: str) -> int:
+    """
+    현재 파일과 일치하는 행 위치 색인을 준비하고 행 수 반환 (없거나 오래되었으면 다시 생성)
+    """
+    count = _read_row_index_count(file_path)
+    if count is None:
+        count = build_row_index(file_path)
+    return count
+
+def read_csv_page(file_path: str, offset: int = 0, limit: int = 50, encoding: str = 'utf-8-sig') -> Dict[str, Any]:
+    """
+    행 위치 색인으로 CSV 파일의 일부 행만 읽음 (파일 크기와 관계없이 요청한 행만 읽음)
+    
+    Args:
+        file_path: 파일 경로
+        offset: 건너뛸 행 수
+        limit: 최대 행 수
+        encoding: 파일 인코딩 (기본값: utf-8-sig)
+        
+    Returns:
+        {"total_rows", "total_columns", "column_names", "offset", "rows"}
+    """
+    if not os.path.exists(file_path):
+        return {"error": "File not found"}
+    
+    try:
+        total_rows = ensure_row_index(file_path)
+        offset = max(0, offset)
+        stop = min(total_rows, offset + max(0, limit))
+        # 요청한 행들의 시작 위치와 그다음 행의 시작 위치(마지막 행이면 파일 끝)
+        offsets = _read_row_offsets(file_path, 0, 1) if total_rows else array('Q')
+        page_offsets = _read_row_offsets(file_path, offset, min(total_rows, stop + 1))
+        file_size = os.path.getsize(file_path)
+        
+        with open(file_path, 'rb') as f:
+            header_bytes = f.read(offsets[0] if offsets else file_size)
+            column_names = next(csv.reader(io.StringIO(header_bytes.decode(encoding), newline='')), [])
+            
+            rows = []
+            if offset < stop:
+                end = page_offsets[stop - offset] if len(page_offsets) > stop - offset else file_size
+                f.seek(page_offsets[0])
+                text = f.read(end - page_offsets[0]).decode(encoding)
+                for values in csv.reader(io.StringIO(text, newline='')):
+                    if not values:
+                        continue
+                    row = dict(zip(column_names, values))
+                    for name in column_names[len(values):]:
+                        row[name] = None
+                    rows.append(row)
+        
+        return {
+            "total_rows": total_rows,
+            "total_columns": len(column_names),
+            "column_names": column_names,
+            "offset": offset,
+            "rows": rows
+        }
+    except Exception as e:
+        print(f"CSV 페이지 읽기 중 오류: {str(e)}")
+        return {"error": str(e)}
+
+def save_to_csv(data: List[Dict[str, Any]], file_path: str, encoding: str = 'utf-8-sig', copy_to_download: bool = False, download_path: str = None, write_statistics: bool = False, write_row_index: bool = False) -> Tuple[bool, Optional[str]]:
     """
     데이터를 CSV 파일로 저장합니다.
     
@@ -19,6 +285,8 @@ def save_to_csv(data: List[Dict[str, Any]], file_path: str, encoding: str = 'utf
         encoding: 파일 인코딩 (기본값: utf-8-sig)
         copy_to_download: 다운로드 폴더에 복사할지 여부
         download_path: 다운로드 폴더 경로
+        write_statistics: 저장하면서 통계 정보를 계산하여 통계 파일로 함께 저장할지 여부
+        write_row_index: 저장하면서 행별 시작 위치를 기록하여 행 위치 색인 파일로 함께 저장할지 여부
         
     Returns:
         (저장 성공 여부, 다운로드 폴더에 저장된 파일 경로)
@@ -33,11 +301,31 @@ def save_to_csv(data: List[Dict[str, Any]], file_path: str, encoding: str = 'utf
         # 필드명 추출
         fieldnames = list(data[0].keys())
         
-        # CSV 파일 저장
-        with open(file_path, 'w', newline='', encoding=encoding) as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+        # CSV 파일 저장 (통계와 행 위치는 같은 순회에서 계산)
+        # 행마다 인코딩한 바이트 수로 행 시작 위치를 계산 (BOM은 파일 맨 앞에 한 번만 기록됨)
+        statistics = CsvStatistics(fieldnames) if write_statistics else None
+        offsets = array('Q') if write_row_index else None
+        encoder = codecs.getincrementalencoder(encoding)()
+        row_buffer = io.StringIO(newline='')
+        writer = csv.DictWriter(row_buffer, fieldnames=fieldnames)
+        with open(file_path, 'wb') as f:
             writer.writeheader()
-            writer.writerows(data)
+            position = f.write(encoder.encode(row_buffer.getvalue()))
+            for row in data:
+                flat_row = _flatten_row(row)
+                row_buffer.seek(0)
+                row_buffer.truncate()
+                writer.writerow(flat_row)
+                if offsets is not None:
+                    offsets.append(position)
+                position += f.write(encoder.encode(row_buffer.getvalue()))
+                if statistics is not None:
+                    statistics.add(flat_row)
+            f.write(encoder.encode('', final=True))
+        if statistics is not None:
+            write_statistics_sidecar(file_path, statistics.result())
+        if offsets is not None:
+            _write_row_index(file_path, offsets, _file_signature(file_path))
         
         # 다운로드 폴더에 복사
         downloaded_path = None
@@ -83,7 +371,7 @@ def save_to_excel(data: List[Dict[str, Any]], file_path: str, copy_to_download:
         os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
         
         # DataFrame 생성 및 Excel 파일 저장
-        df = pd.DataFrame(data)
+        df = pd.DataFrame([_flatten_row(row) for row in data])
         
         # 파일 확장자가 .xlsx가 아니면 추가
         if not file_path.endswith('.xlsx'):
@@ -176,7 +464,7 @@ def get_csv_preview(file_path: str, max_rows: int = 5, encoding: str = 'utf-8-si
 
 def get_csv_row_count(file_path: str, encoding: str = 'utf-8-sig') -> int:
     """
-    CSV 파일의 행 수를 계산합니다.
+    CSV 파일의 행 수를 계산합니다. (행 위치 색인 사용)
     
     Args:
         file_path: 파일 경로
@@ -189,11 +477,8 @@ def get_csv_row_count(file_path: str, encoding: str = 'utf-8-sig') -> int:
         return 0
     
     try:
-        with open(file_path, 'r', encoding=encoding) as f:
-            # 헤더 제외
-            reader = csv.reader(f)
-            next(reader)  # 헤더 건너뛰기
-            return sum(1 for _ in reader)
+        # 행 위치 색인이 있으면 헤더만 읽고, 없으면 한 번 순회하여 색인을 만든 뒤 다음부터 재사용
+        return ensure_row_index(file_path)
     except Exception:
         return 0
 
@@ -201,6 +486,9 @@ def get_csv_statistics(file_path: str, encoding: str = 'utf-8-sig') -> Dict[str,
     """
     CSV 파일의 통계 정보를 계산합니다.
     
+    저장된 통계 파일이 현재 파일과 일치하면 그대로 사용하고, 파일이 바뀌었으면
+    한 번 순회하여 다시 계산한 뒤 통계 파일을 갱신합니다.
+    
     Args:
         file_path: 파일 경로
         encoding: 파일 인코딩 (기본값: utf-8-sig)
@@ -211,44 +499,21 @@ def get_csv_statistics(file_path: str, encoding: str = 'utf-8-sig') -> Dict[str,
     if not os.path.exists(file_path):
         return {"error": "File not found"}
     
+    cached = load_statistics_sidecar(file_path)
+    if cached is not None:
+        return cached
+    
     try:
-        # CSV 파일 읽기
-        data = read_csv(file_path, encoding)
-        
-        if not data:
-            return {"error": "Empty file"}
-        
-        # 기본 통계
-        stats = {
-            "total_rows": len(data),
-            "total_columns": len(data[0].keys()) if data else 0,
-            "column_names": list(data[0].keys()) if data else [],
-        }
-        
-        # 키워드 통계
-        if 'keyword' in stats["column_names"]:
-            keyword_counts = {}
-            for row in data:
-                keyword = row.get('keyword', '')
-                if keyword:
-                    keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-            stats["keyword_counts"] = keyword_counts
-        
-        # 관련성 통계
-        if 'is_relevant' in stats["column_names"]:
-            relevant_count = sum(1 for row in data if str(row.get('is_relevant', '')).lower() in ['true', '1', 'yes'])
-            stats["relevant_count"] = relevant_count
-            stats["relevant_percent"] = round((relevant_count / len(data)) * 100, 1) if data else 0
-        
-        # 카테고리 통계
-        if 'category' in stats["column_names"]:
-            category_counts = {}
-            for row in data:
-                category = row.get('category', '')
-                if category:
-                    category_counts[category] = category_counts.get(category, 0) + 1
-            stats["category_counts"] = category_counts
+        # 읽는 중에 파일이 바뀌어도 다음 요청에서 다시 계산하도록 읽기 전 상태를 기록
+        signature = _file_signature(file_path)
+        with open(file_path, 'r', encoding=encoding) as f:
+            reader = csv.DictReader(f)
+            statistics = CsvStatistics(reader.fieldnames or [])
+            for row in reader:
+                statistics.add(row)
         
+        stats = statistics.result()
+        write_statistics_sidecar(file_path, stats, signature)
         return stats
     except Exception as e:
         print(f"CSV 통계 계산 중 오류: {str(e)}")
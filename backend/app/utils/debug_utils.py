@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 진단용 로깅/페이지 덤프 유틸리티
+로그 레벨이 꺼져 있으면 메시지를 만들지 않고 (값이 함수이면 호출하지도 않음),
+페이지 덤프는 설정으로 켰을 때만 실패 페이지와 일부 샘플 페이지를 파일로 저장
+"""
+
+import datetime
+import logging
+import os
+import random
+import re
+import threading
+from typing import Any, Optional
+
+
+def log_event(logger: logging.Logger, level: int, event: str, **fields: Any) -> None:
+    """
+    구조화된 이벤트 로그 (예: "page.fetched keyword=코스맥스 page=2 status=200")
+
+    Args:
+        logger: 로거
+        level: 로그 레벨
+        event: 이벤트 이름
+        **fields: 이벤트 필드 (호출 가능한 값은 로그가 실제로 기록될 때만 평가)
+    """
+    if not logger.isEnabledFor(level):
+        return
+
+    parts = [event]
+    for key, value in fields.items():
+        if callable(value):
+            value = value()
+        parts.append(f"{key}={value!r}" if isinstance(value, str) and (' ' in value or not value) else f"{key}={value}")
+    logger.log(level, " ".join(parts))
+
+
+class PageDumper:
+    """
+    디버깅용 원본 페이지 저장기
+    실패한 페이지는 항상, 정상 페이지는 sample_rate 비율만큼 저장
+    """
+    def __init__(self, directory: str, sample_rate: float = 0.0, max_files: int = 200):
+        """
+        Args:
+            directory: 저장 디렉토리
+            sample_rate: 정상 페이지 저장 비율 (0.0 ~ 1.0)
+            max_files: 프로세스당 최대 저장 파일 수
+        """
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.max_files = max_files
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> bool:
+        with self._lock:
+            if self._count >= self.max_files:
+                return False
+            self._count += 1
+            return True
+
+    def dump(self, html: str, reason: str, keyword: str, page: int, failed: bool = True) -> Optional[str]:
+        """
+        페이지 저장
+
+        Args:
+            html: 페이지 HTML
+            reason: 저장 사유 (http_403, no_items, parse_error, sample 등)
+            keyword: 검색 키워드
+            page: 페이지 번호
+            failed: 실패 페이지 여부 (False이면 sample_rate에 따라 저장)
+
+        Returns:
+            저장된 파일 경로 또는 None
+        """
+        if not failed and random.random() >= self.sample_rate:
+            return None
+        if not self._reserve():
+            return None
+
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        safe_keyword = re.sub(r'[\\/:*?"<>|\s]+', '_', keyword)[:50]
+        file_path = os.path.join(self.directory, f"{timestamp}_{reason}_{safe_keyword}_p{page}.html")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            return file_path
+        except OSError:
+            return None
@@ -8,6 +8,8 @@ import pandas as pd
 from typing import List, Dict, Any, Optional
 import datetime
 
+from app.utils.csv_utils import get_csv_row_count
+
 logger = logging.getLogger(__name__)
 
 def get_csv_files(directory: str) -> List[Dict[str, Any]]:
@@ -105,18 +107,18 @@ def get_file_content_preview(file_path: str, max_rows: int = 5) -> Dict[str, Any
         return {"error": "File not found"}
     
     try:
-        # CSV 파일 읽기
-        df = pd.read_csv(file_path, encoding='utf-8-sig')
+        # 미리보기할 행만 읽음 (전체 행 수는 행 위치 색인에서 가져옴)
+        df = pd.read_csv(file_path, encoding='utf-8-sig', nrows=max_rows)
         
         # 기본 정보
-        total_rows, total_cols = df.shape
+        total_cols = df.shape[1]
         column_names = df.columns.tolist()
         
         # 미리보기 데이터 (최대 행 수만큼)
-        preview_data = df.head(max_rows).to_dict('records')
+        preview_data = df.to_dict('records')
         
         return {
-            "total_rows": total_rows,
+            "total_rows": get_csv_row_count(file_path),
             "total_columns": total_cols,
             "column_names": column_names,
             "preview_data": preview_data
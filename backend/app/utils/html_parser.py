@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+검색 결과 페이지 HTML 파서 백엔드
+lxml/selectolax가 설치되어 있으면 사용하고, 없으면 html.parser로 대체.
+뉴스 목록 영역(#main_pack)만 파싱하여 페이지 전체 트리를 만들지 않음
+"""
+
+import importlib.util
+import logging
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 파서 이름
+PARSER_AUTO = "auto"
+PARSER_LXML = "lxml"
+PARSER_HTML = "html.parser"
+PARSER_SELECTOLAX = "selectolax"
+
+
+def _is_installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def available_parsers() -> List[str]:
+    """
+    현재 환경에서 사용 가능한 파서 목록
+    """
+    parsers = [PARSER_HTML]
+    if _is_installed("lxml"):
+        parsers.append(PARSER_LXML)
+    if _is_installed("selectolax"):
+        parsers.append(PARSER_SELECTOLAX)
+    return parsers
+
+
+def _bs4_backend() -> str:
+    return PARSER_LXML if _is_installed("lxml") else PARSER_HTML
+
+
+def resolve_parser(name: Optional[str]) -> str:
+    """
+    설정된 파서 이름을 실제 사용할 파서로 변환 (설치되지 않은 경우 html.parser)
+    """
+    if not name or name == PARSER_AUTO:
+        return _bs4_backend()
+    if name in available_parsers():
+        return name
+    logger.warning(f"HTML parser '{name}' is not installed, falling back to {PARSER_HTML}")
+    return PARSER_HTML
+
+
+def _slice_with_selectolax(html: str, scope: str) -> Optional[str]:
+    """
+    selectolax로 문서를 빠르게 훑어 scope 영역의 HTML만 잘라냄
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:
+        # selectolax 1.0 미만 버전
+        from selectolax.parser import HTMLParser
+
+    node = HTMLParser(html).css_first(f"#{scope}")
+    return node.html if node is not None else None
+
+
+def parse_html(html: str, parser: Optional[str] = None, scope: Optional[str] = None) -> BeautifulSoup:
+    """
+    HTML을 BeautifulSoup 트리로 파싱
+
+    Args:
+        html: HTML 문자열
+        parser: 파서 이름 (auto, lxml, html.parser, selectolax)
+        scope: 파싱할 영역의 요소 id (예: main_pack). 없으면 전체 문서 파싱
+
+    Returns:
+        파싱된 BeautifulSoup 객체 (scope 영역을 찾지 못하면 전체 문서)
+    """
+    parser = resolve_parser(parser)
+
+    if scope:
+        if parser == PARSER_SELECTOLAX:
+            fragment = _slice_with_selectolax(html, scope)
+            if fragment is not None:
+                return BeautifulSoup(fragment, _bs4_backend())
+        else:
+            soup = BeautifulSoup(html, parser, parse_only=SoupStrainer(id=scope))
+            if soup.find() is not None:
+                return soup
+        logger.debug(f"Parse scope '#{scope}' not found, parsing full document")
+
+    return BeautifulSoup(html, _bs4_backend() if parser == PARSER_SELECTOLAX else parser)
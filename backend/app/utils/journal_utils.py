@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+작업 재개용 체크포인트 저널 (JSON Lines)
+첫 줄에 입력 파일 지문을 기록하고, 완료된 행 결과를 한 줄씩 추가하여
+작업이 중단되어도 같은 입력으로 다시 실행하면 완료된 행부터 이어서 처리
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def file_fingerprint(file_path: str, *extra: str) -> str:
+    """
+    파일 내용(및 추가 값)의 SHA-256 지문
+
+    Args:
+        file_path: 파일 경로
+        *extra: 지문에 포함할 추가 값 (모델 이름 등)
+
+    Returns:
+        지문 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    for value in extra:
+        digest.update(b'\0' + value.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class CheckpointJournal:
+    """
+    행 단위 결과 저널
+    """
+    def __init__(self, path: str, fingerprint: str):
+        """
+        Args:
+            path: 저널 파일 경로
+            fingerprint: 입력 지문 (다르면 이전 저널을 버리고 새로 시작)
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+
+    def load(self) -> Dict[int, Dict[str, Any]]:
+        """
+        완료된 행 결과 읽기 (지문이 다르거나 저널이 없으면 빈 결과)
+        중단 시점에 잘린 마지막 줄은 무시
+
+        Returns:
+            행 위치 -> 결과
+        """
+        if not os.path.exists(self.path):
+            return {}
+
+        completed: Dict[int, Dict[str, Any]] = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+                if line_number == 0:
+                    # 헤더를 읽을 수 없으면 어느 입력의 저널인지 알 수 없으므로 버림
+                    if not isinstance(entry, dict) or entry.get("fingerprint") != self.fingerprint:
+                        logger.info(f"Checkpoint {self.path} belongs to a different input, starting over")
+                        return {}
+                    continue
+                if not isinstance(entry, dict) or "row" not in entry or "result" not in entry:
+                    logger.warning(f"Ignoring invalid checkpoint line {line_number + 1} in {self.path}")
+                    continue
+                try:
+                    completed[int(entry["row"])] = entry["result"]
+                except (TypeError, ValueError):
+                    logger.warning(f"Ignoring invalid checkpoint line {line_number + 1} in {self.path}")
+        return completed
+
+    def start(self, resume: bool) -> None:
+        """
+        저널 시작 (resume이 False이면 지문 헤더만 있는 새 저널 생성)
+        이어서 기록할 때는 중단 시점에 잘린 마지막 줄을 잘라내어 새 결과가 그 뒤에 붙지 않도록 함
+        """
+        if resume and os.path.exists(self.path):
+            self._truncate_partial_line()
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"fingerprint": self.fingerprint}) + "\n")
+
+    def _truncate_partial_line(self) -> None:
+        with open(self.path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            # 마지막 줄바꿈 위치를 뒤에서부터 찾음
+            position = size
+            while position > 0:
+                start = max(0, position - 65536)
+                f.seek(start)
+                chunk = f.read(position - start)
+                newline = chunk.rfind(b"\n")
+                if newline >= 0:
+                    position = start + newline + 1
+                    break
+                position = start
+            logger.warning(f"Truncating partial last line of checkpoint {self.path}")
+            f.truncate(position)
+            if position == 0:
+                # 헤더까지 잘렸으면 헤더부터 다시 기록
+                f.seek(0)
+                f.write((json.dumps({"fingerprint": self.fingerprint}) + "\n").encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append(self, results: Dict[int, Dict[str, Any]]) -> None:
+        """
+        완료된 행 결과 추가 (디스크에 기록될 때까지 대기)
+        """
+        if not results:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for row, result in results.items():
+                f.write(json.dumps({"row": row, "result": result}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        """
+        작업 완료 후 저널 삭제
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
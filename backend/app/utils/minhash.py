@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MinHash + LSH 기반 유사 문서 군집화 유틸리티
+문자 n-gram 집합의 MinHash 서명을 밴드로 나누어 버킷에 넣고,
+같은 버킷에 들어간 후보 쌍만 비교하여 전체 쌍 비교(O(n^2)) 없이 유사 문서를 묶음
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+# MinHash 해시 함수에 사용하는 메르센 소수 (2^31 - 1)
+_PRIME = (1 << 31) - 1
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    """
+    공백을 정리한 소문자 텍스트의 문자 n-gram 집합
+
+    Args:
+        text: 원본 텍스트
+        size: n-gram 길이
+
+    Returns:
+        n-gram 집합 (텍스트가 size보다 짧으면 텍스트 자체)
+    """
+    text = _WHITESPACE_PATTERN.sub(' ', text).strip().lower()
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """
+    고정된 해시 함수 집합으로 MinHash 서명 생성 (같은 seed이면 실행 간 서명이 같음)
+    """
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """
+        Args:
+            num_perm: 서명 길이 (해시 함수 수)
+            seed: 해시 함수 계수 생성용 seed
+        """
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, _PRIME, size=(num_perm, 1), dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=(num_perm, 1), dtype=np.int64).astype(np.uint64)
+
+    def signature(self, tokens: Iterable[str]) -> np.ndarray:
+        """
+        n-gram 집합의 MinHash 서명
+
+        Returns:
+            길이 num_perm의 서명 (빈 집합이면 모두 최댓값)
+        """
+        hashes = np.fromiter(
+            (zlib.crc32(token.encode('utf-8')) % _PRIME for token in tokens),
+            dtype=np.uint64
+        )
+        if hashes.size == 0:
+            return np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1)
+
+
+def estimate_similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """
+    두 MinHash 서명으로 자카드 유사도 추정
+    """
+    return float(np.mean(first == second))
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> None:
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x != root_y:
+            # 앞쪽 문서가 대표가 되도록 작은 번호를 루트로 유지
+            if root_y < root_x:
+                root_x, root_y = root_y, root_x
+            self.parent[root_y] = root_x
+
+
+def cluster_texts(
+    texts: List[str],
+    threshold: float = 0.6,
+    num_perm: int = 64,
+    bands: int = 16,
+    shingle_size: int = 3
+) -> Tuple[List[int], Dict[str, int]]:
+    """
+    유사 문서 군집화
+
+    Args:
+        texts: 문서 목록
+        threshold: 같은 군집으로 묶을 최소 추정 자카드 유사도
+        num_perm: MinHash 서명 길이
+        bands: LSH 밴드 수 (num_perm의 약수, 많을수록 후보가 늘어남)
+        shingle_size: 문자 n-gram 길이
+
+    Returns:
+        (문서별 군집 대표 문서 위치, 통계)
+    """
+    if num_perm % bands != 0:
+        raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+    rows = num_perm // bands
+    hasher = MinHasher(num_perm)
+    signatures = [hasher.signature(shingles(text, shingle_size)) for text in texts]
+
+    # 밴드별 버킷 (같은 버킷의 문서만 후보 쌍)
+    buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+    for index, (text, signature) in enumerate(zip(texts, signatures)):
+        if not text.strip():
+            continue
+        for band in range(bands):
+            buckets[(band, signature[band * rows:(band + 1) * rows].tobytes())].append(index)
+
+    union_find = _UnionFind(len(texts))
+    compared: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for position, first in enumerate(members):
+            for second in members[position + 1:]:
+                if (first, second) in compared or union_find.find(first) == union_find.find(second):
+                    continue
+                compared.add((first, second))
+                if estimate_similarity(signatures[first], signatures[second]) >= threshold:
+                    union_find.union(first, second)
+
+    representatives = [union_find.find(index) for index in range(len(texts))]
+    stats = {
+        "documents": len(texts),
+        "candidate_pairs": len(compared),
+        "clusters": len(set(representatives))
+    }
+    return representatives, stats
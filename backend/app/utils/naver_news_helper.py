@@ -7,131 +7,195 @@
 여러 가지 CSS 선택자를 시도하여 필요한 정보를 추출하는 헬퍼 함수 모음
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
 import re
 import logging
+import threading
+
+from app.utils.debug_utils import log_event
 
 logger = logging.getLogger(__name__)
 
-def extract_news_items(soup):
-    """
-    뉴스 아이템 목록을 추출하는 함수
-    다양한 선택자를 순차적으로 시도
-    """
-    # 2025년 5월 최신 구조 (with debug info)
-    logger.debug(f"Soup content (first 500 chars): {str(soup)[:500]}")
-    
+# 뉴스 아이템 목록 선택자 (우선순위 순서, 설명)
+ITEM_SELECTORS = (
     # 원본 HTML 구조에서 추출한 선택자
-    items = soup.select('div.sds-comps-vertical-layout.sds-comps-full-layout.iYo99IP8GixD0iM_4cb8')
-    if items:
-        logger.info(f"News items found using 2025 May selector (vertical layout), count: {len(items)}")
-        return items
-        
+    ('div.sds-comps-vertical-layout.sds-comps-full-layout.iYo99IP8GixD0iM_4cb8', '2025 May selector (vertical layout)'),
     # 전체 기사 기본 이미지
-    items = soup.select('div.sds-comps-vertical-layout.sds-comps-full-layout._ZFrFZ37i2aIyKHzNWlA')
-    if items:
-        logger.info(f"News items found using 2025 May selector (_ZFrFZ37i2aIyKHzNWlA), count: {len(items)}")
-        return items
-        
+    ('div.sds-comps-vertical-layout.sds-comps-full-layout._ZFrFZ37i2aIyKHzNWlA', '2025 May selector (_ZFrFZ37i2aIyKHzNWlA)'),
     # 2025년 5월 구조 (Xpath 및 선택자 정보 기반)
-    items = soup.select('#main_pack > section > div > div > ul > li')
-    if items:
-        logger.info(f"News items found using latest 2025 May selector (xpath), count: {len(items)}")
-        return items
-    
+    ('#main_pack > section > div > div > ul > li', 'latest 2025 May selector (xpath)'),
     # 2025년 5월 구조 (ul 리스트 기반)
-    items = soup.select('ul.list_news._infinite_list li')
-    if items:
-        logger.info(f"News items found using 2025 May selector (list_news), count: {len(items)}")
-        return items
-        
+    ('ul.list_news._infinite_list li', '2025 May selector (list_news)'),
     # 다른 가능한 선택자들
-    selectors = [
-        'div.group_news > ul.list_news > li',
-        'ul.list_news > li',
-        'div.news_wrap.api_ani_send',
-        'div.news_area',
-        'div.newsitem',
-        'li.bx',
-        '#main_pack > section > div > div > ul > li'
-    ]
-    for selector in selectors:
-        items = soup.select(selector)
+    ('div.group_news > ul.list_news > li', 'selector: div.group_news > ul.list_news > li'),
+    ('ul.list_news > li', 'selector: ul.list_news > li'),
+    ('div.news_wrap.api_ani_send', 'selector: div.news_wrap.api_ani_send'),
+    ('div.news_area', 'selector: div.news_area'),
+    ('div.newsitem', 'selector: div.newsitem'),
+    ('li.bx', 'selector: li.bx')
+)
+_COMPILED_ITEM_SELECTORS = [(sv.compile(selector), selector, label) for selector, label in ITEM_SELECTORS]
+# 거의 모든 페이지에 일치하는 넓은 선택자 (선택자 캐시에 저장하지 않음)
+ITEM_CATCH_ALL_SELECTORS = frozenset({'li.bx'})
+
+
+def extract_news_items(soup, adaptive=False):
+    """
+    뉴스 아이템 목록을 추출하는 함수
+    다양한 선택자를 순차적으로 시도 (adaptive=True이면 지난번에 일치한 선택자를 먼저 시도하되,
+    우선순위가 더 높은 선택자가 일치하지 않는 경우에만 그 결과를 사용)
+    """
+    # 디버그 정보 (DEBUG 레벨일 때만 직렬화)
+    log_event(logger, logging.DEBUG, "news_items.soup", head=lambda: str(soup)[:500])
+    
+    cached = selector_memo.get('items') if adaptive else None
+    if cached is not None:
+        for position, (compiled, selector, label) in enumerate(_COMPILED_ITEM_SELECTORS):
+            if selector == cached:
+                items = compiled.select(soup)
+                outranked = items and any(
+                    higher.select_one(soup) is not None for higher, _, _ in _COMPILED_ITEM_SELECTORS[:position]
+                )
+                if items and not outranked:
+                    selector_memo.record_hit('items')
+                    log_event(logger, logging.DEBUG, "news_items.found", selector=label, cached=True, count=len(items))
+                    return items
+                break
+    
+    for compiled, selector, label in _COMPILED_ITEM_SELECTORS:
+        items = compiled.select(soup)
         if items:
-            logger.info(f"News items found using selector: {selector}, count: {len(items)}")
+            if adaptive:
+                selector_memo.record_miss('items', None if selector in ITEM_CATCH_ALL_SELECTORS else selector)
+            log_event(logger, logging.DEBUG, "news_items.found", selector=label, cached=False, count=len(items))
             return items
     
     # 모든 선택자가 실패한 경우 빈 리스트 반환
+    if adaptive:
+        selector_memo.record_miss('items', None)
     logger.warning("No news items found with any selectors")
     return []
 
+# 필드별 CSS 선택자 (우선순위 순서, 2025년 5월 최신 구조 우선)
+TITLE_SELECTORS = (
+    # 2025년 5월 최신 구조 (제공된 HTML 정보 기반)
+    'a.X0fMYp2dHd0TCUS2hjww.OgU1CD78f4cPaKGs1OeY span.sds-comps-text-ellipsis-1.sds-comps-text-type-headline1',
+    # 2025년 5월 구조 (다른 가능한 클래스)
+    'a.X0fMYp2dHd0TCUS2hjww span.sds-comps-text-ellipsis-1.sds-comps-text-type-headline1',
+    # 더 간단한 선택자
+    'span.sds-comps-text-ellipsis-1.sds-comps-text-type-headline1',
+    # 이전 버전 선택자들
+    'a.news_tit',
+    'div.news_area a.news_tit',
+    'div.news_wrap a.news_tit',
+    'a.api_txt_lines.api_txt_lines_title',
+    'div.news_contents h2.news_title',
+    'div.newslist_item a.newslist_item_title',
+    'div.news_area div.news_wrap a.news_tit'
+)
+
+URL_SELECTORS = (
+    # 2025년 5월 최신 구조
+    'a.X0fMYp2dHd0TCUS2hjww.OgU1CD78f4cPaKGs1OeY',
+    # 유사한 선택자
+    'a.X0fMYp2dHd0TCUS2hjww',
+    # 이전 버전 선택자들
+    'a.news_tit',
+    'div.news_area a.news_tit',
+    'div.news_wrap a.news_tit',
+    'a.api_txt_lines.api_txt_lines_title',
+    'div.news_info_group a.urlBtn',
+    'div.news_contents a.news_source_link'
+)
+
+SOURCE_SELECTORS = (
+    # 2025년 5월 최신 구조
+    'a.X0fMYp2dHd0TCUS2hjww.jTrMMxVViEpMe6SA4ef2 span.sds-comps-text-type-body2.sds-comps-text-weight-sm',
+    # 2025년 5월 구조
+    'div.sds-comps-profile-info-title span.sds-comps-text-type-body2.sds-comps-text-weight-sm',
+    # 더 간단한 선택자
+    'span.sds-comps-text-type-body2.sds-comps-text-weight-sm',
+    # 이전 버전 선택자들
+    'a.info.press',
+    'div.news_info a.info.press',
+    'div.news_area div.news_info a.info.press',
+    'div.news_dsc span.press',
+    'div.news_info_group div.news_source',
+    'div.news_contents span.news_source'
+)
+
+# 2025년 5월 최신 구조 - 예: "30분 전", "3일 전"
+DATE_SUBTEXT_SELECTOR = 'span.sds-comps-text-type-body2.sds-comps-text-weight-sm.sds-comps-profile-info-subtext'
+DATE_SELECTORS = (
+    # 2025년 5월 구조
+    'span.sds-comps-text-type-body2.sds-comps-text-weight-sm.sds-comps-profile-info-subtext span.sds-comps-text-type-body2.sds-comps-text-weight-sm',
+    # 더 간단한 선택자
+    'span.sds-comps-profile-info-subtext span'
+)
+DATE_LEGACY_SELECTORS = (
+    'span.info',
+    'div.news_info span.info',
+    'div.news_area div.news_info span.info',
+    'div.news_info_group div.news_time',
+    'div.news_contents span.news_date'
+)
+# 날짜/시간 패턴 (예: "1시간 전", "5분 전", "어제", "2025.05.08." 등)
+DATE_PATTERN = re.compile(r'([0-9]+분|[0-9]+시간|일|주|달|년)( 전)?|어제|오늘|[0-9]{4}\.[0-9]{2}\.[0-9]{2}\.?')
+
+CONTENT_SELECTORS = (
+    # 2025년 5월 최신 구조
+    'a.X0fMYp2dHd0TCUS2hjww.IaKmSOGPdofdPwPE6cyU span.sds-comps-text-ellipsis-3.sds-comps-text-type-body1',
+    # 2025년 5월 구조
+    'a.X0fMYp2dHd0TCUS2hjww span.sds-comps-text-ellipsis-3.sds-comps-text-type-body1',
+    # 더 간단한 선택자
+    'span.sds-comps-text-ellipsis-3.sds-comps-text-type-body1',
+    # 이전 버전 선택자들
+    'div.news_dsc',
+    'a.api_txt_lines.dsc_txt_wrap',
+    'div.news_area div.news_dsc',
+    'div.news_wrap div.news_dsc',
+    'div.news_contents p.news_description',
+    'div.newslist_item p.newslist_item_desc'
+)
+
+TITLE_FALLBACK_TAGS = ('h2', 'h3', 'h4', 'strong', 'a')
+TITLE_DEFAULT = "제목 없음"
+URL_DEFAULT = ""
+SOURCE_DEFAULT = "Unknown"
+DATE_DEFAULT = "Unknown"
+CONTENT_DEFAULT = ""
+
+
+def _is_relative_date(text):
+    return '전' in text or '분' in text or '일' in text or '시간' in text
+
+
+def _is_legacy_date(text):
+    return '전' in text or '분' in text or '시간' in text or '일' in text or '.' in text
+
+
 def extract_title(item):
     """
     뉴스 아이템에서 제목을 추출하는 함수
     """
-    # 2025년 5월 최신 구조 (제공된 HTML 정보 기반)
-    title_element = item.select_one('a.X0fMYp2dHd0TCUS2hjww.OgU1CD78f4cPaKGs1OeY span.sds-comps-text-ellipsis-1.sds-comps-text-type-headline1')
-    if title_element:
-        return title_element.get_text(strip=True)
-    
-    # 2025년 5월 구조 (다른 가능한 클래스)
-    title_element = item.select_one('a.X0fMYp2dHd0TCUS2hjww span.sds-comps-text-ellipsis-1.sds-comps-text-type-headline1')
-    if title_element:
-        return title_element.get_text(strip=True)
-
-    # 더 간단한 선택자로 시도
-    title_element = item.select_one('span.sds-comps-text-ellipsis-1.sds-comps-text-type-headline1')
-    if title_element:
-        return title_element.get_text(strip=True)
-    
-    # 다른 가능한 선택자들
-    selectors = [
-        'a.news_tit',
-        'div.news_area a.news_tit',
-        'div.news_wrap a.news_tit',
-        'a.api_txt_lines.api_txt_lines_title',
-        'div.news_contents h2.news_title',
-        'div.newslist_item a.newslist_item_title',
-        'div.news_area div.news_wrap a.news_tit'
-    ]
-    
-    for selector in selectors:
+    for selector in TITLE_SELECTORS:
         title_element = item.select_one(selector)
         if title_element:
             return title_element.get_text(strip=True)
     
     # 모든 선택자가 실패한 경우, 제목 포함 가능성이 있는 모든 텍스트 노드 확인
-    for tag in item.find_all(['h2', 'h3', 'h4', 'strong', 'a']):
+    for tag in item.find_all(list(TITLE_FALLBACK_TAGS)):
         if tag.get_text(strip=True) and len(tag.get_text(strip=True)) > 10:
             return tag.get_text(strip=True)
     
-    return "제목 없음"
+    return TITLE_DEFAULT
 
 def extract_url(item):
     """
     뉴스 아이템에서 URL을 추출하는 함수
     """
-    # 2025년 5월 최신 구조
-    url_element = item.select_one('a.X0fMYp2dHd0TCUS2hjww.OgU1CD78f4cPaKGs1OeY')
-    if url_element and url_element.has_attr('href'):
-        return url_element.get('href')
-        
-    # 유사한 선택자 시도 
-    url_element = item.select_one('a.X0fMYp2dHd0TCUS2hjww')
-    if url_element and url_element.has_attr('href'):
-        return url_element.get('href')
-    
-    # 다른 가능한 선택자들
-    selectors = [
-        'a.news_tit',
-        'div.news_area a.news_tit',
-        'div.news_wrap a.news_tit',
-        'a.api_txt_lines.api_txt_lines_title',
-        'div.news_info_group a.urlBtn',
-        'div.news_contents a.news_source_link'
-    ]
-    
-    for selector in selectors:
+    for selector in URL_SELECTORS:
         url_element = item.select_one(selector)
         if url_element and url_element.has_attr('href'):
             return url_element.get('href')
@@ -146,120 +210,56 @@ def extract_url(item):
         if a_tag.has_attr('href') and a_tag['href'].startswith('http'):
             return a_tag['href']
     
-    return ""
+    return URL_DEFAULT
 
 def extract_source(item):
     """
     뉴스 아이템에서 출처(언론사)를 추출하는 함수
     """
-    # 2025년 5월 최신 구조
-    source_element = item.select_one('a.X0fMYp2dHd0TCUS2hjww.jTrMMxVViEpMe6SA4ef2 span.sds-comps-text-type-body2.sds-comps-text-weight-sm')
-    if source_element:
-        return source_element.get_text(strip=True)
-        
-    # 2025년 5월 구조
-    source_element = item.select_one('div.sds-comps-profile-info-title span.sds-comps-text-type-body2.sds-comps-text-weight-sm')
-    if source_element:
-        return source_element.get_text(strip=True)
-
-    # 더 간단한 선택자로 시도
-    source_element = item.select_one('span.sds-comps-text-type-body2.sds-comps-text-weight-sm')
-    if source_element:
-        return source_element.get_text(strip=True)
-    
-    # 다른 가능한 선택자들
-    selectors = [
-        'a.info.press',
-        'div.news_info a.info.press',
-        'div.news_area div.news_info a.info.press',
-        'div.news_dsc span.press',
-        'div.news_info_group div.news_source',
-        'div.news_contents span.news_source'
-    ]
-    
-    for selector in selectors:
+    for selector in SOURCE_SELECTORS:
         source_element = item.select_one(selector)
         if source_element:
             return source_element.get_text(strip=True)
     
-    return "Unknown"
+    return SOURCE_DEFAULT
 
 def extract_date(item):
     """
     뉴스 아이템에서 날짜를 추출하는 함수
     """
-    # 2025년 5월 최신 구조 - 예: "30분 전", "3일 전"
-    date_elements = item.select('span.sds-comps-text-type-body2.sds-comps-text-weight-sm.sds-comps-profile-info-subtext')
+    date_elements = item.select(DATE_SUBTEXT_SELECTOR)
     for date_elem in date_elements:
         # 처음 나오는 날짜와 관련된 텍스트 찾기
-        if date_elem and ('전' in date_elem.text or '분' in date_elem.text or '일' in date_elem.text or '시간' in date_elem.text):
+        if date_elem and _is_relative_date(date_elem.text):
             return date_elem.get_text(strip=True)
     
-    # 2025년 5월 구조
-    date_element = item.select_one('span.sds-comps-text-type-body2.sds-comps-text-weight-sm.sds-comps-profile-info-subtext span.sds-comps-text-type-body2.sds-comps-text-weight-sm')
-    if date_element:
-        return date_element.get_text(strip=True)
-    
-    # 더 간단한 선택자
-    date_element = item.select_one('span.sds-comps-profile-info-subtext span')
-    if date_element:
-        return date_element.get_text(strip=True)
+    for selector in DATE_SELECTORS:
+        date_element = item.select_one(selector)
+        if date_element:
+            return date_element.get_text(strip=True)
     
-    # 이전 버전 선택자들
+    # 날짜/시간 패턴이 있는 span 확인
     all_spans = item.select('span')
     for span in all_spans:
         text = span.get_text(strip=True)
-        # 날짜/시간 패턴 확인 (예: "1시간 전", "5분 전", "어제", "2025.05.08." 등)
-        if re.search(r'([0-9]+분|[0-9]+시간|일|주|달|년)( 전)?|어제|오늘|[0-9]{4}\.[0-9]{2}\.[0-9]{2}\.?', text):
+        if DATE_PATTERN.search(text):
             return text
     
-    selectors = [
-        'span.info',
-        'div.news_info span.info',
-        'div.news_area div.news_info span.info',
-        'div.news_info_group div.news_time',
-        'div.news_contents span.news_date'
-    ]
-    
-    for selector in selectors:
+    # 이전 버전 선택자들
+    for selector in DATE_LEGACY_SELECTORS:
         elements = item.select(selector)
         for element in elements:
             text = element.get_text(strip=True)
-            if '전' in text or '분' in text or '시간' in text or '일' in text or '.' in text:
+            if _is_legacy_date(text):
                 return text
     
-    return "Unknown"
+    return DATE_DEFAULT
 
 def extract_content(item):
     """
     뉴스 아이템에서 내용(스니펫)을 추출하는 함수
     """
-    # 2025년 5월 최신 구조
-    content_element = item.select_one('a.X0fMYp2dHd0TCUS2hjww.IaKmSOGPdofdPwPE6cyU span.sds-comps-text-ellipsis-3.sds-comps-text-type-body1')
-    if content_element:
-        return content_element.get_text(strip=True)
-    
-    # 2025년 5월 구조
-    content_element = item.select_one('a.X0fMYp2dHd0TCUS2hjww span.sds-comps-text-ellipsis-3.sds-comps-text-type-body1')
-    if content_element:
-        return content_element.get_text(strip=True)
-    
-    # 더 간단한 선택자로 시도
-    content_element = item.select_one('span.sds-comps-text-ellipsis-3.sds-comps-text-type-body1')
-    if content_element:
-        return content_element.get_text(strip=True)
-    
-    # 다른 가능한 선택자들
-    selectors = [
-        'div.news_dsc',
-        'a.api_txt_lines.dsc_txt_wrap',
-        'div.news_area div.news_dsc',
-        'div.news_wrap div.news_dsc',
-        'div.news_contents p.news_description',
-        'div.newslist_item p.newslist_item_desc'
-    ]
-    
-    for selector in selectors:
+    for selector in CONTENT_SELECTORS:
         content_element = item.select_one(selector)
         if content_element:
             return content_element.get_text(strip=True)
@@ -269,7 +269,342 @@ def extract_content(item):
         if p_tag.get_text(strip=True) and len(p_tag.get_text(strip=True)) > 20:
             return p_tag.get_text(strip=True)
     
-    return ""
+    return CONTENT_DEFAULT
+
+class _Rule:
+    """
+    필드 추출 규칙 하나 (선택자 또는 태그 이름 + 조건)
+    """
+    __slots__ = ('field', 'index', 'rank', 'compiled', 'tag_names', 'classes', 'first_only', 'accept', 'value')
+
+    def __init__(self, field, selector=None, tag_names=None, first_only=True, accept=None, value=None):
+        self.field = field
+        self.index = -1
+        # 필드 안에서의 우선순위 (0이 가장 높음)
+        self.rank = -1
+        self.compiled = sv.compile(selector) if selector else None
+        self.first_only = first_only
+        self.accept = accept
+        self.value = value or _text_value
+        if selector:
+            # 가장 오른쪽 복합 선택자의 태그/클래스로 후보 요소를 빠르게 거름
+            name, _, class_str = selector.split()[-1].partition('.')
+            self.tag_names = (name,) if name else None
+            self.classes = frozenset(class_str.split('.')) if class_str else frozenset()
+        else:
+            self.tag_names = tuple(tag_names) if tag_names else None
+            self.classes = frozenset()
+
+    def probe(self, item):
+        """
+        이 규칙 하나만 아이템에 적용 (일치 요소 또는 None)
+        """
+        if self.compiled is not None:
+            if self.first_only:
+                element = self.compiled.select_one(item)
+                if element is not None and (self.accept is None or self.accept(element)):
+                    return element
+                return None
+            candidates = self.compiled.iselect(item)
+        else:
+            candidates = item.find_all(list(self.tag_names))
+        for element in candidates:
+            if self.accept is None or self.accept(element):
+                return element
+        return None
+
+    @property
+    def catch_all(self):
+        """
+        선택자 없이 태그 이름으로만 찾는 대체 규칙 여부 (어느 아이템에나 일치하기 쉬움)
+        """
+        return self.compiled is None
+
+
+def _text_value(element):
+    return element.get_text(strip=True)
+
+
+def _href_value(element):
+    return element.get('href')
+
+
+_REJECTED = object()
+
+
+class CompiledExtractor:
+    """
+    제목/URL/출처/날짜/내용 필드를 아이템 하위 트리 1회 순회로 추출하는 엔진
+
+    필드별 선택자 체인을 미리 컴파일하고, 순회 중 각 요소를 해당 태그 이름의 규칙과만 대조.
+    각 규칙의 첫 번째 일치 요소를 기록한 뒤 필드별 우선순위대로 결과를 고르므로
+    extract_title 등 개별 함수와 동일한 결과를 반환
+    """
+    FIELDS = ('title', 'url', 'source', 'date', 'content')
+    DEFAULTS = {
+        'title': TITLE_DEFAULT,
+        'url': URL_DEFAULT,
+        'source': SOURCE_DEFAULT,
+        'date': DATE_DEFAULT,
+        'content': CONTENT_DEFAULT
+    }
+
+    def __init__(self):
+        has_href = lambda el: el.has_attr('href')
+        long_text = lambda min_len: (lambda el: len(el.get_text(strip=True)) > min_len)
+
+        rules = []
+        # 제목
+        rules += [_Rule('title', selector) for selector in TITLE_SELECTORS]
+        rules.append(_Rule('title', tag_names=TITLE_FALLBACK_TAGS, first_only=False, accept=long_text(10)))
+        # URL (첫 번째 일치 요소에 href가 없으면 다음 선택자로)
+        rules += [_Rule('url', selector, accept=has_href, value=_href_value) for selector in URL_SELECTORS]
+        rules.append(_Rule('url', tag_names=('a',), first_only=False, value=_href_value,
+                           accept=lambda el: el.has_attr('href') and 'news.naver.com' in el['href']))
+        rules.append(_Rule('url', tag_names=('a',), first_only=False, value=_href_value,
+                           accept=lambda el: el.has_attr('href') and el['href'].startswith('http')))
+        # 출처
+        rules += [_Rule('source', selector) for selector in SOURCE_SELECTORS]
+        # 날짜
+        rules.append(_Rule('date', DATE_SUBTEXT_SELECTOR, first_only=False, accept=lambda el: _is_relative_date(el.text)))
+        rules += [_Rule('date', selector) for selector in DATE_SELECTORS]
+        rules.append(_Rule('date', tag_names=('span',), first_only=False,
+                           accept=lambda el: DATE_PATTERN.search(el.get_text(strip=True)) is not None))
+        rules += [_Rule('date', selector, first_only=False, accept=lambda el: _is_legacy_date(el.get_text(strip=True)))
+                  for selector in DATE_LEGACY_SELECTORS]
+        # 내용
+        rules += [_Rule('content', selector) for selector in CONTENT_SELECTORS]
+        rules.append(_Rule('content', tag_names=('p',), first_only=False, accept=long_text(20)))
+
+        for index, rule in enumerate(rules):
+            rule.index = index
+        self.rules = rules
+
+        # 필드별 규칙 (우선순위 순서)
+        self.field_rules = {field: [rule for rule in rules if rule.field == field] for field in self.FIELDS}
+        for field_rules in self.field_rules.values():
+            for rank, rule in enumerate(field_rules):
+                rule.rank = rank
+
+        # 태그 이름별 규칙 인덱스
+        self.rules_by_tag = {}
+        self.any_tag_rules = [rule for rule in rules if rule.tag_names is None]
+        for rule in rules:
+            for name in rule.tag_names or ():
+                self.rules_by_tag.setdefault(name, []).append(rule)
+
+    def _resolve(self, field, found):
+        """
+        필드 결과 결정
+
+        Returns:
+            (일치 규칙, 요소) - 모든 규칙이 실패하면 (None, None), 미확정 규칙이 남아 있으면 None
+        """
+        for rule in self.field_rules[field]:
+            element = found[rule.index]
+            if element is None:
+                return None
+            if element is not _REJECTED:
+                return rule, element
+        return None, None
+
+    def _scan(self, item, fields):
+        """
+        아이템 하위 트리를 1회 순회하며 필드별 (일치 규칙, 요소) 결정
+        """
+        found = [None] * len(self.rules)
+        pending = set(fields)
+
+        for element in item.descendants:
+            if not isinstance(element, Tag):
+                continue
+            candidates = self.rules_by_tag.get(element.name)
+            if self.any_tag_rules:
+                candidates = (candidates or []) + self.any_tag_rules
+            if not candidates:
+                continue
+
+            classes = None
+            matched = False
+            for rule in candidates:
+                if found[rule.index] is not None or rule.field not in pending:
+                    continue
+                if rule.classes:
+                    if classes is None:
+                        classes = set(element.get('class') or ())
+                    if not rule.classes <= classes:
+                        continue
+                if rule.compiled is not None and not rule.compiled.match(element):
+                    continue
+                if rule.first_only:
+                    found[rule.index] = element if (rule.accept is None or rule.accept(element)) else _REJECTED
+                elif rule.accept is None or rule.accept(element):
+                    found[rule.index] = element
+                else:
+                    continue
+                matched = True
+
+            if matched:
+                # 우선순위가 높은 규칙이 확정된 필드는 더 이상 순회할 필요 없음
+                pending = {field for field in pending if self._resolve(field, found) is None}
+                if not pending:
+                    break
+
+        # 순회가 끝나면 일치하지 않은 규칙은 모두 실패로 처리
+        resolved = {}
+        for field in fields:
+            for rule in self.field_rules[field]:
+                if found[rule.index] is None:
+                    found[rule.index] = _REJECTED
+            resolved[field] = self._resolve(field, found)
+        return resolved
+
+    def _value(self, field, rule, element):
+        return rule.value(element) if rule is not None else self.DEFAULTS[field]
+
+    def extract(self, item, fields=None):
+        """
+        아이템에서 필드 추출
+
+        Args:
+            item: 뉴스 아이템 요소
+            fields: 추출할 필드 목록 (기본값: 전체)
+
+        Returns:
+            필드명 -> 값 딕셔너리
+        """
+        fields = tuple(fields or self.FIELDS)
+        resolved = self._scan(item, fields)
+        return {field: self._value(field, *resolved[field]) for field in fields}
+
+    def _outranked(self, rule, item):
+        # 기억한 규칙보다 우선순위가 높은 규칙이 이 아이템에 일치하는지 확인
+        return any(higher.probe(item) is not None for higher in self.field_rules[rule.field][:rule.rank])
+
+    def extract_adaptive(self, item, memo):
+        """
+        지난번에 일치한 규칙을 먼저 시도하고, 실패한 필드만 전체 순회로 다시 탐색
+        기억한 규칙은 우선순위가 더 높은 규칙이 모두 실패할 때만 사용하므로 extract와 같은 결과를 반환하며,
+        대체 규칙(태그 이름만으로 찾는 규칙)은 기억하지 않음
+
+        Args:
+            item: 뉴스 아이템 요소
+            memo: 필드별 일치 규칙을 기억하는 SelectorMemo
+
+        Returns:
+            필드명 -> 값 딕셔너리
+        """
+        results = {}
+        missed = []
+        for field in self.FIELDS:
+            rule_index = memo.get(field)
+            if rule_index is not None:
+                rule = self.rules[rule_index]
+                element = rule.probe(item)
+                if element is not None and not self._outranked(rule, item):
+                    memo.record_hit(field)
+                    results[field] = rule.value(element)
+                    continue
+            missed.append(field)
+
+        if missed:
+            resolved = self._scan(item, missed)
+            for field in missed:
+                rule, element = resolved[field]
+                memo.record_miss(field, rule.index if rule is not None and not rule.catch_all else None)
+                results[field] = self._value(field, rule, element)
+
+        return {field: results[field] for field in self.FIELDS}
+
+
+class SelectorMemo:
+    """
+    필드별로 마지막에 일치한 선택자(규칙)를 기억하는 캐시
+    기억한 선택자가 실패할 때만 전체 선택자를 다시 탐색하며, 다른 선택자로 바뀌면 레이아웃 변경으로 기록
+    """
+    def __init__(self):
+        self._winners = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _field_stats(self, field):
+        if field not in self._stats:
+            self._stats[field] = {"hits": 0, "misses": 0, "layout_changes": 0}
+        return self._stats[field]
+
+    def get(self, field):
+        return self._winners.get(field)
+
+    def record_hit(self, field):
+        with self._lock:
+            self._field_stats(field)["hits"] += 1
+
+    def record_miss(self, field, winner):
+        """
+        캐시 실패 기록 및 새로 일치한 선택자 저장
+
+        Args:
+            field: 필드명
+            winner: 새로 일치한 선택자 (규칙 인덱스 또는 아이템 선택자 문자열), 없거나 기억하지 않을 대체 선택자이면 None
+        """
+        with self._lock:
+            stats = self._field_stats(field)
+            stats["misses"] += 1
+            if winner is None:
+                return
+            previous = self._winners.get(field)
+            if previous is not None and previous != winner:
+                stats["layout_changes"] += 1
+                log_event(logger, logging.DEBUG, "selector.changed", field=field, previous=previous, winner=winner)
+            self._winners[field] = winner
+
+    def stats(self):
+        """
+        필드별 적중/실패/레이아웃 변경 횟수와 현재 선택자
+        """
+        extractor = get_extractor()
+        with self._lock:
+            result = {}
+            for field, stats in self._stats.items():
+                winner = self._winners.get(field)
+                if isinstance(winner, int):
+                    rule = extractor.rules[winner]
+                    winner = rule.compiled.pattern if rule.compiled is not None else f"<{','.join(rule.tag_names)}>"
+                total = stats["hits"] + stats["misses"]
+                result[field] = dict(stats, selector=winner, hit_rate=round(stats["hits"] / total, 3) if total else 0.0)
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._winners.clear()
+            self._stats.clear()
+
+
+# 프로세스 전역 선택자 캐시
+selector_memo = SelectorMemo()
+
+
+_extractor = None
+
+
+def get_extractor():
+    """
+    컴파일된 필드 추출기 반환 (모듈 전역 1회 생성)
+    """
+    global _extractor
+    if _extractor is None:
+        _extractor = CompiledExtractor()
+    return _extractor
+
+
+def extract_fields(item, adaptive=False):
+    """
+    뉴스 아이템에서 제목, URL, 출처, 날짜, 내용을 한 번에 추출하는 함수
+    adaptive=True이면 지난번에 일치한 선택자를 먼저 시도
+    """
+    if adaptive:
+        return get_extractor().extract_adaptive(item, selector_memo)
+    return get_extractor().extract(item)
 
 def extract_highlights(content_element):
     """
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+토큰 버킷 기반 요청 속도 제한 유틸리티
+차단 응답(403/429/5xx)을 받으면 속도를 절반으로 줄이고 (multiplicative decrease),
+정상 응답이 이어지면 설정된 속도까지 천천히 회복 (additive increase)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {403, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    스레드 안전한 토큰 버킷 (동기/비동기 대기 모두 지원)
+    """
+    def __init__(self, rate: float, burst: int, min_rate: Optional[float] = None):
+        """
+        버킷 초기화
+
+        Args:
+            rate: 초당 토큰 보충 속도 (최대 속도, 0 이하이면 제한 없음)
+            burst: 버킷 최대 용량
+            min_rate: 속도 감소 시 하한 (기본값: rate의 10%)
+        """
+        self.unlimited = rate <= 0
+        rate = max(0.0, rate)
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate * 0.1
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 미리 차감하고 대기해야 할 시간(초)을 반환
+        토큰이 부족하면 음수 잔량으로 예약하여 요청 순서대로 대기 시간이 늘어남
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.unlimited:
+                # 속도 제한 없이 차단 응답에 따른 일시 정지만 적용
+                return max(0.0, self.blocked_until - now)
+            self._refill(now)
+            self.tokens -= tokens
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(wait, self.blocked_until - now)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (동기 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (비동기 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """
+        정상 응답 시 속도를 조금씩 회복
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def on_throttle(self, pause: float) -> None:
+        """
+        차단 응답 시 속도를 절반으로 줄이고 pause 초 동안 모든 요청을 멈춤
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * 0.5)
+            self.blocked_until = max(self.blocked_until, now + pause)
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after: Optional[str] = None) -> float:
+    """
+    지수 백오프 대기 시간 계산 (equal jitter)
+
+    Args:
+        attempt: 재시도 횟수 (0부터 시작)
+        base: 기본 대기 시간 (초)
+        cap: 최대 대기 시간 (초)
+        retry_after: Retry-After 헤더 값 (초 단위인 경우에만 사용)
+
+    Returns:
+        대기 시간 (초)
+    """
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+
+    delay = min(cap, base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷 모음
+    """
+    def __init__(self, rate: float, burst: int, min_rate: Optional[float] = None):
+        """
+        Args:
+            rate: 호스트별 초당 요청 수
+            burst: 호스트별 순간 최대 요청 수
+            min_rate: 차단 응답으로 속도를 줄일 때의 하한
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst, self.min_rate)
+            return self._buckets[host]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        호스트별 현재 속도
+        """
+        with self._lock:
+            return {
+                host: {"current_rps": round(bucket.rate, 2), "max_rps": bucket.max_rate}
+                for host, bucket in self._buckets.items()
+            }
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+로컬 SQLite 저장소 공용 유틸리티
+"""
+
+import os
+import sqlite3
+
+
+def connect(db_path: str, timeout: float = 30.0) -> sqlite3.Connection:
+    """
+    SQLite 연결 생성 (WAL 모드, 여러 스레드에서 공유 가능)
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        timeout: 잠금 대기 시간 (초)
+
+    Returns:
+        SQLite 연결 (호출 측에서 잠금으로 직렬화하여 사용)
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=timeout, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+LLM 프롬프트 토큰 수 추정 유틸리티
+tiktoken이 설치되어 있으면 실제 토크나이저를 사용하고,
+없으면 문자 종류별 평균 토큰 수로 보수적으로 추정
+"""
+
+import importlib.util
+from functools import lru_cache
+from typing import Any, Optional
+
+# tiktoken이 없을 때 사용하는 문자당 평균 토큰 수 (한글은 영문보다 토큰이 많이 필요)
+ASCII_TOKENS_PER_CHAR = 0.25
+NON_ASCII_TOKENS_PER_CHAR = 1.3
+
+
+@lru_cache(maxsize=8)
+def _get_encoder(model: str) -> Optional[Any]:
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
+    """
+    텍스트의 토큰 수 추정
+
+    Args:
+        text: 텍스트
+        model: 토크나이저를 선택할 모델 이름
+
+    Returns:
+        토큰 수 (추정치)
+    """
+    encoder = _get_encoder(model)
+    if encoder is not None:
+        return len(encoder.encode(text))
+
+    ascii_count = sum(1 for char in text if ord(char) < 128)
+    non_ascii_count = len(text) - ascii_count
+    return int(ascii_count * ASCII_TOKENS_PER_CHAR + non_ascii_count * NON_ASCII_TOKENS_PER_CHAR) + 1
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+기사 URL 정규화 유틸리티
+추적용 파라미터를 제거하고, 네이버 뉴스의 여러 URL 형식을 하나로 통일
+"""
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'referer', 'referrer', 'from', 'cmpid', 'ncid', 'nclick', 'ntype'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+NAVER_NEWS_HOSTS = {'news.naver.com', 'n.news.naver.com', 'm.news.naver.com'}
+_NAVER_ARTICLE_PATH = re.compile(r'^/(?:mnews/)?article/(?:comment/)?(\d+)/(\d+)')
+
+
+def _naver_article_id(host, path, query):
+    """
+    네이버 뉴스 URL에서 (언론사 ID, 기사 ID) 추출
+    예: n.news.naver.com/mnews/article/001/0012345678, news.naver.com/main/read.naver?oid=001&aid=0012345678
+    """
+    if host not in NAVER_NEWS_HOSTS:
+        return None
+
+    match = _NAVER_ARTICLE_PATH.match(path)
+    if match:
+        return match.group(1), match.group(2)
+
+    params = dict(parse_qsl(query))
+    if params.get('oid') and params.get('aid'):
+        return params['oid'], params['aid']
+    return None
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    중복 판별용 정규화 URL 생성
+
+    Args:
+        url: 원본 기사 URL
+
+    Returns:
+        정규화된 URL (네이버 뉴스는 https://n.news.naver.com/article/{언론사}/{기사} 형식)
+    """
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or 'https').lower()
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    article_id = _naver_article_id(host, parts.path, parts.query)
+    if article_id:
+        return f"https://n.news.naver.com/article/{article_id[0]}/{article_id[1]}"
+
+    # 추적용 파라미터 제거 후 나머지 파라미터 정렬
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    path = parts.path.rstrip('/') or '/'
+    netloc = host if not parts.port or parts.port in (80, 443) else f"{host}:{parts.port}"
+    if scheme == 'http':
+        scheme = 'https'
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))
+
+
+def normalize_title(title: str) -> str:
+    """
+    중복 판별용 제목 정규화 (공백/문장부호 제거, 소문자)
+    """
+    return re.sub(r'[\W_]+', '', title or '').lower()
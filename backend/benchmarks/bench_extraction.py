@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+필드 추출 벤치마크
+저장된 검색 결과 페이지에서 개별 추출 함수(extract_title 등)와
+컴파일된 1회 순회 추출기(extract_fields)의 결과가 같은지 확인하고 소요 시간을 비교
+(선택자 캐시를 사용하는 adaptive 모드도 여러 아이템 순서로 같은 결과를 내는지 확인하고 소요 시간과 적중률을 출력)
+
+사용법:
+    python benchmarks/bench_extraction.py <저장된 HTML 파일 또는 디렉토리> [--repeat 5]
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from app.utils.naver_news_helper import (
+    extract_news_items, extract_title, extract_url,
+    extract_source, extract_date, extract_content, extract_fields, selector_memo
+)
+
+
+# 레이아웃이 섞인 합성 아이템 (외부 링크가 먼저 나오는 아이템, 제목/출처 선택자가 없는 아이템 등)
+MIXED_ITEMS_HTML = """
+<ul class="list_news">
+<li class="bx"><div class="news_wrap api_ani_send"><div class="news_area">
+  <div class="news_info"><a class="info press" href="https://media.naver.com/press/001">연합뉴스</a>
+  <span class="info">3시간 전</span></div>
+  <a class="news_tit" href="https://n.news.naver.com/article/001/123">코스맥스, 신규 공장 가동 시작</a>
+  <div class="news_dsc">코스맥스가 신규 공장을 가동하며 생산 능력을 확대했다고 밝혔다.</div>
+</div></div></li>
+<li class="bx"><div class="news_area">
+  <a href="https://media.naver.com/press/002">외부 언론사 링크</a>
+  <h3>제목 선택자가 없는 기사의 긴 제목 텍스트</h3>
+  <span>2025.05.08.</span>
+  <p>선택자가 일치하지 않아 대체 규칙으로만 추출되는 본문 스니펫입니다.</p>
+</div></li>
+<li class="bx"><div class="news_wrap api_ani_send"><div class="news_area">
+  <div class="news_info"><a class="info press" href="https://media.naver.com/press/003">한국경제</a>
+  <span class="info">1일 전</span></div>
+  <a class="news_tit" href="https://n.news.naver.com/article/003/456">화장품 ODM 업계 1분기 실적 발표</a>
+  <div class="news_dsc">화장품 ODM 업계가 1분기 실적을 발표했다.</div>
+</div></div></li>
+<li class="bx"><div class="news_area">
+  <strong>짧은제목</strong>
+  <a href="https://n.news.naver.com/article/005/789">네이버 뉴스 링크만 있는 기사</a>
+</div></li>
+</ul>
+"""
+
+
+def legacy_extract(item):
+    return {
+        'title': extract_title(item),
+        'url': extract_url(item),
+        'source': extract_source(item),
+        'date': extract_date(item),
+        'content': extract_content(item)
+    }
+
+
+def collect_pages(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.html'))))
+        else:
+            files.append(path)
+    return files
+
+
+def check_adaptive(items, orders=5, seed=42):
+    """
+    여러 아이템 순서(원래 순서, 역순, 무작위 순서)로 adaptive 모드를 실행하여 extract_fields와 결과가 같은지 확인
+
+    Returns:
+        불일치 수
+    """
+    expected = [extract_fields(item) for item in items]
+    rng = random.Random(seed)
+    sequences = [list(range(len(items))), list(reversed(range(len(items))))]
+    for _ in range(orders):
+        # 같은 아이템이 이어지거나 섞여 나오도록 중복을 허용해 뽑음
+        sequences.append([rng.randrange(len(items)) for _ in range(len(items) * 2)])
+
+    mismatches = 0
+    for sequence in sequences:
+        selector_memo.reset()
+        for index in sequence:
+            actual = extract_fields(items[index], adaptive=True)
+            if actual != expected[index]:
+                mismatches += 1
+                print(f"[adaptive 불일치] item {index}")
+                for field in actual:
+                    if actual[field] != expected[index][field]:
+                        print(f"  {field}: {expected[index][field]!r} != {actual[field]!r}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='필드 추출 벤치마크')
+    parser.add_argument('paths', nargs='*', help='저장된 검색 결과 HTML 파일 또는 디렉토리 (없으면 합성 아이템만 사용)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    args = parser.parse_args()
+
+    files = collect_pages(args.paths)
+    if args.paths and not files:
+        print("HTML 파일이 없습니다.")
+        return 1
+
+    items = extract_news_items(BeautifulSoup(MIXED_ITEMS_HTML, 'html.parser'))
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+        items.extend(extract_news_items(soup))
+
+    # 결과 일치 여부 확인
+    mismatches = 0
+    for index, item in enumerate(items):
+        expected = legacy_extract(item)
+        actual = extract_fields(item)
+        if expected != actual:
+            mismatches += 1
+            print(f"[불일치] item {index}")
+            for field in expected:
+                if expected[field] != actual[field]:
+                    print(f"  {field}: {expected[field]!r} != {actual[field]!r}")
+    adaptive_mismatches = check_adaptive(items)
+
+    # 소요 시간 비교
+    timings = {}
+    selector_memo.reset()
+    adaptive_extract = lambda item: extract_fields(item, adaptive=True)
+    for name, func in (('legacy', legacy_extract), ('compiled', extract_fields), ('adaptive', adaptive_extract)):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            for item in items:
+                func(item)
+        timings[name] = time.perf_counter() - started
+
+    print(f"페이지 {len(files)}개, 아이템 {len(items)}개, 반복 {args.repeat}회")
+    print(f"불일치: {mismatches}, adaptive 불일치: {adaptive_mismatches}")
+    for name, elapsed in timings.items():
+        per_item = elapsed / max(1, len(items) * args.repeat) * 1000
+        print(f"{name:>8}: {elapsed:.3f}s ({per_item:.3f} ms/item)")
+    if timings['compiled'] > 0:
+        print(f"speedup: {timings['legacy'] / timings['compiled']:.2f}x")
+    for field, stats in selector_memo.stats().items():
+        print(f"  memo {field}: hit_rate={stats['hit_rate']} layout_changes={stats['layout_changes']}")
+
+    return 1 if mismatches or adaptive_mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
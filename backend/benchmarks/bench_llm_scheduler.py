@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+LLM 요청 스케줄러 벤치마크
+합성 기사 CSV를 만들어 관련성 평가를 실행하고, RPM/TPM 한도 대비 실제 처리량과
+재시도/429 응답 수, 한도 때문에 대기한 시간을 출력
+(규칙 분류, 캐시, 로컬 분류기는 끄고 모든 기사를 LLM으로 평가)
+
+사용법:
+    python benchmarks/mock_openai_server.py --port 8770 --rpm 120 --tpm 40000
+    python benchmarks/bench_llm_scheduler.py --api-base http://127.0.0.1:8770/v1 --articles 200 --rpm 100 --tpm 35000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.utils.csv_utils import read_csv, save_to_csv
+
+WORDS = ["화장품", "ODM", "수출", "실적", "원료", "규제", "선케어", "브랜드", "매출", "공장",
+         "야구", "드라마", "날씨", "여행", "선거", "주식시장", "영화", "맛집"]
+
+
+def make_articles(count, seed):
+    rng = random.Random(seed)
+    return [{
+        "title": " ".join(rng.choices(WORDS, k=6)) + f" {index}",
+        "content": " ".join(rng.choices(WORDS, k=40)),
+        "source": "bench",
+        "url": f"https://news.example.com/{index}",
+        "keyword": "코스맥스",
+        "date": ""
+    } for index in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LLM 요청 스케줄러 벤치마크')
+    parser.add_argument('--api-base', default=settings.OPENAI_API_BASE,
+                        help=f'OpenAI 호환 API 주소 (기본값: {settings.OPENAI_API_BASE})')
+    parser.add_argument('--api-key', default=settings.OPENAI_API_KEY or 'mock-key', help='API 키')
+    parser.add_argument('--model', default=settings.DEFAULT_MODEL, help=f'모델 (기본값: {settings.DEFAULT_MODEL})')
+    parser.add_argument('--articles', type=int, default=200, help='합성 기사 수 (기본값: 200)')
+    parser.add_argument('--rpm', type=float, default=settings.RELEVANCE_RPM_LIMIT,
+                        help=f'분당 최대 요청 수 (기본값: {settings.RELEVANCE_RPM_LIMIT})')
+    parser.add_argument('--tpm', type=float, default=settings.RELEVANCE_TPM_LIMIT,
+                        help=f'분당 최대 토큰 수 (기본값: {settings.RELEVANCE_TPM_LIMIT})')
+    parser.add_argument('--workers', type=int, default=settings.RELEVANCE_MAX_WORKERS,
+                        help=f'동시 요청 수 (기본값: {settings.RELEVANCE_MAX_WORKERS})')
+    parser.add_argument('--batch-size', type=int, default=settings.RELEVANCE_BATCH_SIZE,
+                        help=f'요청당 기사 수 (기본값: {settings.RELEVANCE_BATCH_SIZE})')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 시드 (기본값: 42)')
+    args = parser.parse_args()
+
+    # 스케줄러는 처음 사용할 때 설정값으로 만들어지므로 서비스 생성 전에 덮어씀
+    settings.OPENAI_API_BASE = args.api_base
+    settings.RELEVANCE_RPM_LIMIT = args.rpm
+    settings.RELEVANCE_TPM_LIMIT = args.tpm
+    from app.services.relevance_service import RelevanceService
+
+    service = RelevanceService(
+        api_key=args.api_key, model=args.model, max_workers=args.workers, batch_size=args.batch_size,
+        use_cache=False, use_rules=False, use_triage=False
+    )
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_file = os.path.join(work_dir, "bench_articles.csv")
+        save_to_csv(make_articles(args.articles, args.seed), input_file, encoding='utf-8-sig')
+
+        print(f"기사 {args.articles}건 평가 (rpm={args.rpm or '무제한'}, tpm={args.tpm or '무제한'}, "
+              f"workers={args.workers}, batch={args.batch_size}, api={args.api_base})")
+        output_file, stats = service.process_file(input_file)
+        if output_file is None:
+            print(f"평가 실패: {stats.get('error')}")
+            return 1
+        # 재시도 후에도 실패하여 API 오류로 남은 기사 수
+        api_errors = sum(1 for row in read_csv(output_file, encoding='utf-8-sig')
+                         if str(row.get('relevance_reason', '')).startswith("API 오류"))
+
+    keys = ("llm_calls", "retries", "throttled_responses", "rate_limit_wait_seconds",
+            "prompt_tokens_estimated", "tokens_used", "relevant_count")
+    for key in keys:
+        print(f"  {key:26s} {stats.get(key)}")
+    print(f"  {'api_errors':26s} {api_errors}")
+    print(f"  throughput                 {json.dumps(stats['throughput'], ensure_ascii=False)}")
+    print(f"  scheduler                  {json.dumps(service.scheduler.stats(), ensure_ascii=False)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+HTML 파서 벤치마크
+저장된 검색 결과 페이지를 파서별(html.parser, lxml, selectolax) / 파싱 범위별(전체, #main_pack)로
+파싱하여 소요 시간을 비교하고, 추출 결과가 html.parser 전체 파싱과 같은지 확인
+
+사용법:
+    python benchmarks/bench_parsers.py <저장된 HTML 파일 또는 디렉토리> [--repeat 5] [--scope main_pack]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.html_parser import available_parsers, parse_html, PARSER_HTML
+from app.utils.naver_news_helper import extract_news_items, extract_fields
+
+
+def collect_pages(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.html'))))
+        else:
+            files.append(path)
+    return files
+
+
+def extract_page(html, parser, scope):
+    soup = parse_html(html, parser, scope)
+    return [extract_fields(item) for item in extract_news_items(soup)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 벤치마크')
+    parser.add_argument('paths', nargs='+', help='저장된 검색 결과 HTML 파일 또는 디렉토리')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    parser.add_argument('--scope', default='main_pack', help='파싱 범위 요소 id (기본값: main_pack)')
+    args = parser.parse_args()
+
+    files = collect_pages(args.paths)
+    if not files:
+        print("HTML 파일이 없습니다.")
+        return 1
+
+    pages = []
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+
+    # 기준 결과: html.parser 전체 파싱
+    expected = [extract_page(html, PARSER_HTML, None) for html in pages]
+    total_bytes = sum(len(html.encode('utf-8')) for html in pages)
+    print(f"페이지 {len(pages)}개 ({total_bytes / 1024:.0f} KB), 반복 {args.repeat}회")
+    print(f"{'parser':<12} {'scope':<10} {'parse ms/page':>14} {'total ms/page':>14} {'same':>6}")
+
+    failed = False
+    for parser_name in available_parsers():
+        for scope in (None, args.scope):
+            parse_time = 0.0
+            total_time = 0.0
+            for _ in range(args.repeat):
+                for html in pages:
+                    started = time.perf_counter()
+                    soup = parse_html(html, parser_name, scope)
+                    parsed = time.perf_counter()
+                    [extract_fields(item) for item in extract_news_items(soup)]
+                    finished = time.perf_counter()
+                    parse_time += parsed - started
+                    total_time += finished - started
+
+            same = [extract_page(html, parser_name, scope) for html in pages] == expected
+            failed = failed or not same
+            runs = len(pages) * args.repeat
+            print(f"{parser_name:<12} {scope or 'full':<10} {parse_time / runs * 1000:>14.2f} "
+                  f"{total_time / runs * 1000:>14.2f} {'yes' if same else 'NO':>6}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+API 응답성 부하 테스트
+실행 중인 API 서버에 크롤링 요청을 동시에 여러 개 보내는 동안 /health와 파일 목록 조회 지연 시간을 측정하여
+크롤링이 없을 때와 비교 (블로킹 작업이 이벤트 루프를 막으면 크롤링 중 지연 시간이 크롤링 시간만큼 늘어남)
+
+사용법:
+    python run.py
+    python benchmarks/load_test_health.py --base-url http://localhost:8000 --crawls 4 --keywords 코스맥스 콜마
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+PROBE_PATHS = ("/health", "/api/crawler/files")
+
+
+def summarize(samples):
+    if not samples:
+        return "샘플 없음"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (f"n={len(ordered):4d}  p50={statistics.median(ordered) * 1000:8.1f}ms  "
+            f"p95={p95 * 1000:8.1f}ms  max={ordered[-1] * 1000:8.1f}ms")
+
+
+async def probe(client, path, interval, stop_event, samples):
+    while not stop_event.is_set():
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            response.raise_for_status()
+            samples.append(time.perf_counter() - started)
+        except httpx.HTTPError as e:
+            print(f"  {path} 오류: {e}")
+        await asyncio.sleep(interval)
+
+
+async def measure(client, duration, interval):
+    stop_event = asyncio.Event()
+    samples = {path: [] for path in PROBE_PATHS}
+    tasks = [asyncio.create_task(probe(client, path, interval, stop_event, samples[path])) for path in PROBE_PATHS]
+    await asyncio.sleep(duration)
+    stop_event.set()
+    await asyncio.gather(*tasks)
+    return samples
+
+
+async def run(args):
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+        print(f"기준 측정 ({args.baseline_seconds}초, 크롤링 없음)")
+        baseline = await measure(client, args.baseline_seconds, args.interval)
+        for path in PROBE_PATHS:
+            print(f"  {path:22s} {summarize(baseline[path])}")
+
+        print(f"\n크롤링 {args.crawls}건 동시 실행 중 측정 (키워드: {', '.join(args.keywords)})")
+        stop_event = asyncio.Event()
+        samples = {path: [] for path in PROBE_PATHS}
+        probes = [asyncio.create_task(probe(client, path, args.interval, stop_event, samples[path]))
+                  for path in PROBE_PATHS]
+        started = time.perf_counter()
+        results = await asyncio.gather(*(
+            client.post("/api/crawler/crawl", json={
+                "keywords": args.keywords, "max_news_per_keyword": args.max_news, "seen_mode": "off"
+            })
+            for _ in range(args.crawls)
+        ), return_exceptions=True)
+        crawl_seconds = time.perf_counter() - started
+        stop_event.set()
+        await asyncio.gather(*probes)
+
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"  크롤링 요청 오류: {result}")
+            else:
+                print(f"  크롤링 응답 {result.status_code}: {result.json().get('message')}")
+        print(f"  크롤링 소요 시간: {crawl_seconds:.1f}초")
+        for path in PROBE_PATHS:
+            print(f"  {path:22s} {summarize(samples[path])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤링 중 API 응답성 부하 테스트')
+    parser.add_argument('--base-url', default='http://localhost:8000', help='API 서버 주소 (기본값: http://localhost:8000)')
+    parser.add_argument('--crawls', type=int, default=4, help='동시에 보낼 크롤링 요청 수 (기본값: 4)')
+    parser.add_argument('--keywords', nargs='+', default=['코스맥스'], help='크롤링 키워드 (기본값: 코스맥스)')
+    parser.add_argument('--max-news', type=int, default=100, help='키워드당 최대 뉴스 건수 (기본값: 100)')
+    parser.add_argument('--interval', type=float, default=0.1, help='지연 시간 측정 간격 (초, 기본값: 0.1)')
+    parser.add_argument('--baseline-seconds', type=float, default=5.0, help='기준 측정 시간 (초, 기본값: 5)')
+    parser.add_argument('--timeout', type=float, default=600.0, help='요청 제한 시간 (초, 기본값: 600)')
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+OpenAI 호환 모의 Chat Completions 서버
+분당 요청 수/토큰 수 한도를 넘으면 실제 API처럼 429와 Retry-After 헤더를 반환하여
+LLM 요청 스케줄러의 속도 조절과 재시도를 API 비용 없이 확인할 때 사용
+
+사용법:
+    python benchmarks/mock_openai_server.py --port 8770 --rpm 120 --tpm 40000 --latency 0.3
+    OPENAI_API_BASE=http://127.0.0.1:8770/v1 python benchmarks/bench_llm_scheduler.py
+"""
+
+import argparse
+import collections
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.token_utils import estimate_tokens
+
+WINDOW_SECONDS = 60.0
+
+
+class RateWindow:
+    """
+    최근 60초 동안 받은 요청 수와 토큰 수 (슬라이딩 윈도우)
+    """
+    def __init__(self, rpm, tpm):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.entries = collections.deque()
+        self.tokens = 0
+        self.lock = threading.Lock()
+        self.counters = collections.Counter()
+
+    def admit(self, tokens):
+        """
+        요청을 받아도 되면 (True, 0), 한도를 넘으면 (False, 다시 시도할 때까지 남은 초)
+        """
+        with self.lock:
+            now = time.monotonic()
+            while self.entries and now - self.entries[0][0] >= WINDOW_SECONDS:
+                _, old_tokens = self.entries.popleft()
+                self.tokens -= old_tokens
+            over_rpm = self.rpm and len(self.entries) + 1 > self.rpm
+            over_tpm = self.tpm and self.tokens + tokens > self.tpm
+            if over_rpm or over_tpm:
+                self.counters["rate_limited"] += 1
+                retry_after = WINDOW_SECONDS - (now - self.entries[0][0]) if self.entries else 1.0
+                return False, max(1, math.ceil(retry_after))
+            self.entries.append((now, tokens))
+            self.tokens += tokens
+            self.counters["accepted"] += 1
+            return True, 0
+
+    def remaining(self):
+        with self.lock:
+            return (max(0, self.rpm - len(self.entries)) if self.rpm else None,
+                    max(0, self.tpm - self.tokens) if self.tpm else None)
+
+
+def build_answer(prompt):
+    # 배치 프롬프트는 기사 번호별 JSON 배열, 단일 프롬프트는 줄 단위 형식으로 응답
+    indices = re.findall(r'\[(\d+)\]', prompt)
+    if '"index"' in prompt and indices:
+        return json.dumps([
+            {"index": int(index), "relevant": True, "reason": "모의 응답", "category": "업계 관련기사"}
+            for index in indices
+        ], ensure_ascii=False)
+    return "적합성: true\n이유: 모의 응답\n카테고리: 업계 관련기사"
+
+
+def make_handler(args, window):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def send_json(self, status, body, headers=None):
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, str(value))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self.send_json(404, {"error": {"message": "Not found"}})
+                return
+
+            prompt = "\n".join(message.get("content", "") for message in body.get("messages", []))
+            # OpenAI와 같이 프롬프트 토큰 + max_tokens를 한도에 반영
+            prompt_tokens = estimate_tokens(prompt, body.get("model", "gpt-3.5-turbo"))
+            requested_tokens = prompt_tokens + int(body.get("max_tokens", 0))
+
+            admitted, retry_after = window.admit(requested_tokens)
+            remaining_requests, remaining_tokens = window.remaining()
+            headers = {}
+            if remaining_requests is not None:
+                headers["x-ratelimit-limit-requests"] = args.rpm
+                headers["x-ratelimit-remaining-requests"] = remaining_requests
+            if remaining_tokens is not None:
+                headers["x-ratelimit-limit-tokens"] = args.tpm
+                headers["x-ratelimit-remaining-tokens"] = remaining_tokens
+            if not admitted:
+                headers["Retry-After"] = retry_after
+                self.send_json(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+                               headers)
+                return
+
+            time.sleep(args.latency)
+            if args.error_rate and random.random() < args.error_rate:
+                window.counters["server_errors"] += 1
+                self.send_json(503, {"error": {"message": "Service unavailable"}}, headers)
+                return
+
+            answer = build_answer(prompt)
+            completion_tokens = estimate_tokens(answer, body.get("model", "gpt-3.5-turbo"))
+            self.send_json(200, {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "model": body.get("model", "mock"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": answer}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens
+                }
+            }, headers)
+
+        def log_message(self, format, *log_args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI 호환 모의 Chat Completions 서버 (429 한도 재현)')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8770, help='포트 (기본값: 8770)')
+    parser.add_argument('--rpm', type=int, default=0, help='분당 최대 요청 수 (기본값: 0, 제한 없음)')
+    parser.add_argument('--tpm', type=int, default=0, help='분당 최대 토큰 수 (기본값: 0, 제한 없음)')
+    parser.add_argument('--latency', type=float, default=0.3, help='응답 지연 시간 (초, 기본값: 0.3)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 응답 비율 (0~1, 기본값: 0)')
+    args = parser.parse_args()
+
+    window = RateWindow(args.rpm, args.tpm)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args, window))
+    print(f"모의 OpenAI 서버: http://{args.host}:{args.port}/v1 (rpm={args.rpm or '무제한'}, tpm={args.tpm or '무제한'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"요청 통계: {dict(window.counters)}")
+
+
+if __name__ == "__main__":
+    main()
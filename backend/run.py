@@ -13,8 +13,15 @@ if __name__ == "__main__":
     parser.add_argument('--port', type=int, default=8000, help='서버 포트 (기본값: 8000)')
     parser.add_argument('--reload', action='store_true', help='자동 재로드 활성화')
     parser.add_argument('--debug', action='store_true', help='디버그 로그 활성화')
+    parser.add_argument('--dump-pages', type=float, nargs='?', const=0.0, default=None, metavar='SAMPLE_RATE',
+                        help='실패한 검색 결과 페이지 저장 (정상 페이지 샘플링 비율 지정 가능, 예: 0.05)')
     args = parser.parse_args()
     
+    # 디버깅용 페이지 저장 설정 (서버 프로세스에서 읽도록 환경 변수로 전달)
+    if args.dump_pages is not None:
+        os.environ['CRAWLER_DEBUG_DUMP'] = 'true'
+        os.environ['CRAWLER_DEBUG_DUMP_SAMPLE_RATE'] = str(args.dump_pages)
+    
     # 로깅 설정
     log_level = logging.DEBUG if args.debug else logging.INFO
     logging.basicConfig(
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+기사 저장소 평가 결과 갱신 테스트 (API/요청 오류로 얻은 결과는 평가하지 않은 기사로 저장)
+"""
+
+import pytest
+
+from app.services.article_store import ArticleStore
+
+URL = "https://n.news.naver.com/article/001/0000000001"
+
+
+def make_item(is_relevant="", reason="", category=""):
+    return {
+        "title": "코스맥스, 1분기 영업이익 증가", "url": URL, "content": "본문", "source": "연합뉴스",
+        "keyword": "코스맥스", "date": "2025.05.08.", "is_relevant": is_relevant,
+        "relevance_reason": reason, "category": category
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArticleStore(str(tmp_path / "articles.db"))
+
+
+def only_article(store):
+    articles = store.search()["articles"]
+    assert len(articles) == 1
+    return articles[0]
+
+
+@pytest.mark.parametrize("reason", ["API 오류: 429", "요청 처리 중 오류: timed out"])
+def test_error_verdict_is_stored_as_unevaluated(store, reason):
+    store.upsert([make_item(False, reason, "기타")])
+
+    article = only_article(store)
+    assert article["is_relevant"] is None
+    assert article["relevance_reason"] is None
+    assert article["category"] is None
+    assert article["evaluated_at"] is None
+
+
+def test_error_verdict_keeps_earlier_verdict(store):
+    store.upsert([make_item(True, "화장품 ODM 실적 기사", "실적")])
+    store.upsert([make_item(False, "API 오류: 500", "기타")])
+
+    article = only_article(store)
+    assert article["is_relevant"] is True
+    assert article["relevance_reason"] == "화장품 ODM 실적 기사"
+    assert article["category"] == "실적"
+    assert store.search(is_relevant=False)["total"] == 0
+
+
+def test_real_verdict_replaces_earlier_verdict(store):
+    store.upsert([make_item(True, "화장품 ODM 실적 기사", "실적")])
+    store.upsert([make_item(False, "화장품 업계와 관련 없음", "기타")])
+
+    article = only_article(store)
+    assert article["is_relevant"] is False
+    assert article["relevance_reason"] == "화장품 업계와 관련 없음"
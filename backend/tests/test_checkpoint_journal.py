@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+체크포인트 저널 복구 확인
+- 헤더가 손상되었거나 다른 입력의 저널이면 이어서 처리하지 않는지
+- 중단 시점에 잘린 마지막 줄 뒤에 새 결과가 붙지 않는지
+"""
+
+import json
+
+from app.utils.journal_utils import CheckpointJournal
+
+
+def write_lines(path, *lines):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("".join(lines))
+
+
+def row_line(row, result):
+    return json.dumps({"row": row, "result": result}) + "\n"
+
+
+def test_resume_reads_completed_rows(tmp_path):
+    journal = CheckpointJournal(str(tmp_path / "job.jsonl"), "abc")
+    journal.start(resume=False)
+    journal.append({0: {"v": 0}, 2: {"v": 2}})
+    assert journal.load() == {0: {"v": 0}, 2: {"v": 2}}
+
+
+def test_unreadable_or_foreign_header_is_a_mismatch(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    journal = CheckpointJournal(path, "abc")
+    for header in ('{"fingerp', '{"row": 0, "result": {}}\n', '[1, 2]\n', '{"fingerprint": "other"}\n'):
+        write_lines(path, header, row_line(1, {"v": 1}))
+        assert journal.load() == {}
+
+
+def test_invalid_row_lines_are_skipped(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    write_lines(
+        path, json.dumps({"fingerprint": "abc"}) + "\n", '{"note": 1}\n', '3\n', '{"row": "x", "result": {}}\n',
+        row_line(4, {"v": 4}), '{"row": 5, "res'
+    )
+    assert CheckpointJournal(path, "abc").load() == {4: {"v": 4}}
+
+
+def test_resume_truncates_partial_last_line(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    journal = CheckpointJournal(path, "abc")
+    write_lines(path, json.dumps({"fingerprint": "abc"}) + "\n", row_line(0, {"v": 0}), '{"row": 1, "res')
+
+    journal.start(resume=True)
+    journal.append({1: {"v": 1}, 2: {"v": 2}})
+    assert journal.load() == {0: {"v": 0}, 1: {"v": 1}, 2: {"v": 2}}
+
+
+def test_resume_rewrites_partial_header(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    journal = CheckpointJournal(path, "abc")
+    write_lines(path, '{"fingerprint": "a')
+
+    journal.start(resume=True)
+    journal.append({0: {"v": 0}})
+    assert journal.load() == {0: {"v": 0}}
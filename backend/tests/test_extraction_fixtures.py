@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+저장된 검색 결과 페이지로 필드 추출 결과 확인
+- 컴파일된 추출기(extract_fields)와 선택자 캐시(adaptive)가 개별 추출 함수와 같은 결과를 내는지
+- 파서(html.parser, lxml, selectolax)와 파싱 범위(전체, #main_pack)에 관계없이 같은 결과를 내는지
+"""
+
+import glob
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.utils.html_parser import PARSER_HTML, available_parsers, parse_html
+from app.utils.naver_news_helper import (
+    extract_content, extract_date, extract_fields, extract_news_items, extract_source, extract_title,
+    extract_url, selector_memo
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = sorted(glob.glob(os.path.join(FIXTURE_DIR, "naver_search_*.html")))
+
+
+def read_page(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def legacy_extract(item):
+    return {
+        'title': extract_title(item),
+        'url': extract_url(item),
+        'source': extract_source(item),
+        'date': extract_date(item),
+        'content': extract_content(item)
+    }
+
+
+def page_items(path):
+    return extract_news_items(BeautifulSoup(read_page(path), 'html.parser'))
+
+
+def extract_page(html, parser, scope):
+    soup = parse_html(html, parser, scope)
+    return [extract_fields(item) for item in extract_news_items(soup)]
+
+
+@pytest.fixture(autouse=True)
+def cold_memo():
+    selector_memo.reset()
+    yield
+    selector_memo.reset()
+
+
+def test_fixture_pages_exist():
+    assert len(PAGES) >= 3
+    for path in PAGES:
+        assert page_items(path), os.path.basename(path)
+
+
+@pytest.mark.parametrize("path", PAGES, ids=os.path.basename)
+def test_compiled_extractor_matches_legacy(path):
+    for item in page_items(path):
+        assert extract_fields(item) == legacy_extract(item)
+
+
+def test_adaptive_matches_legacy_cold_and_warm():
+    items = [item for path in PAGES for item in page_items(path)]
+    expected = [legacy_extract(item) for item in items]
+
+    # 캐시가 빈 상태에서 한 번, 학습된 상태로 정방향/역방향 한 번씩
+    for order in (range(len(items)), range(len(items)), reversed(range(len(items)))):
+        for index in order:
+            assert extract_fields(items[index], adaptive=True) == expected[index]
+
+
+def test_adaptive_item_selector_matches_full_scan():
+    for path in PAGES + PAGES[::-1]:
+        soup = BeautifulSoup(read_page(path), 'html.parser')
+        assert extract_news_items(soup, adaptive=True) == extract_news_items(soup)
+
+
+@pytest.mark.parametrize("parser", available_parsers())
+@pytest.mark.parametrize("scope", [None, "main_pack"])
+def test_parsers_and_scopes_match_full_html_parser(parser, scope):
+    for path in PAGES:
+        html = read_page(path)
+        assert extract_page(html, parser, scope) == extract_page(html, PARSER_HTML, None), os.path.basename(path)
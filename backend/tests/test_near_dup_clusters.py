@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+유사 기사 군집화 테스트 (양식이 같고 회사명만 다른 기사는 같은 군집으로 묶지 않음)
+"""
+
+from app.services.dedup_service import assign_clusters, split_entity_clusters
+
+BODY = "1분기 매출액은 5천억원, 영업이익은 전년 동기 대비 20% 증가한 400억원을 기록했다고 공시했다."
+
+
+def make_item(title, url, content=BODY):
+    return {"title": title, "content": content, "source": "연합뉴스", "url": url}
+
+
+def test_same_template_different_company_titles_are_not_clustered():
+    items = [
+        make_item("코스맥스, 1분기 영업이익 전년比 20% 증가…", "https://news.example.com/1"),
+        make_item("한국콜마, 1분기 영업이익 전년比 20% 증가…", "https://news.example.com/2"),
+    ]
+
+    stats = assign_clusters(items, threshold=0.6)
+
+    assert items[0]["cluster_id"] != items[1]["cluster_id"]
+    assert stats["clusters"] == 2
+
+
+def test_syndicated_copies_of_same_company_stay_clustered():
+    items = [
+        make_item("코스맥스, 1분기 영업이익 전년比 20% 증가…", "https://news.example.com/1"),
+        make_item("한국콜마, 1분기 영업이익 전년比 20% 증가…", "https://news.example.com/2"),
+        make_item("코스맥스, 1분기 영업이익 전년比 20% 증가…", "https://other.example.com/3"),
+    ]
+
+    stats = assign_clusters(items, threshold=0.6)
+
+    assert items[0]["cluster_id"] == items[2]["cluster_id"]
+    assert items[1]["cluster_id"] != items[0]["cluster_id"]
+    assert stats["near_duplicates"] == 1
+
+
+def test_split_entity_clusters_splits_previously_merged_file():
+    # 이전 버전에서 한 군집으로 묶여 저장된 결과 파일
+    items = [
+        dict(make_item("코스맥스, 1분기 영업이익 전년比 20% 증가…", "https://news.example.com/1"), cluster_id="1"),
+        dict(make_item("한국콜마, 1분기 영업이익 전년比 20% 증가…", "https://news.example.com/2"), cluster_id="1"),
+        dict(make_item("한국콜마, 1분기 영업이익 전년比 20% 증가…", "https://other.example.com/3"), cluster_id="1"),
+        dict(make_item("날씨 맑음", "https://news.example.com/4", content="전국 맑음"), cluster_id="2"),
+    ]
+
+    assert split_entity_clusters(items) == 1
+    assert [item["cluster_id"] for item in items] == [1, 2, 2, 3]
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import logging
+import sys
+
+from app.services.triage_service import evaluate_model, is_available, train_model
+
+if __name__ == "__main__":
+    # 명령행 인자 처리
+    parser = argparse.ArgumentParser(description='관련성 평가 로컬 분류기 학습/평가 (scikit-learn 필요)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    train_parser = subparsers.add_parser('train', help='_evaluated.csv의 LLM 판정으로 모델 학습 (기존 모델 갱신)')
+    train_parser.add_argument('--results-dir', type=str, default=None, help='학습할 결과 디렉토리 (기본값: 설정값)')
+    train_parser.add_argument('--holdout', type=float, default=0.2, help='정확도 측정용 행 비율 (기본값: 0.2)')
+
+    evaluate_parser = subparsers.add_parser('evaluate', help='저장된 모델과 LLM 판정 비교')
+    evaluate_parser.add_argument('files', nargs='*', help='비교할 _evaluated.csv 파일 (기본값: 결과 디렉토리 전체)')
+    args = parser.parse_args()
+
+    # 로깅 설정
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    if not is_available():
+        print("scikit-learn이 설치되어 있지 않습니다: pip install scikit-learn")
+        sys.exit(1)
+
+    try:
+        if args.command == 'train':
+            result = train_model(args.results_dir, args.holdout)
+        else:
+            result = evaluate_model(args.files or None)
+    except (RuntimeError, ValueError) as e:
+        print(f"오류: {str(e)}")
+        sys.exit(1)
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+import logging
+import multiprocessing
+import signal
+
+from app.core.config import settings
+from app.services.job_service import JOB_TYPE_CRAWL, JOB_TYPE_EVALUATE, run_worker_process
+from app.utils.columnar_utils import warn_if_columnar_unavailable
+
+if __name__ == "__main__":
+    # 명령행 인자 처리
+    parser = argparse.ArgumentParser(description='백그라운드 작업(크롤링, 관련성 평가) 실행 프로세스')
+    parser.add_argument('--processes', type=int, default=settings.JOB_WORKER_PROCESSES,
+                        help=f'작업 프로세스 수 (기본값: {settings.JOB_WORKER_PROCESSES})')
+    parser.add_argument('--types', nargs='+', choices=[JOB_TYPE_CRAWL, JOB_TYPE_EVALUATE], default=None,
+                        help='실행할 작업 종류 (기본값: 전체)')
+    args = parser.parse_args()
+
+    # 로깅 설정
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    logger = logging.getLogger("worker")
+    warn_if_columnar_unavailable(settings.RESULTS_COLUMNAR)
+
+    # 각 프로세스가 자체 HTTP 세션과 이벤트 루프를 만들도록 spawn 방식 사용
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    processes = [
+        context.Process(target=run_worker_process, args=(stop_event, args.types), name=f"worker-{index + 1}")
+        for index in range(max(1, args.processes))
+    ]
+
+    def request_stop(signum, frame):
+        # 실행 중인 작업은 끝까지 실행한 뒤 종료
+        logger.info("Stopping workers after current jobs finish...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    for process in processes:
+        process.start()
+    logger.info(f"Started {len(processes)} worker processes (queue: {settings.JOB_DB_PATH})")
+
+    for process in processes:
+        process.join()
@@ -0,0 +1,52 @@
+import apiClient from './client';
+
+// 기사 저장소 API 서비스 (모든 크롤링/평가 결과를 한 번에 조회)
+const articleService = {
+  // 기사 조회 (filters: query, keyword, category, source, is_relevant, date_from, date_to)
+  searchArticles: async (filters = {}, limit = 50, offset = 0) => {
+    try {
+      const response = await apiClient.get('/api/articles', {
+        params: { ...filters, limit, offset },
+      });
+      return response.data;
+    } catch (error) {
+      console.error('기사 조회 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 조건에 맞는 기사의 키워드/카테고리/날짜별 건수
+  getArticleSummary: async (filters = {}) => {
+    try {
+      const response = await apiClient.get('/api/articles/summary', { params: filters });
+      return response.data;
+    } catch (error) {
+      console.error('기사 통계 조회 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 기사 한 건 조회
+  getArticle: async (articleId) => {
+    try {
+      const response = await apiClient.get(`/api/articles/${articleId}`);
+      return response.data;
+    } catch (error) {
+      console.error('기사 조회 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 결과 폴더의 기존 CSV 파일 가져오기
+  importResultFiles: async () => {
+    try {
+      const response = await apiClient.post('/api/articles/import');
+      return response.data;
+    } catch (error) {
+      console.error('결과 파일 가져오기 중 오류:', error);
+      throw error;
+    }
+  },
+};
+
+export default articleService;
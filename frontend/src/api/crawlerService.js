@@ -16,11 +16,13 @@ const crawlerService = {
     }
   },
 
-  // 크롤링 결과 파일 목록 조회
-  getFiles: async () => {
+  // 크롤링 결과 파일 목록 조회 (params: page, page_size, sort, order, evaluated, keyword, name / page가 없으면 전체 목록)
+  // 반환값: { files, total, page, page_size }
+  getFiles: async (params = {}) => {
     try {
-      const response = await apiClient.get('/api/crawler/files');
-      return response.data.files;
+      const response = await apiClient.get('/api/crawler/files', { params });
+      const { files, total, page, page_size: pageSize } = response.data;
+      return { files, total: total ?? files.length, page, pageSize };
     } catch (error) {
       console.error('파일 목록 조회 중 오류:', error);
       throw error;
@@ -50,6 +52,32 @@ const crawlerService = {
       throw error;
     }
   },
+
+  // 조건에 맞는 행 조회 (filters: keyword, source, category, is_relevant)
+  getFileRows: async (fileName, filters = {}, limit = 50, offset = 0) => {
+    try {
+      const response = await apiClient.get(`/api/crawler/files/${fileName}/rows`, {
+        params: { ...filters, limit, offset },
+      });
+      return response.data;
+    } catch (error) {
+      console.error('파일 행 조회 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 파일 내용 페이지 단위 조회
+  browseFile: async (fileName, offset = 0, limit = 50) => {
+    try {
+      const response = await apiClient.get(`/api/crawler/files/${fileName}/browse`, {
+        params: { offset, limit },
+      });
+      return response.data;
+    } catch (error) {
+      console.error('파일 내용 조회 중 오류:', error);
+      throw error;
+    }
+  },
 };
 
 export default crawlerService;
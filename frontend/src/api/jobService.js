@@ -0,0 +1,96 @@
+import apiClient from './client';
+
+// 진행 이벤트 종류 (status: 상태 변경, page: 크롤링 페이지 결과, verdicts: 기사별 평가 결과, result: 최종 결과)
+const JOB_EVENT_TYPES = ['status', 'page', 'verdicts', 'result'];
+
+// 백그라운드 작업 API 서비스
+const jobService = {
+  // 크롤링 작업 등록
+  submitCrawlJob: async (keywords, maxNewsPerKeyword = 50) => {
+    try {
+      const response = await apiClient.post('/api/jobs/crawl', {
+        keywords,
+        max_news_per_keyword: maxNewsPerKeyword,
+      });
+      return response.data;
+    } catch (error) {
+      console.error('크롤링 작업 등록 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 관련성 평가 작업 등록
+  submitEvaluateJob: async (filePath, apiKey, model = 'gpt-3.5-turbo') => {
+    try {
+      const response = await apiClient.post('/api/jobs/evaluate', {
+        file_path: filePath,
+        api_key: apiKey,
+        model,
+      });
+      return response.data;
+    } catch (error) {
+      console.error('관련성 평가 작업 등록 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 작업 상태 및 결과 조회
+  getJob: async (jobId) => {
+    try {
+      const response = await apiClient.get(`/api/jobs/${jobId}`);
+      return response.data;
+    } catch (error) {
+      console.error('작업 상태 조회 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 최근 작업 목록 조회 (status: queued, running, succeeded, failed, cancelled)
+  listJobs: async (status = null, limit = 50) => {
+    try {
+      const response = await apiClient.get('/api/jobs', { params: { status, limit } });
+      return response.data.jobs;
+    } catch (error) {
+      console.error('작업 목록 조회 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 작업 취소 (실행 중인 작업은 다음 진행 단계에서 중단)
+  cancelJob: async (jobId) => {
+    try {
+      const response = await apiClient.post(`/api/jobs/${jobId}/cancel`);
+      return response.data;
+    } catch (error) {
+      console.error('작업 취소 중 오류:', error);
+      throw error;
+    }
+  },
+
+  // 작업 진행 이벤트 구독 (onEvent(type, data) 호출, 작업이 끝나면 연결 종료)
+  // 반환된 함수를 호출하면 구독 취소
+  subscribeJobEvents: (jobId, onEvent, onError) => {
+    const eventSource = new EventSource(`${apiClient.defaults.baseURL}/api/jobs/${jobId}/events`);
+
+    JOB_EVENT_TYPES.forEach((type) => {
+      eventSource.addEventListener(type, (event) => {
+        const data = JSON.parse(event.data);
+        onEvent(type, data);
+        if (type === 'result') {
+          eventSource.close();
+        }
+      });
+    });
+
+    eventSource.onerror = (error) => {
+      // 연결이 끊기면 브라우저가 Last-Event-ID로 자동 재연결함
+      if (onError) {
+        onError(error);
+      }
+    };
+
+    return () => eventSource.close();
+  }
+};
+
+export default jobService;
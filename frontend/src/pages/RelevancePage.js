@@ -88,7 +88,7 @@ const RelevancePage = () => {
   // 파일 목록 로드
   const loadFiles = async () => {
     try {
-      const fileList = await crawlerService.getFiles();
+      const { files: fileList } = await crawlerService.getFiles();
       // 평가되지 않은 파일만 필터링
       const unevaluatedFiles = fileList.filter(file => !file.has_evaluation && !file.is_evaluated);
       setFiles(unevaluatedFiles);
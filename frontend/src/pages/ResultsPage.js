@@ -56,6 +56,7 @@ const ResultsPage = () => {
   
   // 상태 관리
   const [files, setFiles] = useState([]);
+  const [totalFiles, setTotalFiles] = useState(0);
   const [selectedFile, setSelectedFile] = useState(null);
   const [filePreview, setFilePreview] = useState(null);
   const [fileStats, setFileStats] = useState(null);
@@ -89,8 +90,9 @@ const ResultsPage = () => {
   const loadFiles = async () => {
     setLoading(true);
     try {
-      const fileList = await crawlerService.getFiles();
+      const { files: fileList, total } = await crawlerService.getFiles();
       setFiles(fileList);
+      setTotalFiles(total);
       
       // 평가된 파일이 있으면 첫 번째 파일 선택
       const evaluatedFiles = fileList.filter(file => file.has_evaluation || file.is_evaluated);
@@ -293,7 +295,7 @@ const ResultsPage = () => {
                 
                 <Box sx={{ mt: 2, display: 'flex', justifyContent: 'space-between', alignItems: 'center' }}>
                   <Typography variant="body2" color="text.secondary">
-                    총 {files.length}개 파일
+                    총 {totalFiles}개 파일
                   </Typography>
                   
                   <Box>